@@ -5,21 +5,26 @@ data analysis that combines the interactive capabilities of EEGLAB with
 the robust data structures and analysis methods of MNE-Python.
 """
 
+import importlib
+from typing import Any, List
+
 try:
     from ._version import version as __version__
 except ImportError:
     __version__ = "0.1.0-dev"
 
-# Core imports
-from .core.data_manager import DataManager
-from .core.session_manager import SessionManager
-from .core.event_system import EventSystem
-
-# Main application
-from .main import PyMNEStudioIDE
-
-# Utility imports
-from .utils import logger
+# Public symbols are resolved lazily (PEP 562) so that ``import quicklab`` and
+# ``pymne-studio --help`` do not pay for importing PyQt6 and MNE up front.
+_LAZY = {
+    # Core imports
+    "DataManager": ("quicklab.core.data_manager", "DataManager"),
+    "SessionManager": ("quicklab.core.session_manager", "SessionManager"),
+    "EventSystem": ("quicklab.core.event_system", "EventSystem"),
+    # Main application
+    "PyMNEStudioIDE": ("quicklab.main", "PyMNEStudioIDE"),
+    # Utility imports
+    "logger": ("quicklab.utils", "logger"),
+}
 
 __all__ = [
     "__version__",
@@ -28,4 +33,21 @@ __all__ = [
     "EventSystem",
     "PyMNEStudioIDE",
     "logger",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public symbols on first access."""
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List eager and lazily imported public symbols."""
+    return sorted(set(globals()) | set(_LAZY))
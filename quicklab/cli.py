@@ -2,26 +2,34 @@
 
 import sys
 import argparse
-from pathlib import Path
+from typing import List, Optional
 
-from .main import main as main_gui
 from .utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_VERSION = "PyMNE Studio 0.1.0"
+_DESCRIPTION = "PyMNE Studio: Advanced EEG/MEG Analysis IDE for MNE-Python"
 
-def main() -> int:
-    """Main CLI entry point for PyMNE Studio.
+
+def _make_parser(prog: str, description: str, version: str) -> argparse.ArgumentParser:
+    """Build the argument parser shared by all entry points.
+    
+    Parameters
+    ----------
+    prog : str
+        Program name shown in usage messages.
+    description : str
+        Description shown in the help text.
+    version : str
+        Version string reported by ``--version``.
     
     Returns
     -------
-    int
-        Exit code.
+    argparse.ArgumentParser
+        The configured parser.
     """
-    parser = argparse.ArgumentParser(
-        description="PyMNE Studio: Advanced EEG/MEG Analysis IDE for MNE-Python",
-        prog="pymne-studio"
-    )
+    parser = argparse.ArgumentParser(description=description, prog=prog)
     
     parser.add_argument(
         "data_file",
@@ -32,7 +40,7 @@ def main() -> int:
     parser.add_argument(
         "--version",
         action="version",
-        version="PyMNE Studio 0.1.0"
+        version=version
     )
     
     parser.add_argument(
@@ -41,21 +49,80 @@ def main() -> int:
         help="Enable debug logging"
     )
     
+    parser.add_argument(
+        "--no-restore-layout",
+        action="store_true",
+        help="Start with the default window layout instead of the saved one"
+    )
+    
     parser.add_argument(
         "--no-gui",
         action="store_true",
         help="Run without GUI (batch mode - not yet implemented)"
     )
     
-    args = parser.parse_args()
+    return parser
+
+
+def _run(prog: str, argv: Optional[List[str]] = None) -> int:
+    """Parse arguments and run PyMNE Studio.
+    
+    Parameters
+    ----------
+    prog : str
+        Name of the entry point that was invoked.
+    argv : list of str, optional
+        Command line arguments. Defaults to ``sys.argv[1:]``.
+    
+    Returns
+    -------
+    int
+        Exit code.
+    """
+    parser = _make_parser(prog, _DESCRIPTION, _VERSION)
+    args = parser.parse_args(argv)
     
     if args.no_gui:
         print("Batch mode not yet implemented")
         return 1
     
-    # Run GUI application
-    return main_gui()
+    # Run GUI application (imported here so --help/--version stay Qt-free)
+    from .main import run_gui
+    return run_gui(data_file=args.data_file, debug=args.debug,
+                   restore_layout=not args.no_restore_layout)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main CLI entry point for PyMNE Studio (``pymne-studio``).
+    
+    Parameters
+    ----------
+    argv : list of str, optional
+        Command line arguments. Defaults to ``sys.argv[1:]``.
+    
+    Returns
+    -------
+    int
+        Exit code.
+    """
+    return _run("pymne-studio", argv)
+
+
+def main_gui(argv: Optional[List[str]] = None) -> int:
+    """GUI entry point for PyMNE Studio (``pymne-studio-gui``).
+    
+    Parameters
+    ----------
+    argv : list of str, optional
+        Command line arguments. Defaults to ``sys.argv[1:]``.
+    
+    Returns
+    -------
+    int
+        Exit code.
+    """
+    return _run("pymne-studio-gui", argv)
 
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
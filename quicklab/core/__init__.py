@@ -1,13 +1,39 @@
 """Core QuickLab modules for data management and system architecture."""
 
-from .data_manager import DataManager
-from .session_manager import SessionManager
-from .event_system import EventSystem
-from .pipeline_manager import PipelineManager
+import importlib
+from typing import Any, List
+
+# Resolved lazily (PEP 562) so importing one core module does not drag in
+# the others and their heavy dependencies.
+_LAZY = {
+    "DataManager": ("quicklab.core.data_manager", "DataManager"),
+    "DataKind": ("quicklab.core.data_manager", "DataKind"),
+    "SessionManager": ("quicklab.core.session_manager", "SessionManager"),
+    "EventSystem": ("quicklab.core.event_system", "EventSystem"),
+    "PipelineManager": ("quicklab.core.pipeline_manager", "PipelineManager"),
+}
 
 __all__ = [
     "DataManager",
+    "DataKind",
     "SessionManager", 
     "EventSystem",
     "PipelineManager",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import core classes on first access."""
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List lazily imported core classes."""
+    return sorted(set(globals()) | set(_LAZY))
@@ -2,63 +2,535 @@
 
 This module handles loading, saving, and managing MNE-Python data objects
 throughout the application lifecycle.
+
+The data handling logic lives in the Qt-free ``_DataManagerCore`` so that
+headless code paths (batch mode, tests) can use it without loading Qt. The
+public ``DataManager`` adds Qt signals on top of it and is built on first
+access through the module-level ``__getattr__`` (PEP 562).
 """
 
 import os
+import re
+import copy
+import sys
 import logging
-from typing import Dict, List, Optional, Union, Any, Tuple
+import tempfile
+import threading
+import weakref
+import zlib
+from array import array
+from numbers import Integral
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from enum import IntEnum
+from types import MappingProxyType
+from typing import Deque, Dict, List, Mapping, Optional, Union, Any, Tuple, Callable
 from pathlib import Path
 
-import mne
-import numpy as np
-from PyQt6.QtCore import QObject, pyqtSignal
-
 from ..utils.logger import get_logger
-from ..utils.error_handler import error_boundary, safe_execute, get_error_handler
 
 logger = get_logger(__name__)
 
 
-class DataManager(QObject):
-    """Manages MNE data objects and their metadata throughout the application.
+class DataKind(IntEnum):
+    """Kind of MNE data object held by the DataManager."""
+    
+    UNKNOWN = 0
+    RAW = 1
+    EPOCHS = 2
+    EVOKED = 3
+
+
+def _infer_data_kind(data_obj: Any) -> DataKind:
+    """Classify a data object.
     
-    The DataManager serves as the central hub for all data operations in QuickLab,
-    handling loading, saving, and tracking of MNE data objects (Raw, Epochs, Evoked, etc.).
-    It provides signals for data change notifications and maintains data provenance.
+    Parameters
+    ----------
+    data_obj : Any
+        The data object, or a list of them as returned by ``mne.read_evokeds``.
     
-    Signals
+    Returns
     -------
-    data_loaded : str, object
-        Emitted when new data is loaded (data_id, data_object)
-    data_changed : str, object
-        Emitted when existing data is modified (data_id, data_object)
-    data_removed : str
-        Emitted when data is removed (data_id)
-    active_data_changed : str
-        Emitted when the active data selection changes (data_id)
+    DataKind
+        The kind of data, or ``DataKind.UNKNOWN`` if it is not MNE data.
     """
+    # Objects can only be MNE data if MNE has already been imported
+    mne = sys.modules.get('mne')
+    if mne is None:
+        return DataKind.UNKNOWN
+    
+    if isinstance(data_obj, list):
+        if data_obj and all(isinstance(item, mne.Evoked) for item in data_obj):
+            return DataKind.EVOKED
+        return DataKind.UNKNOWN
+    if isinstance(data_obj, mne.io.BaseRaw):
+        return DataKind.RAW
+    if isinstance(data_obj, mne.BaseEpochs):
+        return DataKind.EPOCHS
+    if isinstance(data_obj, mne.Evoked):
+        return DataKind.EVOKED
+    return DataKind.UNKNOWN
+
+
+# MNE naming conventions for epochs (-epo.fif) and evoked (-ave.fif) files
+_FIF_KIND_RE = re.compile(r'(?:^|[-_])(epo|ave)\.fif$', re.IGNORECASE)
+
+
+def _fif_kind(filename: str) -> Optional[str]:
+    """Return 'epo' or 'ave' for epochs/evoked FIF file names, else None."""
+    match = _FIF_KIND_RE.search(filename)
+    return match.group(1).lower() if match else None
+
+
+def _read_fif(file_path: Path, preload: Union[bool, str]) -> Any:
+    """Read a FIF file as raw, epochs or evoked data based on its name."""
+    import mne
+    
+    kind = _fif_kind(file_path.name)
+    if kind == 'epo':
+        return mne.read_epochs(file_path, preload=preload)
+    if kind == 'ave':
+        return mne.read_evokeds(file_path)
+    return mne.io.read_raw_fif(file_path, preload=preload)
+
+
+# Reader functions keyed by file suffix. Built on first use.
+_READERS: Optional[Dict[str, Callable[..., Any]]] = None
+
+
+def _get_readers() -> Dict[str, Callable[..., Any]]:
+    """Return the reader dispatch table, importing MNE on first call.
+    
+    MNE is imported on first load rather than at module import; it pulls in
+    SciPy/matplotlib and dominates startup otherwise.
+    
+    Returns
+    -------
+    dict
+        Mapping of lower-case file suffix to MNE reader function.
+    """
+    global _READERS
+    if _READERS is None:
+        import mne
+        
+        readers = {
+            '.fif': _read_fif,
+            '.edf': mne.io.read_raw_edf,
+            '.bdf': mne.io.read_raw_bdf,
+            '.gdf': mne.io.read_raw_gdf,
+            '.set': mne.io.read_raw_eeglab,
+            '.cnt': mne.io.read_raw_cnt,
+            '.vhdr': mne.io.read_raw_brainvision,
+        }
+        # Interned keys let lookups with interned suffixes compare by identity
+        _READERS = {sys.intern(key): reader for key, reader in readers.items()}
+    return _READERS
+
+
+# Sentinel for single-lookup ``dict.get`` calls on the data store
+_MISSING = object()
+
+
+class _EvictedData:
+    """Placeholder for a data object evicted to disk by the memory cap.
+    
+    Keeps the object's ``info`` and ``n_times`` so metadata queries do not
+    need to reload it.
+    
+    Parameters
+    ----------
+    file_path : Path
+        File to reload the data from.
+    info : Any
+        The evicted object's measurement info.
+    n_times : int or None
+        The evicted object's number of time points, if any.
+    spilled : bool
+        Whether ``file_path`` is a temporary file written on eviction.
+    """
+    
+    __slots__ = ('file_path', 'info', 'n_times', 'spilled')
+    
+    def __init__(self, file_path: Path, info: Any, n_times: Optional[int],
+                 spilled: bool) -> None:
+        self.file_path = file_path
+        self.info = info
+        self.n_times = n_times
+        self.spilled = spilled
+
+
+def _data_nbytes(data_obj: Any) -> int:
+    """Return the size of the in-memory sample array of a data object.
+    
+    Parameters
+    ----------
+    data_obj : Any
+        The MNE data object.
+    
+    Returns
+    -------
+    int
+        Size in bytes of the preloaded data, or 0 if not preloaded.
+    """
+    if isinstance(data_obj, list):
+        return sum(_data_nbytes(item) for item in data_obj)
+    data = getattr(data_obj, '_data', None)
+    # Memory-mapped arrays (np.memmap has a filename) live on disk
+    if isinstance(getattr(data, 'filename', None), str):
+        return 0
+    return getattr(data, 'nbytes', 0)
+
+
+def _sample_checksum(data_obj: Any) -> Optional[int]:
+    """Return an Adler-32 checksum of a data object's in-memory samples.
+    
+    Parameters
+    ----------
+    data_obj : Any
+        The MNE data object.
+    
+    Returns
+    -------
+    int or None
+        The checksum, or None if the samples are not held in memory (e.g.
+        raw data read from disk on access).
+    """
+    samples = getattr(data_obj, '_data', None)
+    if not getattr(data_obj, 'preload', True) or not hasattr(samples, '__array_interface__'):
+        return None
+    if not samples.flags.c_contiguous:
+        samples = samples.copy()
+    return zlib.adler32(memoryview(samples).cast('B'))
+
+
+def _sample_buffer_id(data_obj: Any) -> Optional[int]:
+    """Return the id of the array owning a data object's samples.
+    
+    Views share the id of the array they were made from, so data objects
+    sharing samples (see ``duplicate_data``) are counted once.
+    
+    Parameters
+    ----------
+    data_obj : Any
+        The MNE data object.
+    
+    Returns
+    -------
+    int or None
+        The id of the base array, or None if the samples are not an array.
+    """
+    data = getattr(data_obj, '_data', None)
+    if not hasattr(data, '__array_interface__'):
+        return None
+    while hasattr(data.base, '__array_interface__'):
+        data = data.base
+    return id(data)
+
+
+def _data_shape(data_obj: Any) -> Tuple[int, int]:
+    """Return the number of channels and time points of a data object.
+    
+    Parameters
+    ----------
+    data_obj : Any
+        The MNE data object.
+    
+    Returns
+    -------
+    tuple of int
+        ``(n_channels, n_times)``, with -1 for a count that is unknown.
+    """
+    n_channels = n_times = None
+    raw_info = getattr(data_obj, 'info', None)
+    if isinstance(raw_info, dict):
+        n_channels = dict.get(raw_info, 'nchan')
+        n_times = getattr(data_obj, 'n_times', None)
+    return (
+        int(n_channels) if isinstance(n_channels, Integral) else -1,
+        int(n_times) if isinstance(n_times, Integral) else -1,
+    )
+
+
+class _MetadataStore:
+    """Column-oriented store for per-dataset metadata.
+    
+    Each field is kept in its own list or array, with one row per dataset,
+    so bulk queries scan flat columns instead of one dict per dataset.
+    Removal swaps the last row into the freed slot to keep columns dense,
+    so row order is not load order.
+    
+    Attributes
+    ----------
+    ids : list of str
+        Data identifier of each row.
+    file_paths : list of str
+        Source file path of each row.
+    data_types : list of str
+        Data object class name of each row.
+    kinds : bytearray
+        ``DataKind`` value of each row.
+    loaded_at : array of float
+        Load time of each row as a POSIX timestamp.
+    preload : bytearray
+        Whether each row's data was preloaded.
+    modified : bytearray
+        Whether each row's data has unsaved modifications.
+    n_channels : array of int
+        Number of channels of each row, or -1 if unknown.
+    n_times : array of int
+        Number of time points of each row, or -1 if unknown.
+    histories : list of deque
+        Processing history of each row, keeping the most recent
+        ``history_limit`` entries.
+    
+    Parameters
+    ----------
+    history_limit : int, optional
+        Maximum number of history entries kept per dataset. Default is 200.
+    """
+    
+    def __init__(self, history_limit: int = 200) -> None:
+        self.history_limit = history_limit
+        self._rows: Dict[str, int] = {}
+        self.ids: List[str] = []
+        self.file_paths: List[str] = []
+        self.data_types: List[str] = []
+        self.kinds = bytearray()
+        self.loaded_at = array('d')
+        self.preload = bytearray()
+        self.modified = bytearray()
+        self.n_channels = array('q')
+        self.n_times = array('q')
+        self.histories: List[Deque[Dict[str, Any]]] = []
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def __contains__(self, data_id: object) -> bool:
+        return data_id in self._rows
     
-    # Qt signals for data change notifications
-    data_loaded = pyqtSignal(str, object)
-    data_changed = pyqtSignal(str, object)
-    data_removed = pyqtSignal(str)
-    active_data_changed = pyqtSignal(str)
+    def row(self, data_id: str) -> int:
+        """Return the row index of a dataset.
+        
+        Raises
+        ------
+        KeyError
+            If data_id is not found.
+        """
+        return self._rows[data_id]
+    
+    def add(self, data_id: str, file_path: str, data_type: str,
+            preload: bool, loaded_at: Optional[datetime] = None,
+            kind: DataKind = DataKind.UNKNOWN,
+            shape: Tuple[int, int] = (-1, -1)) -> None:
+        """Add a row, replacing any existing row for the same dataset.
+        
+        Parameters
+        ----------
+        data_id : str
+            The data identifier.
+        file_path : str
+            Path the data was loaded from.
+        data_type : str
+            Class name of the data object.
+        preload : bool
+            Whether the data was preloaded into memory.
+        loaded_at : datetime, optional
+            Load time. Defaults to now.
+        kind : DataKind, optional
+            Kind of the data object. Default is ``DataKind.UNKNOWN``.
+        shape : tuple of int, optional
+            Number of channels and time points, -1 if unknown. Default is
+            ``(-1, -1)``.
+        """
+        self.remove(data_id)
+        if loaded_at is None:
+            loaded_at = datetime.now(timezone.utc)
+        
+        self._rows[data_id] = len(self.ids)
+        self.ids.append(data_id)
+        self.file_paths.append(file_path)
+        self.data_types.append(data_type)
+        self.kinds.append(kind)
+        self.loaded_at.append(loaded_at.timestamp())
+        self.preload.append(bool(preload))
+        self.modified.append(False)
+        self.n_channels.append(shape[0])
+        self.n_times.append(shape[1])
+        self.histories.append(deque(maxlen=self.history_limit))
+    
+    def remove(self, data_id: str) -> bool:
+        """Remove a row by moving the last row into its place.
+        
+        Parameters
+        ----------
+        data_id : str
+            The data identifier.
+        
+        Returns
+        -------
+        bool
+            True if a row was removed.
+        """
+        row = self._rows.pop(data_id, None)
+        if row is None:
+            return False
+        
+        last = len(self.ids) - 1
+        for column in (self.ids, self.file_paths, self.data_types, self.kinds,
+                       self.loaded_at, self.preload, self.modified,
+                       self.n_channels, self.n_times, self.histories):
+            column[row] = column[last]
+            del column[last]
+        
+        if row != last:
+            self._rows[self.ids[row]] = row
+        return True
+    
+    def clear(self) -> None:
+        """Remove all rows."""
+        self._rows.clear()
+        for column in (self.ids, self.file_paths, self.data_types, self.kinds,
+                       self.loaded_at, self.preload, self.modified,
+                       self.n_channels, self.n_times, self.histories):
+            del column[:]
+    
+    def record(self, data_id: str) -> Dict[str, Any]:
+        """Return the metadata of a dataset as a new dict.
+        
+        Parameters
+        ----------
+        data_id : str
+            The data identifier.
+        
+        Returns
+        -------
+        dict
+            The file_path, data_type, kind, loaded_at, preload, modified
+            and history fields of the dataset.
+        
+        Raises
+        ------
+        KeyError
+            If data_id is not found.
+        """
+        row = self._rows[data_id]
+        return {
+            'file_path': self.file_paths[row],
+            'data_type': self.data_types[row],
+            'kind': DataKind(self.kinds[row]),
+            'loaded_at': datetime.fromtimestamp(self.loaded_at[row], timezone.utc),
+            'preload': bool(self.preload[row]),
+            'modified': bool(self.modified[row]),
+            'history': self.histories[row],
+        }
+    
+    def find_modified(self, loaded_after: Optional[datetime] = None) -> List[str]:
+        """Return the IDs of datasets with unsaved modifications.
+        
+        Parameters
+        ----------
+        loaded_after : datetime, optional
+            Only include datasets loaded after this time.
+        
+        Returns
+        -------
+        list of str
+            The matching data identifiers.
+        """
+        ids = self.ids
+        if loaded_after is None:
+            return [ids[row] for row, flag in enumerate(self.modified) if flag]
+        
+        cutoff = loaded_after.timestamp()
+        return [
+            ids[row]
+            for row, (flag, ts) in enumerate(zip(self.modified, self.loaded_at))
+            if flag and ts > cutoff
+        ]
+
+
+class _DataManagerCore:
+    """Qt-free implementation of the DataManager.
+    
+    Holds all data handling logic. Change notifications are routed through
+    ``_emit`` and errors through ``_report_error``; both only log here and
+    are wired to Qt signals and the application error handler by
+    ``DataManager``.
+    """
     
     def __init__(self) -> None:
         """Initialize the DataManager."""
         super().__init__()
         self._data_objects: Dict[str, Any] = {}
-        self._data_metadata: Dict[str, Dict[str, Any]] = {}
+        # Access order for the memory cap, least recently used first. Kept
+        # apart from _data_objects so get_data_list keeps load order.
+        self._access_order: "OrderedDict[str, None]" = OrderedDict()
+        self._data_nbytes: Dict[str, int] = {}
+        self._total_nbytes: int = 0
+        # Sample arrays shared by several datasets are counted once: the
+        # base array id per dataset, and per id the number of datasets using
+        # it and the bytes counted for it
+        self._data_buffers: Dict[str, int] = {}
+        self._buffer_users: Dict[int, List[int]] = {}
+        # Upper bound on preloaded sample data kept in memory; least recently
+        # used datasets are evicted to disk above it. None disables the cap.
+        self.max_bytes: Optional[int] = None
+        self._data_metadata = _MetadataStore()
+        # get_data_info results, invalidated whenever a dataset changes
+        self._info_cache: Dict[str, Mapping[str, Any]] = {}
+        # Temporary files backing memory-mapped raw data, by data ID
+        self._mmap_files: Dict[str, Path] = {}
         self._active_data_id: Optional[str] = None
-        self._data_counter: int = 0
+        # Next suffix to try for each file stem, so repeated loads of the same
+        # name do not re-probe every earlier ID. Never reset, so an ID is not
+        # reused for different data after removal.
+        self._basename_counters: Dict[str, int] = {}
+        self._id_lock = threading.Lock()
+        # Files larger than this are opened with preload=False so samples are
+        # read from disk on access; None disables the check
+        self.mmap_threshold_bytes: Optional[int] = 500 * 1024 * 1024
+        # Datasets known to match a file, keyed by (path, mtime_ns, size), as
+        # (weak reference, data ID, sample checksum). Loading that file again
+        # copies the dataset instead of re-reading it while it is loaded and
+        # its samples still match the checksum; MNE changes data in place,
+        # so the modified flag alone cannot tell.
+        self._reader_cache: Dict[Tuple[str, int, int],
+                                 Tuple["weakref.ref[Any]", str, Optional[int]]] = {}
         
         logger.info("DataManager initialized")
     
-    @error_boundary("DataManager", show_dialog=False)
-    def load_data(self, 
+    def _emit(self, signal_name: str, *args: Any) -> None:
+        """Notify listeners of a data change.
+        
+        Parameters
+        ----------
+        signal_name : str
+            Name of the notification (matches the Qt signal name).
+        *args
+            Notification payload.
+        """
+    
+    def _report_error(self, module_name: str, error: Exception, context: str = "") -> None:
+        """Report an error that is about to be re-raised.
+        
+        Parameters
+        ----------
+        module_name : str
+            Name of the module where the error occurred.
+        error : Exception
+            The exception that occurred.
+        context : str, optional
+            Additional context about the error.
+        """
+        logger.debug(f"Error in {module_name} ({context}): {error}")
+    
+    def load_data(self,
                   file_path: Union[str, Path],
                   data_id: Optional[str] = None,
-                  preload: bool = True) -> str:
+                  preload: bool = False,
+                  mmap: bool = False) -> str:
         """Load neurophysiological data from file.
         
         Parameters
@@ -68,13 +540,20 @@ class DataManager(QObject):
         data_id : str, optional
             Unique identifier for the data. If None, will be auto-generated.
         preload : bool, optional
-            Whether to preload data into memory. Default is True.
-            
+            Whether to preload data into memory. Default is False, in which
+            case samples are read from disk on access until
+            ``ensure_preloaded`` is called. Files larger than
+            ``mmap_threshold_bytes`` are never preloaded.
+        mmap : bool, optional
+            Whether to load raw data into a memory-mapped temporary file
+            instead of RAM. Ignored for epochs and evoked files. Default is
+            False.
+        
         Returns
         -------
         str
             The data identifier for the loaded data.
-            
+        
         Raises
         ------
         ValueError
@@ -82,125 +561,428 @@ class DataManager(QObject):
         RuntimeError
             If data loading fails.
         """
-        file_path = Path(file_path)
-        error_handler = get_error_handler()
+        file_path, data_id = self._prepare_load(file_path, data_id)
+        preload = self._resolve_preload(file_path, preload)
+        if mmap:
+            preload = self._memmap_target(data_id, file_path)
         
-        if not file_path.exists():
+        try:
+            data_obj = self._cached_read(file_path, preload)
+            if data_obj is None:
+                # Determine file type and load accordingly
+                data_obj = self._load_data_by_extension(file_path, preload)
+            self._register_data(data_id, file_path, data_obj, preload)
+            return data_id
+        
+        except FileNotFoundError as e:
+            self._discard_mmap(data_id)
             error_msg = f"File does not exist: {file_path}"
             logger.error(error_msg)
-            raise ValueError(error_msg)
+            raise ValueError(error_msg) from e
+        
+        except Exception as e:
+            self._discard_mmap(data_id)
+            error_msg = f"Failed to load data from {file_path}: {e}"
+            logger.error(error_msg)
+            self._report_error("DataManager", e, f"Loading {file_path}")
+            raise RuntimeError(error_msg) from e
+    
+    def load_many(self,
+                  file_paths: List[Union[str, Path]],
+                  preload: bool = False,
+                  max_workers: Optional[int] = None) -> List[str]:
+        """Load several data files, reading them in parallel.
+        
+        Files are read on a thread pool (MNE readers spend most of their time
+        in I/O and NumPy, which release the GIL). The data is registered and
+        notifications are emitted on the calling thread, in the order of
+        ``file_paths``. Files that fail to load are reported and skipped.
+        
+        Parameters
+        ----------
+        file_paths : list of str or Path
+            Paths to the data files to load.
+        preload : bool, optional
+            Whether to preload data into memory. Default is False. Files larger
+            than ``mmap_threshold_bytes`` are never preloaded.
+        max_workers : int, optional
+            Maximum number of reader threads. Defaults to
+            ``min(8, len(file_paths))``.
+        
+        Returns
+        -------
+        list of str
+            The data identifiers of the files that were loaded.
+        """
+        if not file_paths:
+            return []
+        
+        jobs = []
+        for file_path in file_paths:
+            file_path, data_id = self._prepare_load(file_path, None)
+            try:
+                file_preload = self._resolve_preload(file_path, preload)
+            except ValueError as e:
+                self._report_error("DataManager", e, f"Loading {file_path}")
+                continue
+            jobs.append((data_id, file_path, file_preload,
+                         self._cached_read(file_path, file_preload)))
+        
+        # The reader raises without reporting, so every failure is reported
+        # once, here on the calling thread
+        loaded = []
+        with ThreadPoolExecutor(max_workers=max_workers or min(8, len(jobs) or 1)) as executor:
+            futures = [
+                executor.submit(self._load_data_by_extension, file_path, file_preload)
+                if cached is None else None
+                for _, file_path, file_preload, cached in jobs
+            ]
+            for (data_id, file_path, file_preload, cached), future in zip(jobs, futures):
+                try:
+                    data_obj = cached if future is None else future.result()
+                    self._register_data(data_id, file_path, data_obj, file_preload)
+                except Exception as e:
+                    logger.error(f"Failed to load data from {file_path}: {e}")
+                    self._report_error("DataManager", e, f"Loading {file_path}")
+                    continue
+                loaded.append(data_id)
+        
+        logger.info(f"Loaded {len(loaded)} of {len(file_paths)} files")
+        return loaded
+    
+    def add_data(self, data_obj: Any, data_id: Optional[str] = None,
+                 file_path: Optional[Union[str, Path]] = None) -> str:
+        """Add an in-memory data object.
+        
+        Parameters
+        ----------
+        data_obj : Any
+            The MNE data object to add.
+        data_id : str, optional
+            Unique identifier for the data. If None, will be auto-generated
+            from ``file_path`` or the type of ``data_obj``.
+        file_path : str or Path, optional
+            File the data originates from, recorded in its metadata. The data
+            is marked as modified, as it is not read from this file.
+        
+        Returns
+        -------
+        str
+            The data identifier for the added data.
+        """
+        if file_path is not None:
+            file_path = Path(file_path)
+        if data_id is None:
+            data_id = self._generate_data_id(
+                file_path.name if file_path is not None else type(data_obj).__name__
+            )
+        
+        self._register_data(data_id, file_path, data_obj,
+                            getattr(data_obj, 'preload', True), matches_file=False)
+        return data_id
+    
+    def _prepare_load(self, file_path: Union[str, Path],
+                      data_id: Optional[str]) -> Tuple[Path, str]:
+        """Normalize a file path and allocate its data ID.
+        
+        Parameters
+        ----------
+        file_path : str or Path
+            Path to the data file to load.
+        data_id : str, optional
+            Unique identifier for the data. If None, will be auto-generated.
+        
+        Returns
+        -------
+        tuple of (Path, str)
+            The normalized file path and the data identifier.
+        """
+        file_path = Path(file_path)
         
         if data_id is None:
             data_id = self._generate_data_id(file_path.name)
         
+        return file_path, data_id
+    
+    def _resolve_preload(self, file_path: Path, preload: bool) -> bool:
+        """Decide whether a file should be preloaded.
+        
+        Parameters
+        ----------
+        file_path : Path
+            Path to the data file.
+        preload : bool
+            The requested preload setting.
+        
+        Returns
+        -------
+        bool
+            False if the file exceeds ``mmap_threshold_bytes``, else ``preload``.
+        
+        Raises
+        ------
+        ValueError
+            If the file doesn't exist.
+        """
+        # This stat doubles as the existence check
         try:
-            # Determine file type and load accordingly
-            data_obj = safe_execute(
-                self._load_data_by_extension, file_path, preload,
-                error_handler=error_handler,
-                module_name="DataManager",
-                context=f"Loading {file_path.suffix} file"
+            size = file_path.stat().st_size
+        except FileNotFoundError as e:
+            error_msg = f"File does not exist: {file_path}"
+            logger.error(error_msg)
+            raise ValueError(error_msg) from e
+        
+        if not preload or self.mmap_threshold_bytes is None:
+            return preload
+        
+        if size > self.mmap_threshold_bytes:
+            logger.warning(
+                f"{file_path.name} is {size / 1024 ** 2:.0f} MB; loading without "
+                f"preload (data is read from disk on access)"
             )
+            return False
+        return preload
+    
+    def _memmap_target(self, data_id: str, file_path: Path) -> Union[bool, str]:
+        """Create the file MNE memory-maps raw data into.
+        
+        MNE readers accept a file name as ``preload`` and store the data in
+        a memory-mapped array backed by that file. FIF files store samples
+        in separate buffers, so they cannot be mapped in place.
+        
+        Parameters
+        ----------
+        data_id : str
+            Identifier the data will be stored under.
+        file_path : Path
+            Path to the data file.
+        
+        Returns
+        -------
+        bool or str
+            Path of the temporary file, or True for non-raw files.
+        """
+        if _fif_kind(file_path.name) is not None:
+            logger.warning(f"Memory mapping is only supported for raw data; "
+                           f"preloading {file_path.name}")
+            return True
+        
+        fd, tmp_name = tempfile.mkstemp(prefix='quicklab_', suffix='.dat')
+        os.close(fd)
+        self._mmap_files[data_id] = Path(tmp_name)
+        return tmp_name
+    
+    def _discard_mmap(self, data_id: str) -> None:
+        """Delete the memory-map file of a dataset, if any."""
+        mmap_file = self._mmap_files.pop(data_id, None)
+        if mmap_file is not None:
+            self._remove_temp_file(mmap_file)
+    
+    def _register_data(self, data_id: str, file_path: Optional[Path],
+                       data_obj: Any, preload: Union[bool, str],
+                       matches_file: bool = True,
+                       reusable: bool = True) -> None:
+        """Store a loaded data object and notify listeners.
+        
+        Parameters
+        ----------
+        data_id : str
+            Identifier to store the data under.
+        file_path : Path or None
+            Path the data was loaded from, if any.
+        data_obj : Any
+            The loaded MNE data object.
+        preload : bool or str
+            Whether the data was preloaded, or the memory-map file it was
+            loaded into.
+        matches_file : bool, optional
+            Whether ``data_obj`` holds the current contents of ``file_path``.
+            If True, loading that file again may reuse it; if False, the data
+            is marked as modified, so it is never reloaded from the file.
+            Default is True.
+        reusable : bool, optional
+            Whether loading ``file_path`` again may copy ``data_obj`` instead
+            of reading the file. Only used if ``matches_file`` is True.
+            Default is True.
+        """
+        # Store data and metadata with error handling
+        try:
+            self._data_objects[data_id] = data_obj
+            self._track_nbytes(data_id, data_obj)
+            self._data_metadata.add(
+                data_id, str(file_path) if file_path is not None else '',
+                type(data_obj).__name__, bool(preload),
+                kind=_infer_data_kind(data_obj), shape=_data_shape(data_obj)
+            )
+            self._info_cache.pop(data_id, None)
+            if not matches_file:
+                self._data_metadata.modified[self._data_metadata.row(data_id)] = True
+            elif reusable and file_path is not None and not isinstance(preload, str):
+                self._remember_file(file_path, data_id, data_obj)
             
-            if data_obj is None:
-                raise RuntimeError(f"Failed to load data from {file_path}")
+            # Set as active if it's the first data loaded
+            if self._active_data_id is None:
+                self._active_data_id = data_id
+                self._emit("active_data_changed", data_id)
             
-            # Store data and metadata with error handling
-            try:
-                self._data_objects[data_id] = data_obj
-                self._data_metadata[data_id] = {
-                    'file_path': str(file_path),
-                    'data_type': type(data_obj).__name__,
-                    'loaded_at': np.datetime64('now'),
-                    'preload': preload,
-                    'modified': False,
-                    'history': []
-                }
-                
-                # Set as active if it's the first data loaded
-                if self._active_data_id is None:
-                    self._active_data_id = data_id
-                    safe_execute(
-                        self.active_data_changed.emit, data_id,
-                        error_handler=error_handler,
-                        module_name="DataManager",
-                        context="Emitting active data changed signal"
-                    )
-                
-                logger.info(f"Loaded {type(data_obj).__name__} data: {data_id}")
-                
-                # Emit signal safely
-                safe_execute(
-                    self.data_loaded.emit, data_id, data_obj,
-                    error_handler=error_handler,
-                    module_name="DataManager",
-                    context="Emitting data loaded signal"
-                )
-                
-                return data_id
-                
-            except Exception as metadata_error:
-                # Clean up if metadata storage fails
-                if data_id in self._data_objects:
-                    del self._data_objects[data_id]
-                if data_id in self._data_metadata:
-                    del self._data_metadata[data_id]
-                raise RuntimeError(f"Failed to store data metadata: {metadata_error}")
+            logger.info(f"Loaded {type(data_obj).__name__} data: {data_id}")
             
+            self._emit("data_loaded", data_id, data_obj)
+            self._enforce_memory_cap(keep=data_id)
+        
+        except Exception as metadata_error:
+            # Clean up if metadata storage fails
+            if data_id in self._data_objects:
+                del self._data_objects[data_id]
+            self._untrack(data_id)
+            self._data_metadata.remove(data_id)
+            raise RuntimeError(f"Failed to store data metadata: {metadata_error}")
+    
+    @staticmethod
+    def _file_key(file_path: Path) -> Optional[Tuple[str, int, int]]:
+        """Return the reader cache key of a file, or None if it is missing."""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        return os.path.abspath(file_path), st.st_mtime_ns, st.st_size
+    
+    def _remember_file(self, file_path: Path, data_id: str, data_obj: Any) -> None:
+        """Record that a dataset holds the current contents of a file."""
+        key = self._file_key(file_path)
+        if key is None:
+            return
+        
+        cache = self._reader_cache
+        
+        def drop(ref: "weakref.ref[Any]") -> None:
+            # Forget the file once the dataset is garbage collected
+            if cache.get(key, (None,))[0] is ref:
+                del cache[key]
+        
+        try:
+            cache[key] = (weakref.ref(data_obj, drop), data_id, _sample_checksum(data_obj))
+        except TypeError:
+            pass  # Object does not support weak references
+    
+    def _cached_read(self, file_path: Path, preload: Union[bool, str]) -> Optional[Any]:
+        """Copy a loaded dataset instead of reading its file again.
+        
+        Parameters
+        ----------
+        file_path : Path
+            Path to the data file.
+        preload : bool or str
+            Whether to preload data into memory, or the file to memory-map
+            raw data into.
+        
+        Returns
+        -------
+        Any or None
+            A copy of the dataset last loaded from or saved to the unchanged
+            file, or None if there is no such dataset or it has been modified
+            or removed since. Also None if ``preload`` is False but the
+            dataset is preloaded, as reading the file lazily is cheaper.
+        """
+        if isinstance(preload, str) or not self._reader_cache:
+            return None
+        key = self._file_key(file_path)
+        data_obj = self._file_source(key)
+        if data_obj is None:
+            return None
+        if not preload and getattr(data_obj, 'preload', False):
+            return None
+        source_id = self._reader_cache[key][1]
+        
+        try:
+            data_obj = data_obj.copy()
+            if preload and not getattr(data_obj, 'preload', True):
+                data_obj.load_data()
         except Exception as e:
-            error_msg = f"Failed to load data from {file_path}: {e}"
-            logger.error(error_msg)
-            error_handler.handle_module_error("DataManager", e, f"Loading {file_path}")
-            raise RuntimeError(error_msg) from e
+            logger.debug(f"Could not reuse {source_id} for {file_path}: {e}")
+            return None
+        
+        logger.info(f"Reused loaded data {source_id} for {file_path.name}")
+        return data_obj
+    
+    def _file_source(self, key: Optional[Tuple[str, int, int]]) -> Optional[Any]:
+        """Return the loaded, unmodified dataset holding a file's contents.
+        
+        The samples are compared against the checksum recorded with the
+        file, which also catches in-place changes. Stale reader cache
+        entries found on the way are dropped.
+        """
+        entry = self._reader_cache.get(key)
+        if entry is None:
+            return None
+        
+        ref, source_id, checksum = entry
+        data_obj = ref()
+        if (data_obj is None or self._data_objects.get(source_id) is not data_obj
+                or self._data_metadata.modified[self._data_metadata.row(source_id)]
+                or _sample_checksum(data_obj) != checksum):
+            del self._reader_cache[key]
+            return None
+        return data_obj
+    
+    def find_source_file(self, data_obj: Any) -> Optional[Path]:
+        """Find the file whose contents a data object holds.
+        
+        Parameters
+        ----------
+        data_obj : Any
+            A data object, as returned by :meth:`get_data`.
+        
+        Returns
+        -------
+        Path or None
+            The file the object was loaded from or last saved to, if the
+            object is still registered and unmodified and the file has not
+            changed since; otherwise None.
+        """
+        for key, (ref, *_) in list(self._reader_cache.items()):
+            if ref() is data_obj:
+                if self._file_key(key[0]) == key and self._file_source(key) is data_obj:
+                    return Path(key[0])
+                return None
+        return None
     
-    @error_boundary("DataManager", show_dialog=False)
-    def _load_data_by_extension(self, file_path: Path, preload: bool) -> Any:
+    def _load_data_by_extension(self, file_path: Path,
+                                preload: Union[bool, str]) -> Any:
         """Load data based on file extension.
         
         Parameters
         ----------
         file_path : Path
             Path to the data file.
-        preload : bool
-            Whether to preload data into memory.
-            
+        preload : bool or str
+            Whether to preload data into memory, or the file to memory-map
+            raw data into.
+        
         Returns
         -------
         Any
             The loaded MNE data object.
+        
+        Notes
+        -----
+        Errors are raised but not reported, as this also runs on reader
+        threads; callers report them once on their own thread.
         """
-        suffix = file_path.suffix.lower()
-        error_handler = get_error_handler()
+        suffix = sys.intern(file_path.suffix.lower())
         
-        # Raw data formats with error handling
         try:
-            if suffix == '.fif':
-                # Check if it's epochs or evoked data first
-                if 'epo' in file_path.name:
-                    return mne.read_epochs(file_path, preload=preload)
-                elif 'ave' in file_path.name:
-                    return mne.read_evokeds(file_path)
-                else:
-                    return mne.io.read_raw_fif(file_path, preload=preload)
-            elif suffix == '.edf':
-                return mne.io.read_raw_edf(file_path, preload=preload)
-            elif suffix == '.bdf':
-                return mne.io.read_raw_bdf(file_path, preload=preload)
-            elif suffix == '.gdf':
-                return mne.io.read_raw_gdf(file_path, preload=preload)
-            elif suffix == '.set':
-                return mne.io.read_raw_eeglab(file_path, preload=preload)
-            elif suffix == '.cnt':
-                return mne.io.read_raw_cnt(file_path, preload=preload)
-            elif suffix == '.vhdr':
-                return mne.io.read_raw_brainvision(file_path, preload=preload)
-            else:
+            reader = _get_readers().get(suffix)
+            if reader is None:
                 raise ValueError(f"Unsupported file format: {suffix}")
-                
+            return reader(file_path, preload=preload)
+        
+        except FileNotFoundError:
+            raise
+        
         except Exception as e:
             error_msg = f"Failed to load {suffix} file: {e}"
             logger.error(error_msg)
-            error_handler.handle_module_error("MNE", e, f"Loading {suffix} file")
             raise RuntimeError(error_msg) from e
     
     def get_data(self, data_id: str) -> Any:
@@ -210,21 +992,56 @@ class DataManager(QObject):
         ----------
         data_id : str
             The data identifier.
-            
+        
         Returns
         -------
         Any
             The MNE data object.
-            
+        
         Raises
         ------
         KeyError
             If data_id is not found.
         """
-        if data_id not in self._data_objects:
+        data_obj = self._data_objects.get(data_id, _MISSING)
+        if data_obj is _MISSING:
             raise KeyError(f"Data ID not found: {data_id}")
         
-        return self._data_objects[data_id]
+        return self._resident_object(data_id, data_obj)
+    
+    def ensure_preloaded(self, data_id: str) -> Any:
+        """Load the samples of a dataset into memory if not done yet.
+        
+        Data is loaded lazily by default; operations that modify samples in
+        place (filtering, resampling, ICA) need it preloaded.
+        
+        Parameters
+        ----------
+        data_id : str
+            The data identifier.
+        
+        Returns
+        -------
+        Any
+            The preloaded MNE data object.
+        
+        Raises
+        ------
+        KeyError
+            If data_id is not found.
+        """
+        data_obj = self.get_data(data_id)
+        
+        if getattr(data_obj, 'preload', True):
+            return data_obj
+        
+        data_obj.load_data()
+        self._data_metadata.preload[self._data_metadata.row(data_id)] = True
+        self._info_cache.pop(data_id, None)
+        self._track_nbytes(data_id, data_obj)
+        logger.info(f"Preloaded data: {data_id}")
+        self._enforce_memory_cap(keep=data_id)
+        return data_obj
     
     def get_active_data(self) -> Tuple[Optional[str], Optional[Any]]:
         """Get the currently active data.
@@ -237,7 +1054,8 @@ class DataManager(QObject):
         if self._active_data_id is None:
             return None, None
         
-        return self._active_data_id, self._data_objects[self._active_data_id]
+        data_id = self._active_data_id
+        return data_id, self._resident_object(data_id, self._data_objects[data_id])
     
     def set_active_data(self, data_id: str) -> None:
         """Set the active data.
@@ -246,7 +1064,7 @@ class DataManager(QObject):
         ----------
         data_id : str
             The data identifier to set as active.
-            
+        
         Raises
         ------
         KeyError
@@ -256,7 +1074,8 @@ class DataManager(QObject):
             raise KeyError(f"Data ID not found: {data_id}")
         
         self._active_data_id = data_id
-        self.active_data_changed.emit(data_id)
+        self._touch(data_id)
+        self._emit("active_data_changed", data_id)
         logger.info(f"Active data changed to: {data_id}")
     
     def get_data_list(self) -> List[str]:
@@ -269,40 +1088,82 @@ class DataManager(QObject):
         """
         return list(self._data_objects.keys())
     
-    def get_data_info(self, data_id: str) -> Dict[str, Any]:
+    def get_data_info(self, data_id: str) -> Mapping[str, Any]:
         """Get metadata for a data object.
         
         Parameters
         ----------
         data_id : str
             The data identifier.
-            
+        
         Returns
         -------
-        dict
-            Dictionary containing data metadata.
-            
+        Mapping
+            Read-only mapping containing data metadata. It is cached and
+            shared between calls until the data changes.
+        
         Raises
         ------
         KeyError
             If data_id is not found.
         """
+        info = self._info_cache.get(data_id)
+        if info is not None:
+            return info
+        
         if data_id not in self._data_metadata:
             raise KeyError(f"Data ID not found: {data_id}")
         
         # Add runtime information
         data_obj = self._data_objects[data_id]
-        info = self._data_metadata[data_id].copy()
+        info = self._data_metadata.record(data_id)
         
-        if hasattr(data_obj, 'info'):
-            info.update({
-                'n_channels': data_obj.info['nchan'],
-                'sampling_rate': data_obj.info['sfreq'],
-                'n_times': getattr(data_obj, 'n_times', None),
-            })
+        raw_info = getattr(data_obj, 'info', None)
+        if isinstance(raw_info, dict):
+            # mne.Info is a dict subclass; dict.get bypasses Info.__getitem__
+            info.update(
+                n_channels=dict.get(raw_info, 'nchan'),
+                sampling_rate=dict.get(raw_info, 'sfreq'),
+                n_times=getattr(data_obj, 'n_times', None),
+            )
         
+        info = MappingProxyType(info)
+        self._info_cache[data_id] = info
         return info
     
+    def get_data_table(self) -> Tuple[List[str], List[str], List[str], List[str]]:
+        """Get the ID, type, channel count and length of all data as columns.
+        
+        Returns
+        -------
+        tuple of list of str
+            ``(ids, data_types, n_channels, n_times)``, one entry per data
+            object in the same order, with counts formatted as text and
+            unknown counts as ``'N/A'``.
+        """
+        store = self._data_metadata
+        return (
+            list(store.ids),
+            list(store.data_types),
+            [str(n) if n >= 0 else 'N/A' for n in store.n_channels],
+            [str(n) if n >= 0 else 'N/A' for n in store.n_times],
+        )
+    
+    def get_modified_data(self, loaded_after: Optional[datetime] = None) -> List[str]:
+        """Get IDs of data with unsaved modifications.
+        
+        Parameters
+        ----------
+        loaded_after : datetime, optional
+            Only include data loaded after this time.
+        
+        Returns
+        -------
+        list
+            List of data identifiers.
+        """
+        return self._data_metadata.find_modified(loaded_after)
+    
     def update_data(self, data_id: str, data_obj: Any, operation: str = "modified") -> None:
         """Update existing data object.
         
@@ -314,24 +1175,89 @@ class DataManager(QObject):
             The updated MNE data object.
         operation : str, optional
             Description of the operation performed. Default is "modified".
-            
+        
         Raises
         ------
         KeyError
             If data_id is not found.
         """
-        if data_id not in self._data_objects:
+        old_obj = self._data_objects.get(data_id, _MISSING)
+        if old_obj is _MISSING:
             raise KeyError(f"Data ID not found: {data_id}")
         
+        self._discard_spill(old_obj)
         self._data_objects[data_id] = data_obj
-        self._data_metadata[data_id]['modified'] = True
-        self._data_metadata[data_id]['history'].append({
+        self._track_nbytes(data_id, data_obj)
+        self._info_cache.pop(data_id, None)
+        row = self._data_metadata.row(data_id)
+        self._data_metadata.data_types[row] = type(data_obj).__name__
+        self._data_metadata.kinds[row] = _infer_data_kind(data_obj)
+        self._data_metadata.modified[row] = True
+        (self._data_metadata.n_channels[row],
+         self._data_metadata.n_times[row]) = _data_shape(data_obj)
+        self._data_metadata.histories[row].append({
             'operation': operation,
-            'timestamp': np.datetime64('now')
+            'timestamp': datetime.now(timezone.utc)
         })
         
         logger.info(f"Updated data: {data_id} ({operation})")
-        self.data_changed.emit(data_id, data_obj)
+        self._emit("data_changed", data_id, data_obj)
+        self._enforce_memory_cap(keep=data_id)
+    
+    def duplicate_data(self, data_id: str, new_id: Optional[str] = None,
+                       share_data: bool = True) -> str:
+        """Register a copy of a data object under a new ID.
+        
+        Parameters
+        ----------
+        data_id : str
+            The data identifier to copy.
+        new_id : str, optional
+            Identifier for the copy. If None, will be auto-generated.
+        share_data : bool, optional
+            Whether the copy shares the sample array of the original instead
+            of copying it. The shared array is a read-only view, so the copy
+            must not be modified in place (e.g. ``filter`` without
+            ``copy()``); operations that return new data work as usual.
+            Everything else, such as ``info``, is copied. Default is True.
+        
+        Returns
+        -------
+        str
+            The data identifier of the copy.
+        
+        Raises
+        ------
+        KeyError
+            If data_id is not found.
+        """
+        source = self.get_data(data_id)
+        
+        memo = {}
+        samples = getattr(source, '_data', None) if share_data else None
+        if samples is not None and hasattr(samples, 'view'):
+            # deepcopy substitutes memo entries instead of copying them
+            shared = samples.view()
+            shared.flags.writeable = False
+            memo[id(samples)] = shared
+        duplicate = copy.deepcopy(source, memo)
+        
+        if new_id is None:
+            new_id = self._generate_data_id(f"{data_id}_copy")
+        
+        row = self._data_metadata.row(data_id)
+        # Data added without a file is stored with an empty path, which
+        # Path() would turn into the current directory
+        file_path = self._data_metadata.file_paths[row]
+        self._register_data(
+            new_id, Path(file_path) if file_path else None, duplicate,
+            bool(self._data_metadata.preload[row]),
+            matches_file=not self._data_metadata.modified[row],
+            # The original stays the one copied when the file is loaded again
+            reusable=False
+        )
+        logger.info(f"Duplicated data: {data_id} as {new_id}")
+        return new_id
     
     def remove_data(self, data_id: str) -> None:
         """Remove data from manager.
@@ -340,30 +1266,77 @@ class DataManager(QObject):
         ----------
         data_id : str
             The data identifier to remove.
-            
+        
         Raises
         ------
         KeyError
             If data_id is not found.
         """
-        if data_id not in self._data_objects:
-            raise KeyError(f"Data ID not found: {data_id}")
+        try:
+            data_obj = self._data_objects.pop(data_id)
+        except KeyError:
+            raise KeyError(f"Data ID not found: {data_id}") from None
         
-        del self._data_objects[data_id]
-        del self._data_metadata[data_id]
+        self._discard_spill(data_obj)
+        self._discard_mmap(data_id)
+        self._data_metadata.remove(data_id)
+        self._info_cache.pop(data_id, None)
+        self._untrack(data_id)
         
         # Update active data if necessary
         if self._active_data_id == data_id:
             remaining_data = list(self._data_objects.keys())
             self._active_data_id = remaining_data[0] if remaining_data else None
             if self._active_data_id:
-                self.active_data_changed.emit(self._active_data_id)
+                self._emit("active_data_changed", self._active_data_id)
         
         logger.info(f"Removed data: {data_id}")
-        self.data_removed.emit(data_id)
+        self._emit("data_removed", data_id)
+    
+    def remove_many(self, data_ids: List[str]) -> List[str]:
+        """Remove several data objects with a single notification.
+        
+        Unlike calling ``remove_data`` in a loop, listeners receive one
+        ``data_batch_removed`` notification instead of one per dataset.
+        
+        Parameters
+        ----------
+        data_ids : list of str
+            The data identifiers to remove. Unknown IDs are ignored.
+        
+        Returns
+        -------
+        list of str
+            The data identifiers that were removed.
+        """
+        removed = []
+        for data_id in data_ids:
+            data_obj = self._data_objects.pop(data_id, _MISSING)
+            if data_obj is _MISSING:
+                continue
+            self._discard_spill(data_obj)
+            self._discard_mmap(data_id)
+            self._data_metadata.remove(data_id)
+            self._info_cache.pop(data_id, None)
+            self._untrack(data_id)
+            removed.append(data_id)
+        
+        if not removed:
+            return removed
+        
+        # Update active data if necessary
+        active_changed = self._active_data_id not in self._data_objects
+        if active_changed:
+            self._active_data_id = next(iter(self._data_objects), None)
+        
+        logger.info(f"Removed {len(removed)} data objects")
+        self._emit("data_batch_removed", removed)
+        if active_changed and self._active_data_id:
+            self._emit("active_data_changed", self._active_data_id)
+        
+        return removed
     
-    @error_boundary("DataManager", show_dialog=False)
-    def save_data(self, data_id: str, file_path: Union[str, Path], 
+    def save_data(self, data_id: str, file_path: Union[str, Path],
                   overwrite: bool = False) -> None:
         """Save data to file.
         
@@ -375,7 +1348,7 @@ class DataManager(QObject):
             Path where to save the data.
         overwrite : bool, optional
             Whether to overwrite existing files. Default is False.
-            
+        
         Raises
         ------
         KeyError
@@ -383,44 +1356,215 @@ class DataManager(QObject):
         FileExistsError
             If file exists and overwrite is False.
         """
-        if data_id not in self._data_objects:
-            raise KeyError(f"Data ID not found: {data_id}")
-        
-        file_path = Path(file_path)
-        error_handler = get_error_handler()
-        
-        if file_path.exists() and not overwrite:
-            raise FileExistsError(f"File exists: {file_path}")
-        
-        data_obj = self._data_objects[data_id]
+        file_path, data_obj = self._prepare_save(data_id, file_path, overwrite)
         
         try:
             # Save based on data type with error handling
             if hasattr(data_obj, 'save'):
-                save_result = safe_execute(
-                    data_obj.save, file_path, overwrite=overwrite,
-                    error_handler=error_handler,
-                    module_name="MNE",
-                    context=f"Saving {type(data_obj).__name__} to {file_path}"
-                )
-                
-                if save_result is None:
-                    raise RuntimeError(f"Failed to save {type(data_obj).__name__} data")
+                try:
+                    data_obj.save(file_path, overwrite=overwrite)
+                except Exception as save_error:
+                    self._report_error(
+                        "MNE", save_error,
+                        f"Saving {type(data_obj).__name__} to {file_path}"
+                    )
+                    raise RuntimeError(
+                        f"Failed to save {type(data_obj).__name__} data"
+                    ) from save_error
             else:
                 raise ValueError(f"Cannot save data type: {type(data_obj)}")
             
-            # Update metadata
-            self._data_metadata[data_id]['file_path'] = str(file_path)
-            self._data_metadata[data_id]['modified'] = False
-            
-            logger.info(f"Saved data: {data_id} to {file_path}")
-            
+            self._finish_save(data_id, file_path, data_obj)
+        
         except Exception as e:
             error_msg = f"Failed to save data {data_id}: {e}"
             logger.error(error_msg)
-            error_handler.handle_module_error("DataManager", e, f"Saving {data_id} to {file_path}")
+            self._report_error("DataManager", e, f"Saving {data_id} to {file_path}")
             raise RuntimeError(error_msg) from e
     
+    def _prepare_save(self, data_id: str, file_path: Union[str, Path],
+                      overwrite: bool) -> Tuple[Path, Any]:
+        """Validate a save request and return the path and data to write.
+        
+        Raises
+        ------
+        KeyError
+            If data_id is not found.
+        FileExistsError
+            If file exists and overwrite is False.
+        """
+        data_obj = self._data_objects.get(data_id, _MISSING)
+        if data_obj is _MISSING:
+            raise KeyError(f"Data ID not found: {data_id}")
+        
+        file_path = Path(file_path)
+        
+        if file_path.exists() and not overwrite:
+            raise FileExistsError(f"File exists: {file_path}")
+        
+        return file_path, self._resident_object(data_id, data_obj)
+    
+    def _finish_save(self, data_id: str, file_path: Path, data_obj: Any) -> None:
+        """Record that a data object has been written to a file."""
+        row = self._data_metadata.row(data_id)
+        self._data_metadata.file_paths[row] = str(file_path)
+        self._data_metadata.modified[row] = False
+        self._info_cache.pop(data_id, None)
+        # Files recorded earlier may predate in-place changes that this
+        # save just flagged as unmodified
+        for key, (ref, *_) in list(self._reader_cache.items()):
+            if ref() is data_obj:
+                del self._reader_cache[key]
+        self._remember_file(file_path, data_id, data_obj)
+        
+        logger.info(f"Saved data: {data_id} to {file_path}")
+    
+    def _touch(self, data_id: str) -> None:
+        """Mark a dataset as most recently used."""
+        self._access_order[data_id] = None
+        self._access_order.move_to_end(data_id)
+    
+    def _track_nbytes(self, data_id: str, data_obj: Any) -> None:
+        """Record the in-memory size of a dataset and mark it as used."""
+        self._release_nbytes(data_id)
+        nbytes = _data_nbytes(data_obj)
+        self._data_nbytes[data_id] = nbytes
+        
+        buffer_id = _sample_buffer_id(data_obj) if nbytes else None
+        if buffer_id is None:
+            self._total_nbytes += nbytes
+        else:
+            self._data_buffers[data_id] = buffer_id
+            users = self._buffer_users.get(buffer_id)
+            if users is None:
+                self._buffer_users[buffer_id] = [1, nbytes]
+                self._total_nbytes += nbytes
+            else:
+                users[0] += 1
+        self._touch(data_id)
+    
+    def _release_nbytes(self, data_id: str) -> None:
+        """Stop counting a dataset's samples, unless another dataset shares them."""
+        nbytes = self._data_nbytes.pop(data_id, 0)
+        buffer_id = self._data_buffers.pop(data_id, None)
+        if buffer_id is None:
+            self._total_nbytes -= nbytes
+            return
+        
+        users = self._buffer_users[buffer_id]
+        users[0] -= 1
+        if not users[0]:
+            del self._buffer_users[buffer_id]
+            self._total_nbytes -= users[1]
+    
+    def _untrack(self, data_id: str) -> None:
+        """Forget the size and access order of a dataset."""
+        self._release_nbytes(data_id)
+        self._access_order.pop(data_id, None)
+    
+    def _resident_object(self, data_id: str, data_obj: Any) -> Any:
+        """Return a data object, reloading it if it was evicted.
+        
+        Parameters
+        ----------
+        data_id : str
+            The data identifier.
+        data_obj : Any
+            The stored entry for ``data_id``, possibly an evicted placeholder.
+        
+        Returns
+        -------
+        Any
+            The MNE data object.
+        """
+        if isinstance(data_obj, _EvictedData):
+            evicted = data_obj
+            # Only preloaded data is evicted, so it is reloaded the same way
+            data_obj = self._load_data_by_extension(evicted.file_path, True)
+            self._data_objects[data_id] = data_obj
+            self._track_nbytes(data_id, data_obj)
+            if evicted.spilled:
+                self._remove_temp_file(evicted.file_path)
+            else:
+                self._remember_file(evicted.file_path, data_id, data_obj)
+            logger.info(f"Reloaded evicted data: {data_id}")
+            self._enforce_memory_cap(keep=data_id)
+        else:
+            self._touch(data_id)
+        
+        return data_obj
+    
+    def _enforce_memory_cap(self, keep: Optional[str] = None) -> None:
+        """Evict least recently used datasets until under ``max_bytes``.
+        
+        Data whose samples still match its source file is dropped and later
+        reloaded from it; other data is first written to a temporary FIF
+        file. The active
+        dataset and ``keep`` are never evicted.
+        
+        Parameters
+        ----------
+        keep : str, optional
+            Data identifier that must stay in memory.
+        """
+        if self.max_bytes is None or self._total_nbytes <= self.max_bytes:
+            return
+        
+        for data_id in list(self._access_order):
+            if self._total_nbytes <= self.max_bytes:
+                break
+            if data_id in (keep, self._active_data_id) or not self._data_nbytes.get(data_id):
+                continue
+            self._evict(data_id)
+    
+    def _evict(self, data_id: str) -> None:
+        """Replace a dataset with an ``_EvictedData`` placeholder."""
+        data_obj = self._data_objects[data_id]
+        row = self._data_metadata.row(data_id)
+        kind = self._data_metadata.kinds[row]
+        
+        # Only Raw and Epochs can be reloaded as they were (read_evokeds
+        # returns a list), so other types stay in memory
+        if kind != DataKind.RAW and kind != DataKind.EPOCHS:
+            return
+        
+        # Drop the samples only if they are verified to still match the file
+        # they were loaded from, which also catches in-place changes that
+        # never set the modified flag
+        file_path = self.find_source_file(data_obj)
+        spilled = file_path is None
+        if spilled:
+            suffix = '-epo.fif' if kind == DataKind.EPOCHS else '_raw.fif'
+            fd, tmp_name = tempfile.mkstemp(prefix='quicklab_', suffix=suffix)
+            os.close(fd)
+            file_path = Path(tmp_name)
+            try:
+                data_obj.save(file_path, overwrite=True)
+            except Exception as e:
+                logger.warning(f"Could not spill {data_id} to disk: {e}")
+                self._remove_temp_file(file_path)
+                return
+        
+        self._data_objects[data_id] = _EvictedData(
+            file_path, data_obj.info, getattr(data_obj, 'n_times', None), spilled
+        )
+        self._release_nbytes(data_id)
+        self._access_order.pop(data_id, None)
+        logger.info(f"Evicted data from memory: {data_id}")
+    
+    def _discard_spill(self, data_obj: Any) -> None:
+        """Delete the temporary file of an evicted dataset, if any."""
+        if isinstance(data_obj, _EvictedData) and data_obj.spilled:
+            self._remove_temp_file(data_obj.file_path)
+    
+    @staticmethod
+    def _remove_temp_file(file_path: Path) -> None:
+        """Delete a temporary file, ignoring errors."""
+        try:
+            file_path.unlink()
+        except OSError as e:
+            logger.debug(f"Could not remove temporary file {file_path}: {e}")
+    
     def _generate_data_id(self, filename: str) -> str:
         """Generate a unique data ID.
         
@@ -428,32 +1572,386 @@ class DataManager(QObject):
         ----------
         filename : str
             The original filename.
-            
+        
         Returns
         -------
         str
             A unique data identifier.
         """
         base_name = Path(filename).stem
-        self._data_counter += 1
-        
-        # Try base name first
-        if base_name not in self._data_objects:
-            return base_name
         
-        # Add counter if name exists
-        counter = 1
-        while f"{base_name}_{counter}" in self._data_objects:
-            counter += 1
-        
-        return f"{base_name}_{counter}"
+        with self._id_lock:
+            counter = self._basename_counters.get(base_name, 0)
+            
+            # Explicit data IDs passed to load_data can still collide, so keep
+            # probing from the cached counter
+            data_id = base_name if counter == 0 else f"{base_name}_{counter}"
+            while data_id in self._data_objects:
+                counter += 1
+                data_id = f"{base_name}_{counter}"
+            
+            self._basename_counters[base_name] = counter + 1
+        return data_id
     
     def clear_all_data(self) -> None:
         """Remove all data from manager."""
-        data_ids = list(self._data_objects.keys())
+        self.remove_many(list(self._data_objects.keys()))
+        logger.info("Cleared all data from manager")
+
+
+def _build_data_manager_class() -> type:
+    """Create the Qt-backed DataManager class.
+    
+    PyQt6 and the Qt-based error handler are imported here rather than at
+    module level so that ``_DataManagerCore`` stays usable without Qt.
+    
+    Returns
+    -------
+    type
+        The ``DataManager`` class.
+    """
+    from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+    
+    from ..utils.error_handler import error_boundary, get_error_handler
+    
+    class _LoadSignals(QObject):
+        """Signal holder for ``_LoadWorker`` (QRunnable is not a QObject)."""
         
-        for data_id in data_ids:
-            self.remove_data(data_id)
+        finished = pyqtSignal(str, object, object)
+    
+    class _LoadWorker(QRunnable):
+        """Read a data file on a thread pool thread.
+        
+        Emits ``signals.finished(data_id, data_obj, error)`` when done, with
+        exactly one of ``data_obj`` and ``error`` set.
+        """
+        
+        def __init__(self, read: Callable[[Path, Union[bool, str]], Any], data_id: str,
+                     file_path: Path, preload: Union[bool, str]) -> None:
+            super().__init__()
+            self.signals = _LoadSignals()
+            self._read = read
+            self._data_id = data_id
+            self._file_path = file_path
+            self._preload = preload
+        
+        def run(self) -> None:
+            """Read the file and report the result."""
+            try:
+                data_obj = self._read(self._file_path, self._preload)
+            except Exception as e:
+                self.signals.finished.emit(self._data_id, None, e)
+            else:
+                self.signals.finished.emit(self._data_id, data_obj, None)
+    
+    class _SaveWorker(QRunnable):
+        """Write a data object to a file on a thread pool thread.
+        
+        Emits ``signals.finished(data_id, data_obj, error)`` when done, with
+        ``error`` set if writing failed.
+        """
+        
+        def __init__(self, data_id: str, data_obj: Any, file_path: Path,
+                     overwrite: bool) -> None:
+            super().__init__()
+            self.signals = _LoadSignals()
+            self._data_id = data_id
+            self._data_obj = data_obj
+            self._file_path = file_path
+            self._overwrite = overwrite
+        
+        def run(self) -> None:
+            """Save the data and report the result."""
+            try:
+                self._data_obj.save(self._file_path, overwrite=self._overwrite)
+            except Exception as e:
+                self.signals.finished.emit(self._data_id, self._data_obj, e)
+            else:
+                self.signals.finished.emit(self._data_id, self._data_obj, None)
+    
+    class DataManager(_DataManagerCore, QObject):
+        """Manages MNE data objects and their metadata throughout the application.
+        
+        The DataManager serves as the central hub for all data operations in QuickLab,
+        handling loading, saving, and tracking of MNE data objects (Raw, Epochs, Evoked, etc.).
+        It provides signals for data change notifications and maintains data provenance.
+        
+        Signals
+        -------
+        data_loaded : str, object
+            Emitted when new data is loaded (data_id, data_object)
+        data_changed : str, object
+            Emitted when existing data is modified (data_id, data_object)
+        data_removed : str
+            Emitted when data is removed (data_id)
+        active_data_changed : str
+            Emitted when the active data selection changes (data_id)
+        data_load_failed : str, str
+            Emitted when a ``load_data_async`` read fails (data_id, message)
+        data_saved : str, str
+            Emitted when a ``save_data_async`` write completes (data_id, file_path)
+        data_save_failed : str, str
+            Emitted when a ``save_data_async`` write fails (data_id, message)
+        data_batch_removed : list
+            Emitted once when several data objects are removed (data_ids)
+        data_loaded_batch : list
+            Emitted on the next event loop iteration after one or more loads,
+            with all ``(data_id, data_object)`` pairs loaded since the last
+            emission
+        """
+        
+        # Qt signals for data change notifications
+        data_loaded = pyqtSignal(str, object)
+        data_changed = pyqtSignal(str, object)
+        data_removed = pyqtSignal(str)
+        active_data_changed = pyqtSignal(str)
+        data_load_failed = pyqtSignal(str, str)
+        data_saved = pyqtSignal(str, str)
+        data_save_failed = pyqtSignal(str, str)
+        data_batch_removed = pyqtSignal(list)
+        data_loaded_batch = pyqtSignal(list)
+        
+        def __init__(self) -> None:
+            """Initialize the DataManager."""
+            super().__init__()
+            self._pool = QThreadPool.globalInstance()
+            # The error handler is a process-wide singleton; resolve it once
+            self._error_handler = get_error_handler()
+            # In-flight async loads by data ID: (worker, file_path, preload).
+            # Holding the worker keeps its signal holder alive until the
+            # queued finished signal has been delivered.
+            self._pending_loads: Dict[str, Tuple[Any, Path, Union[bool, str]]] = {}
+            # Loads not yet reported through data_loaded_batch
+            self._pending_loaded: List[Tuple[str, Any]] = []
+            # In-flight async saves by data ID: (worker, file_path)
+            self._pending_saves: Dict[str, Tuple[Any, Path]] = {}
+        
+        def load_data_async(self,
+                            file_path: Union[str, Path],
+                            data_id: Optional[str] = None,
+                            preload: bool = False,
+                            mmap: bool = False) -> str:
+            """Load data from file on a worker thread.
+            
+            The file is read on the global thread pool and the data is
+            registered on the GUI thread when the read completes, emitting
+            ``data_loaded`` on success or ``data_load_failed`` on error.
+            
+            Parameters
+            ----------
+            file_path : str or Path
+                Path to the data file to load.
+            data_id : str, optional
+                Unique identifier for the data. If None, will be auto-generated.
+            preload : bool, optional
+                Whether to preload data into memory. Default is False. Files
+                larger than ``mmap_threshold_bytes`` are never preloaded.
+            mmap : bool, optional
+                Whether to load raw data into a memory-mapped temporary file
+                instead of RAM. Default is False.
+            
+            Returns
+            -------
+            str
+                The data identifier the data will be stored under.
+            
+            Raises
+            ------
+            ValueError
+                If the file doesn't exist or the data ID is already in use.
+            """
+            file_path, data_id = self._prepare_load(file_path, data_id)
+            preload = self._resolve_preload(file_path, preload)
+            if data_id in self._pending_loads:
+                raise ValueError(f"Data ID already being loaded: {data_id}")
+            if mmap:
+                preload = self._memmap_target(data_id, file_path)
+            
+            cached = self._cached_read(file_path, preload)
+            if cached is not None:
+                # Still report the result on the next event loop iteration
+                self._pending_loads[data_id] = (None, file_path, preload)
+                QTimer.singleShot(
+                    0, lambda: self._on_load_finished(data_id, cached, None)
+                )
+                return data_id
+            
+            worker = _LoadWorker(self._load_data_by_extension, data_id,
+                                 file_path, preload)
+            worker.signals.finished.connect(self._on_load_finished)
+            self._pending_loads[data_id] = (worker, file_path, preload)
+            self._pool.start(worker)
+            
+            logger.debug(f"Started async load of {file_path} as {data_id}")
+            return data_id
+        
+        def _register_data(self, data_id: str, file_path: Optional[Path],
+                           data_obj: Any, preload: Union[bool, str],
+                           matches_file: bool = True,
+                           reusable: bool = True) -> None:
+            """Store loaded data and queue it for ``data_loaded_batch``."""
+            super()._register_data(data_id, file_path, data_obj, preload,
+                                   matches_file, reusable)
+            
+            self._pending_loaded.append((data_id, data_obj))
+            if len(self._pending_loaded) == 1:
+                QTimer.singleShot(0, self._flush_loaded)
+        
+        def _flush_loaded(self) -> None:
+            """Emit one ``data_loaded_batch`` for all queued loads."""
+            loaded, self._pending_loaded = self._pending_loaded, []
+            loaded = [item for item in loaded if item[0] in self._data_objects]
+            if loaded:
+                self.data_loaded_batch.emit(loaded)
+        
+        def is_loading(self, data_id: Optional[str] = None) -> bool:
+            """Check whether async loads are in progress.
+            
+            Parameters
+            ----------
+            data_id : str, optional
+                Data identifier to check. If None, checks for any pending load.
+            
+            Returns
+            -------
+            bool
+                True if the load (or any load) has not completed yet.
+            """
+            if data_id is None:
+                return bool(self._pending_loads)
+            return data_id in self._pending_loads
+        
+        def _on_load_finished(self, data_id: str, data_obj: Any,
+                              error: Optional[Exception]) -> None:
+            """Register the result of an async load on the GUI thread."""
+            pending = self._pending_loads.pop(data_id, None)
+            if pending is None:
+                return
+            _, file_path, preload = pending
+            
+            if error is None:
+                try:
+                    self._register_data(data_id, file_path, data_obj, preload)
+                    return
+                except Exception as e:
+                    error = e
+            
+            self._discard_mmap(data_id)
+            error_msg = f"Failed to load data from {file_path}: {error}"
+            logger.error(error_msg)
+            self._report_error("DataManager", error, f"Loading {file_path}")
+            self.data_load_failed.emit(data_id, error_msg)
+        
+        def save_data_async(self, data_id: str, file_path: Union[str, Path],
+                            overwrite: bool = False) -> Path:
+            """Save data to file on a worker thread.
+            
+            The file is written on the global thread pool and the metadata is
+            updated on the GUI thread when the write completes, emitting
+            ``data_saved`` on success or ``data_save_failed`` on error.
+            
+            Parameters
+            ----------
+            data_id : str
+                The data identifier.
+            file_path : str or Path
+                Path where to save the data.
+            overwrite : bool, optional
+                Whether to overwrite existing files. Default is False.
+            
+            Returns
+            -------
+            Path
+                The path the data will be written to.
+            
+            Raises
+            ------
+            KeyError
+                If data_id is not found.
+            FileExistsError
+                If file exists and overwrite is False.
+            ValueError
+                If the data cannot be saved or is already being saved.
+            """
+            if data_id in self._pending_saves:
+                raise ValueError(f"Data ID already being saved: {data_id}")
+            file_path, data_obj = self._prepare_save(data_id, file_path, overwrite)
+            if not hasattr(data_obj, 'save'):
+                raise ValueError(f"Cannot save data type: {type(data_obj)}")
+            
+            worker = _SaveWorker(data_id, data_obj, file_path, overwrite)
+            worker.signals.finished.connect(self._on_save_finished)
+            self._pending_saves[data_id] = (worker, file_path)
+            self._pool.start(worker)
+            
+            logger.debug(f"Started async save of {data_id} to {file_path}")
+            return file_path
+        
+        def is_saving(self, data_id: Optional[str] = None) -> bool:
+            """Check whether async saves are in progress.
+            
+            Parameters
+            ----------
+            data_id : str, optional
+                Data identifier to check. If None, checks for any pending save.
+            
+            Returns
+            -------
+            bool
+                True if the save (or any save) has not completed yet.
+            """
+            if data_id is None:
+                return bool(self._pending_saves)
+            return data_id in self._pending_saves
+        
+        def _on_save_finished(self, data_id: str, data_obj: Any,
+                              error: Optional[Exception]) -> None:
+            """Record the result of an async save on the GUI thread."""
+            pending = self._pending_saves.pop(data_id, None)
+            if pending is None:
+                return
+            _, file_path = pending
+            
+            if error is None:
+                # Data replaced or removed while saving keeps its state
+                if self._data_objects.get(data_id) is data_obj:
+                    self._finish_save(data_id, file_path, data_obj)
+                self.data_saved.emit(data_id, str(file_path))
+                return
+            
+            error_msg = f"Failed to save data {data_id}: {error}"
+            logger.error(error_msg)
+            self._report_error("DataManager", error, f"Saving {data_id} to {file_path}")
+            self.data_save_failed.emit(data_id, error_msg)
+        
+        def _emit(self, signal_name: str, *args: Any) -> None:
+            """Emit the Qt signal matching a core notification.
+            
+            Emitted directly: exceptions raised in connected slots go to the
+            global exception hook installed by the error handler.
+            """
+            getattr(self, signal_name).emit(*args)
         
-        self._data_counter = 0
-        logger.info("Cleared all data from manager")
\ No newline at end of file
+        def _report_error(self, module_name: str, error: Exception,
+                          context: str = "") -> None:
+            """Forward errors to the application error handler."""
+            self._error_handler.handle_module_error(module_name, error, context)
+        
+        load_data = error_boundary("DataManager", show_dialog=False)(
+            _DataManagerCore.load_data
+        )
+        save_data = error_boundary("DataManager", show_dialog=False)(
+            _DataManagerCore.save_data
+        )
+    
+    DataManager.__qualname__ = "DataManager"
+    return DataManager
+
+
+def __getattr__(name: str) -> Any:
+    """Build the Qt-backed DataManager on first access (PEP 562)."""
+    if name == "DataManager":
+        cls = _build_data_manager_class()
+        globals()["DataManager"] = cls
+        return cls
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
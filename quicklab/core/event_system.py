@@ -4,9 +4,17 @@ This module provides a centralized event system that allows different components
 of QuickLab to communicate without tight coupling.
 """
 
+import sys
+import time
 import logging
-from typing import Dict, List, Callable, Any, Optional
+import weakref
+from collections import deque
+from itertools import islice
+from typing import (
+    Deque, Dict, Hashable, List, Callable, Any, Mapping, Optional, Sequence, Tuple
+)
 from enum import Enum
+from types import MappingProxyType
 from dataclasses import dataclass
 from PyQt6.QtCore import QObject, pyqtSignal
 
@@ -15,6 +23,51 @@ from ..utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+# Events are created at high rates, so drop their per-instance __dict__
+# where dataclasses support it (Python 3.10+)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Shared data of events published without any, so they need no dict each
+_EMPTY_DATA: Mapping[str, Any] = MappingProxyType({})
+
+# Sentinel for dict.pop on subscriber dicts
+_MISSING = object()
+
+# A stored subscriber: called with no arguments, it returns the callback, or
+# None once the object owning a bound-method callback has been collected
+_CallbackRef = Callable[[], Optional[Callable]]
+
+
+def _callback_name(callback: Callable) -> str:
+    """Return a readable name for a callback, for log messages."""
+    return getattr(callback, '__qualname__', None) or repr(callback)
+
+
+def _callback_key(callback: Callable) -> Hashable:
+    """Return the key identifying a callback among the subscribers.
+    
+    Bound methods are recreated on every attribute access, so they are keyed
+    by the identities of their instance and function instead.
+    """
+    owner = getattr(callback, '__self__', None)
+    func = getattr(callback, '__func__', None)
+    if owner is not None and func is not None:
+        return (id(owner), id(func))
+    return callback
+
+
+class _StrongRef:
+    """Reference-like holder that keeps a callback alive."""
+    
+    __slots__ = ('_callback',)
+    
+    def __init__(self, callback: Callable) -> None:
+        self._callback = callback
+    
+    def __call__(self) -> Callable:
+        return self._callback
+
+
 class EventType(Enum):
     """Enumeration of event types in QuickLab."""
     
@@ -49,7 +102,7 @@ class EventType(Enum):
     PROJECT_CLOSED = "project_closed"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Event:
     """Represents an event in the QuickLab event system.
     
@@ -60,24 +113,24 @@ class Event:
     source : str
         Identifier for the event source.
     data : dict, optional
-        Additional event data.
+        Additional event data. Defaults to a shared, read-only empty mapping.
     timestamp : float, optional
-        Event timestamp (will be auto-generated if None).
+        Event timestamp from ``time.monotonic()`` (will be auto-generated if
+        None). Only meaningful relative to other event timestamps.
     """
     
     event_type: EventType
     source: str
-    data: Optional[Dict[str, Any]] = None
+    data: Optional[Mapping[str, Any]] = None
     timestamp: Optional[float] = None
     
     def __post_init__(self):
         """Initialize timestamp if not provided."""
         if self.timestamp is None:
-            import time
-            self.timestamp = time.time()
+            self.timestamp = time.monotonic()
         
         if self.data is None:
-            self.data = {}
+            self.data = _EMPTY_DATA
 
 
 class EventSystem(QObject):
@@ -91,17 +144,33 @@ class EventSystem(QObject):
     -------
     event_emitted : Event
         Emitted when any event is published through the system.
+    events_emitted : list
+        Emitted once per ``publish_batch`` call with all of its events
+        (``event_emitted`` is not emitted for them).
     """
     
     # Qt signal for event notifications
     event_emitted = pyqtSignal(object)
+    events_emitted = pyqtSignal(list)
     
     def __init__(self) -> None:
         """Initialize the EventSystem."""
         super().__init__()
-        self._subscribers: Dict[EventType, List[Callable]] = {}
-        self._event_history: List[Event] = []
+        # Callback references per event type, keyed by _callback_key for O(1)
+        # membership and removal while keeping subscription order. Bound
+        # methods are held weakly so subscribers do not keep widgets alive.
+        self._subscribers: Dict[EventType, Dict[Hashable, _CallbackRef]] = {}
+        # Tuple copies of the references per event type, rebuilt lazily after
+        # a subscription change so publishing needs neither a copy nor a lock
+        self._sub_snapshots: Dict[EventType, Tuple[_CallbackRef, ...]] = {}
         self._max_history: int = 1000
+        self._event_history: Deque[Event] = deque(maxlen=self._max_history)
+        # Per-type and per-source indexes of (sequence number, event), so
+        # filtered history queries do not scan the whole history. Entries
+        # older than the oldest event in _event_history are stale.
+        self._event_seq: int = 0
+        self._history_by_type: Dict[EventType, Deque[Tuple[int, Event]]] = {}
+        self._history_by_source: Dict[str, Deque[Tuple[int, Event]]] = {}
         
         logger.info("EventSystem initialized")
     
@@ -114,13 +183,17 @@ class EventSystem(QObject):
             The type of event to subscribe to.
         callback : callable
             Function to call when the event occurs. Should accept an Event object.
+            Bound methods are referenced weakly and unsubscribed automatically
+            when their object is garbage collected; other callables are kept
+            alive until unsubscribed.
         """
-        if event_type not in self._subscribers:
-            self._subscribers[event_type] = []
+        key = _callback_key(callback)
+        callbacks = self._subscribers.setdefault(event_type, {})
         
-        if callback not in self._subscribers[event_type]:
-            self._subscribers[event_type].append(callback)
-            logger.debug(f"Subscribed to {event_type.value}: {callback.__name__}")
+        if key not in callbacks:
+            callbacks[key] = self._make_ref(event_type, key, callback)
+            self._sub_snapshots.pop(event_type, None)
+            logger.debug(f"Subscribed to {event_type.value}: {_callback_name(callback)}")
     
     def unsubscribe(self, event_type: EventType, callback: Callable[[Event], None]) -> None:
         """Unsubscribe from an event type.
@@ -132,10 +205,10 @@ class EventSystem(QObject):
         callback : callable
             The callback function to remove.
         """
-        if event_type in self._subscribers:
-            if callback in self._subscribers[event_type]:
-                self._subscribers[event_type].remove(callback)
-                logger.debug(f"Unsubscribed from {event_type.value}: {callback.__name__}")
+        callbacks = self._subscribers.get(event_type)
+        if callbacks is not None and callbacks.pop(_callback_key(callback), _MISSING) is not _MISSING:
+            self._sub_snapshots.pop(event_type, None)
+            logger.debug(f"Unsubscribed from {event_type.value}: {_callback_name(callback)}")
     
     def publish(self, event: Event) -> None:
         """Publish an event to all subscribers.
@@ -145,23 +218,131 @@ class EventSystem(QObject):
         event : Event
             The event to publish.
         """
-        # Add to history
-        self._event_history.append(event)
-        if len(self._event_history) > self._max_history:
-            self._event_history.pop(0)
+        self._record(event)
         
         # Notify Qt signal subscribers
         self.event_emitted.emit(event)
         
+        # Notify direct subscribers (a snapshot, so callbacks may unsubscribe)
+        for ref in self._snapshot(event.event_type):
+            callback = ref()
+            if callback is None:
+                continue
+            try:
+                callback(event)
+            except Exception as e:
+                logger.error(f"Error in event callback {_callback_name(callback)}: {e}")
+        
+        logger.debug(f"Published event: {event.event_type.value} from {event.source}")
+    
+    def publish_batch(self, events: Sequence[Event]) -> None:
+        """Publish several events with a single Qt signal emission.
+        
+        Intended for high-frequency streams such as progress updates, where
+        emitting one queued Qt signal per event would flood the event loop.
+        Direct subscribers are still called once per event, in order.
+        
+        Parameters
+        ----------
+        events : sequence of Event
+            The events to publish.
+        """
+        if not events:
+            return
+        events = list(events)
+        
+        record = self._record
+        for event in events:
+            record(event)
+        
+        # Notify Qt signal subscribers
+        self.events_emitted.emit(events)
+        
         # Notify direct subscribers
-        if event.event_type in self._subscribers:
-            for callback in self._subscribers[event.event_type]:
+        snapshot = self._snapshot
+        log_error = logger.error
+        for event in events:
+            for ref in snapshot(event.event_type):
+                callback = ref()
+                if callback is None:
+                    continue
                 try:
                     callback(event)
                 except Exception as e:
-                    logger.error(f"Error in event callback {callback.__name__}: {e}")
+                    log_error(f"Error in event callback {_callback_name(callback)}: {e}")
         
-        logger.debug(f"Published event: {event.event_type.value} from {event.source}")
+        logger.debug(f"Published {len(events)} events")
+    
+    def _make_ref(self, event_type: EventType, key: Hashable,
+                  callback: Callable) -> _CallbackRef:
+        """Create the stored reference for a new subscriber."""
+        if not isinstance(key, tuple):
+            return _StrongRef(callback)
+        
+        def drop(ref: weakref.WeakMethod) -> None:
+            # The owner was collected; forget the subscription unless the key
+            # has since been reused by a new subscriber
+            callbacks = self._subscribers.get(event_type)
+            if callbacks is not None and callbacks.get(key) is ref:
+                del callbacks[key]
+                self._sub_snapshots.pop(event_type, None)
+        
+        try:
+            return weakref.WeakMethod(callback, drop)
+        except TypeError:
+            # The owner does not support weak references (e.g. a class with
+            # __slots__ and no __weakref__), so keep it alive instead
+            return _StrongRef(callback)
+    
+    def _snapshot(self, event_type: EventType) -> Tuple[_CallbackRef, ...]:
+        """Return the cached tuple of callback references for an event type."""
+        snap = self._sub_snapshots.get(event_type)
+        if snap is None:
+            callbacks = self._subscribers.get(event_type)
+            snap = tuple(callbacks.values()) if callbacks else ()
+            self._sub_snapshots[event_type] = snap
+        return snap
+    
+    def _record(self, event: Event) -> None:
+        """Add an event to the history and its indexes."""
+        # The deques drop their oldest entries when full
+        self._event_history.append(event)
+        self._event_seq += 1
+        entry = (self._event_seq, event)
+        
+        by_type = self._history_by_type.get(event.event_type)
+        if by_type is None:
+            by_type = self._history_by_type[event.event_type] = deque(
+                maxlen=self._event_history.maxlen
+            )
+        by_type.append(entry)
+        
+        by_source = self._history_by_source.get(event.source)
+        if by_source is None:
+            by_source = self._history_by_source[event.source] = deque(
+                maxlen=self._event_history.maxlen
+            )
+        by_source.append(entry)
+        
+        # Trim the indexes in batches, once per history length of events
+        if self._event_seq % self._event_history.maxlen == 0:
+            self._prune_indexes()
+    
+    def _prune_indexes(self) -> None:
+        """Drop index entries older than the history, and empty indexes.
+        
+        Indexes of rare event types or sources otherwise keep their stale
+        events alive, and one index per source that ever published would
+        accumulate.
+        """
+        oldest_seq = self._event_seq - len(self._event_history) + 1
+        for indexes in (self._history_by_type, self._history_by_source):
+            for key in list(indexes):
+                index = indexes[key]
+                while index and index[0][0] < oldest_seq:
+                    index.popleft()
+                if not index:
+                    del indexes[key]
     
     def publish_simple(self, event_type: EventType, source: str, **kwargs) -> None:
         """Publish a simple event with keyword arguments as data.
@@ -175,7 +356,7 @@ class EventSystem(QObject):
         **kwargs
             Additional data to include in the event.
         """
-        event = Event(event_type=event_type, source=source, data=kwargs)
+        event = Event(event_type=event_type, source=source, data=kwargs or None)
         self.publish(event)
     
     def get_event_history(self, event_type: Optional[EventType] = None,
@@ -197,22 +378,46 @@ class EventSystem(QObject):
         list
             List of Event objects matching the criteria.
         """
-        events = self._event_history
+        history = self._event_history
+        if limit is not None and limit <= 0:
+            return []
         
-        if event_type is not None:
-            events = [e for e in events if e.event_type == event_type]
+        if event_type is None and source is None:
+            if limit is None:
+                return list(history)
+            return list(islice(history, max(len(history) - limit, 0), None))
         
-        if source is not None:
-            events = [e for e in events if e.source == source]
+        # Scan the smaller matching index, checking the other filter per event
+        by_type = self._history_by_type.get(event_type, ()) if event_type is not None else None
+        by_source = self._history_by_source.get(source, ()) if source is not None else None
+        if by_source is None or (by_type is not None and len(by_type) <= len(by_source)):
+            index, check_type, check_source = by_type, None, source
+        else:
+            index, check_type, check_source = by_source, event_type, None
         
-        if limit is not None:
-            events = events[-limit:]
+        # Walk back from the newest event until the limit is reached or the
+        # index entries are older than the history
+        oldest_seq = self._event_seq - len(history) + 1
+        events = []
+        for seq, event in reversed(index):
+            if seq < oldest_seq:
+                break
+            if check_type is not None and event.event_type != check_type:
+                continue
+            if check_source is not None and event.source != check_source:
+                continue
+            events.append(event)
+            if limit is not None and len(events) >= limit:
+                break
         
+        events.reverse()
         return events
     
     def clear_history(self) -> None:
         """Clear the event history."""
         self._event_history.clear()
+        self._history_by_type.clear()
+        self._history_by_source.clear()
         logger.info("Event history cleared")
     
     def get_subscribers(self, event_type: EventType) -> List[Callable]:
@@ -228,7 +433,8 @@ class EventSystem(QObject):
         list
             List of callback functions subscribed to the event type.
         """
-        return self._subscribers.get(event_type, []).copy()
+        callbacks = (ref() for ref in self._subscribers.get(event_type, {}).values())
+        return [callback for callback in callbacks if callback is not None]
     
     def get_subscription_count(self, event_type: EventType) -> int:
         """Get number of subscribers for an event type.
@@ -243,7 +449,7 @@ class EventSystem(QObject):
         int
             Number of subscribers.
         """
-        return len(self._subscribers.get(event_type, []))
+        return len(self._subscribers.get(event_type, ()))
     
     def unsubscribe_all(self, callback: Callable[[Event], None]) -> None:
         """Unsubscribe a callback from all event types.
@@ -253,13 +459,14 @@ class EventSystem(QObject):
         callback : callable
             The callback function to remove from all subscriptions.
         """
+        key = _callback_key(callback)
         removed_count = 0
-        for event_type in list(self._subscribers.keys()):
-            if callback in self._subscribers[event_type]:
-                self._subscribers[event_type].remove(callback)
+        for event_type, callbacks in self._subscribers.items():
+            if callbacks.pop(key, _MISSING) is not _MISSING:
+                self._sub_snapshots.pop(event_type, None)
                 removed_count += 1
         
-        logger.debug(f"Unsubscribed {callback.__name__} from {removed_count} event types")
+        logger.debug(f"Unsubscribed {_callback_name(callback)} from {removed_count} event types")
 
 
 class EventMixin:
@@ -1,16 +1,189 @@
 """Pipeline management for QuickLab preprocessing and analysis workflows."""
 
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, FrozenSet, List, Any, Optional, Callable, Tuple, Union
+from collections import ChainMap
 from dataclasses import dataclass, field
 from enum import Enum
+from pathlib import Path
+import functools
+import hashlib
+import heapq
+import inspect
 import logging
+import marshal
+import mmap
+import os
+import pickle
+import queue
+import sys
+import tempfile
+import threading
+import types
+import zlib
 
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, QThread, QThreadPool, pyqtSignal
 
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Sentinel for result cache misses (None is a valid step result)
+_MISSING = object()
+
+# Drop the per-instance __dict__ of pipeline steps where dataclasses
+# support it (Python 3.10+)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Visit states of the topological sort in _resolve_dependencies
+_IN_PROGRESS = False
+_DONE = True
+
+
+@functools.lru_cache(maxsize=256)
+def _hash_file(path: str, mtime_ns: int, size: int) -> bytes:
+    """Return the BLAKE2b digest of a file's contents.
+    
+    The modification time and size are part of the cache key, so a changed
+    file is hashed again.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    if size:
+        # Hash the mapped pages directly instead of reading into a buffer
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            hasher.update(m)
+    return hasher.digest()
+
+
+def _file_digest(path: Path) -> Optional[bytes]:
+    """Return the digest of a file's contents, or None if it is unreadable."""
+    try:
+        st = os.stat(path)
+        return _hash_file(os.path.abspath(path), st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
+
+
+def _update_fingerprint(hasher: Any, value: Any,
+                        source_file: Optional[Callable[[Any], Optional[Path]]] = None) -> None:
+    """Feed a deterministic digest of a step input into a hash object.
+    
+    Scalars and strings are hashed through their own bytes, containers item
+    by item, MNE objects through their info and samples, arrays through
+    their buffer and anything else through its pickle, which raises for
+    values that cannot be fingerprinted. Every value is prefixed with a type
+    tag so that, e.g., ``1``, ``1.0``, ``True`` and ``'1'`` differ.
+    
+    ``source_file`` may return the file an MNE object's samples are known to
+    match, such as :meth:`DataManager.find_source_file`; that file's
+    contents are hashed instead of the samples, which need not be loaded.
+    Samples already in memory are still covered by a fast Adler-32
+    checksum, so in-place changes the data manager has not seen (e.g.
+    ``raw.apply_function``) change the digest too.
+    """
+    if value is None or isinstance(value, bool):
+        hasher.update(b'c%r' % value)
+    elif isinstance(value, str):
+        encoded = value.encode('utf-8', 'surrogatepass')
+        hasher.update(b's%d:' % len(encoded))
+        hasher.update(encoded)
+    elif isinstance(value, bytes):
+        hasher.update(b'b%d:' % len(value))
+        hasher.update(value)
+    elif type(value) is int:
+        hasher.update(b'i%d;' % value)
+    elif type(value) is float:
+        hasher.update(b'f%r;' % value)
+    elif isinstance(value, dict):
+        hasher.update(b'd%d' % len(value))
+        for key in sorted(value, key=repr):
+            _update_fingerprint(hasher, key, source_file)
+            _update_fingerprint(hasher, value[key], source_file)
+    elif isinstance(value, (list, tuple)):
+        hasher.update(b'l%d' % len(value))
+        for item in value:
+            _update_fingerprint(hasher, item, source_file)
+    elif hasattr(value, 'get_data') and hasattr(value, 'info'):
+        hasher.update(type(value).__qualname__.encode())
+        _update_fingerprint(hasher, dict(value.info))
+        path = source_file(value) if source_file is not None else None
+        digest = _file_digest(path) if path is not None else None
+        if digest is not None:
+            hasher.update(b'F')
+            hasher.update(digest)
+            samples = getattr(value, '_data', None)
+            if getattr(value, 'preload', False) and hasattr(samples, '__array_interface__'):
+                if not samples.flags.c_contiguous:
+                    samples = samples.copy()
+                hasher.update(b'a%08x' % zlib.adler32(memoryview(samples).cast('B')))
+        else:
+            _update_fingerprint(hasher, value.get_data())
+    elif hasattr(value, '__array_interface__'):
+        hasher.update(repr((value.dtype.str, value.shape)).encode())
+        hasher.update(memoryview(value) if value.flags.c_contiguous else value.tobytes())
+    else:
+        hasher.update(pickle.dumps(value, protocol=4))
+
+
+def _data_object_ids(value: Any, ids: set) -> None:
+    """Add the ids of the MNE objects in a step input to ``ids``."""
+    if isinstance(value, dict):
+        for item in value.values():
+            _data_object_ids(item, ids)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _data_object_ids(item, ids)
+    elif hasattr(value, 'get_data') and hasattr(value, 'info'):
+        ids.add(id(value))
+
+
+def _update_function_fingerprint(hasher: Any, function: Callable) -> None:
+    """Feed the identity and implementation of a step function into a hash.
+    
+    Partials are fingerprinted through their function and bound arguments,
+    and other callable objects through their ``__call__`` and their state.
+    Raises for callables that cannot be fingerprinted, so that their steps
+    run uncached.
+    """
+    if isinstance(function, functools.partial):
+        hasher.update(b'P')
+        _update_function_fingerprint(hasher, function.func)
+        _update_fingerprint(hasher, function.args)
+        _update_fingerprint(hasher, function.keywords)
+        return
+    
+    name = getattr(function, '__qualname__', type(function).__qualname__)
+    hasher.update(f"{getattr(function, '__module__', '')}.{name}".encode())
+    
+    code = getattr(function, '__code__', None)
+    if code is not None:
+        # Editing the function, its defaults or captured values invalidates
+        # earlier results
+        hasher.update(marshal.dumps(code))
+        _update_fingerprint(hasher, function.__defaults__)
+        _update_fingerprint(hasher, function.__kwdefaults__)
+        _update_fingerprint(hasher, [cell.cell_contents for cell in function.__closure__ or ()])
+        if hasattr(function, '__self__'):
+            _update_fingerprint(hasher, function.__self__)
+    elif isinstance(function, types.BuiltinFunctionType):
+        # Named by their module and name; bound builtin methods also
+        # depend on the object they are bound to
+        if not isinstance(function.__self__, (types.ModuleType, type(None))):
+            _update_fingerprint(hasher, function.__self__)
+    elif isinstance(function, type) or not callable(function):
+        raise TypeError(f"Cannot fingerprint step function {name}")
+    elif hasattr(type(function).__call__, '__code__'):
+        # Callable instance: its class's __call__ and its state
+        hasher.update(b'C')
+        _update_function_fingerprint(hasher, type(function).__call__)
+        if hasattr(function, '__dict__'):
+            _update_fingerprint(hasher, vars(function))
+        else:
+            hasher.update(pickle.dumps(function, protocol=4))
+    else:
+        # Callables implemented in C, such as NumPy ufuncs, pickle by name;
+        # this raises for those that cannot be pickled
+        hasher.update(pickle.dumps(function, protocol=4))
+
 
 class StepStatus(Enum):
     """Status of a pipeline step."""
@@ -21,7 +194,7 @@ class StepStatus(Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class PipelineStep:
     """Represents a single step in an analysis pipeline.
     
@@ -37,15 +210,67 @@ class PipelineStep:
         List of step names this step depends on.
     description : str
         Human-readable description of the step.
+    cacheable : bool
+        Whether results may be reused from the result cache. Set to False
+        for steps with side effects, such as writing files.
+    
+    Notes
+    -----
+    The function is only passed the pipeline data and parameters it names
+    in its signature, unless it accepts ``**kwargs``. The signature is
+    inspected once when the step is created.
     """
     name: str
     function: Callable
     parameters: Dict[str, Any] = field(default_factory=dict)
     dependencies: List[str] = field(default_factory=list)
     description: str = ""
+    cacheable: bool = True
     status: StepStatus = StepStatus.PENDING
     result: Any = None
     error: Optional[str] = None
+    _param_names: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _accepts_var_kw: bool = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Cache the keyword arguments accepted by the step function."""
+        try:
+            parameters = inspect.signature(self.function).parameters.values()
+        except (TypeError, ValueError):
+            # Signature not introspectable (e.g. some builtins): pass everything
+            self._param_names = frozenset()
+            self._accepts_var_kw = True
+            return
+        self._param_names = frozenset(
+            param.name for param in parameters
+            if param.kind in (param.POSITIONAL_OR_KEYWORD, param.KEYWORD_ONLY)
+        )
+        self._accepts_var_kw = any(
+            param.kind is param.VAR_KEYWORD for param in parameters
+        )
+
+
+class _StepRunnable(QRunnable):
+    """Runs one pipeline step on a QThreadPool and reports the outcome.
+    
+    ``(step_name, success)`` is put on ``done`` when the step finishes, even
+    if it raised past ``PipelineManager._execute_step``.
+    """
+    
+    def __init__(self, manager: 'PipelineManager', pipeline_name: str,
+                 step: PipelineStep, done: 'queue.SimpleQueue') -> None:
+        super().__init__()
+        self._manager = manager
+        self._pipeline_name = pipeline_name
+        self._step = step
+        self._done = done
+    
+    def run(self) -> None:
+        success = False
+        try:
+            success = self._manager._execute_step(self._pipeline_name, self._step)
+        finally:
+            self._done.put((self._step.name, success))
 
 
 class PipelineManager(QObject):
@@ -54,6 +279,24 @@ class PipelineManager(QObject):
     The PipelineManager allows creation, execution, and monitoring of
     complex analysis workflows with dependency resolution and error handling.
     
+    Parameters
+    ----------
+    max_workers : int, optional
+        Maximum number of steps run concurrently by
+        ``execute_pipeline(..., parallel=True)``. Defaults to the number of
+        CPUs.
+    cache_dir : str or Path, optional
+        Directory for a persistent cache of step results. A cacheable step
+        whose function, parameters and input data match an earlier run
+        returns the stored result instead of running again. The execution
+        order of each pipeline is cached there too. Default is None (no
+        caching).
+    data_manager : DataManager, optional
+        Data manager the step inputs come from. Data objects it holds
+        unmodified from a file are fingerprinted for the result cache by
+        hashing that file instead of their samples, until a step of the
+        current run has received them.
+    
     Signals
     -------
     step_started : str
@@ -62,24 +305,63 @@ class PipelineManager(QObject):
         Emitted when a step completes (step_name, result).
     step_failed : str, str
         Emitted when a step fails (step_name, error).
+    step_cache_hit : str
+        Emitted before ``step_completed`` when a step's result was read from
+        the result cache (step_name).
     pipeline_completed : str
         Emitted when entire pipeline completes (pipeline_name).
     pipeline_failed : str, str
         Emitted when pipeline fails (pipeline_name, error).
+    
+    Notes
+    -----
+    Step signals are emitted directly for steps run in the manager's thread.
+    Steps run on the thread pool queue them; the manager's thread emits the
+    queued signals in order each time a step finishes, and always before
+    ``pipeline_completed`` or ``pipeline_failed``.
     """
     
     # Qt signals
     step_started = pyqtSignal(str)
     step_completed = pyqtSignal(str, object)
     step_failed = pyqtSignal(str, str)
+    step_cache_hit = pyqtSignal(str)
     pipeline_completed = pyqtSignal(str)
     pipeline_failed = pyqtSignal(str, str)
     
-    def __init__(self) -> None:
+    def __init__(self, max_workers: Optional[int] = None,
+                 cache_dir: Optional[Union[str, Path]] = None,
+                 data_manager: Optional[Any] = None) -> None:
         """Initialize the PipelineManager."""
         super().__init__()
-        self._pipelines: Dict[str, List[PipelineStep]] = {}
+        self.max_workers = max_workers
+        self.data_manager = data_manager
+        self.cache_dir: Optional[Path] = Path(cache_dir) if cache_dir is not None else None
+        # Least recently used results are deleted above this size; None
+        # disables the limit
+        self.cache_max_bytes: Optional[int] = 2 * 1024 ** 3
+        # Running size of the result cache, measured on the first store and
+        # by every prune; None until then
+        self._cache_bytes: Optional[int] = None
+        self._cache_lock = threading.Lock()
+        # Runs the steps of parallel executions
+        self._thread_pool = QThreadPool(self)
+        # Guards _pipeline_data while steps run in parallel
+        self._data_lock = threading.Lock()
+        # Steps per pipeline by name, in the order they were added
+        self._pipelines: Dict[str, Dict[str, PipelineStep]] = {}
         self._pipeline_data: Dict[str, Dict[str, Any]] = {}
+        # Per pipeline: the (name, dependencies) of its steps, and the
+        # execution order and reverse edges computed from them
+        self._order_cache: Dict[str, Tuple[Tuple[Tuple[str, Tuple[str, ...]], ...],
+                                           List[str], Dict[str, List[str]]]] = {}
+        # Step signals (bound signal, arguments) waiting to be emitted
+        self._pending_signals: List[Tuple[Any, tuple]] = []
+        self._signals_lock = threading.Lock()
+        # Per pipeline: ids of the data objects passed to a step in the
+        # current run. A step may have changed them in place, so they are
+        # no longer fingerprinted by their source file.
+        self._received_ids: Dict[str, set] = {}
         
         logger.info("PipelineManager initialized")
     
@@ -91,8 +373,9 @@ class PipelineManager(QObject):
         name : str
             Name of the pipeline.
         """
-        self._pipelines[name] = []
+        self._pipelines[name] = {}
         self._pipeline_data[name] = {}
+        self._order_cache.pop(name, None)
         logger.info(f"Created pipeline: {name}")
     
     def add_step(self, pipeline_name: str, step: PipelineStep) -> None:
@@ -112,15 +395,16 @@ class PipelineManager(QObject):
         ValueError
             If step name already exists in pipeline.
         """
-        if pipeline_name not in self._pipelines:
+        steps = self._pipelines.get(pipeline_name)
+        if steps is None:
             raise KeyError(f"Pipeline '{pipeline_name}' does not exist")
         
         # Check for duplicate step names
-        existing_names = [s.name for s in self._pipelines[pipeline_name]]
-        if step.name in existing_names:
+        if step.name in steps:
             raise ValueError(f"Step '{step.name}' already exists in pipeline '{pipeline_name}'")
         
-        self._pipelines[pipeline_name].append(step)
+        steps[step.name] = step
+        self._order_cache.pop(pipeline_name, None)
         logger.debug(f"Added step '{step.name}' to pipeline '{pipeline_name}'")
     
     def remove_step(self, pipeline_name: str, step_name: str) -> None:
@@ -138,24 +422,18 @@ class PipelineManager(QObject):
         KeyError
             If pipeline or step doesn't exist.
         """
-        if pipeline_name not in self._pipelines:
+        steps = self._pipelines.get(pipeline_name)
+        if steps is None:
             raise KeyError(f"Pipeline '{pipeline_name}' does not exist")
         
-        pipeline = self._pipelines[pipeline_name]
-        step_index = None
-        
-        for i, step in enumerate(pipeline):
-            if step.name == step_name:
-                step_index = i
-                break
-        
-        if step_index is None:
+        if steps.pop(step_name, None) is None:
             raise KeyError(f"Step '{step_name}' not found in pipeline '{pipeline_name}'")
         
-        del pipeline[step_index]
+        self._order_cache.pop(pipeline_name, None)
         logger.debug(f"Removed step '{step_name}' from pipeline '{pipeline_name}'")
     
-    def execute_pipeline(self, pipeline_name: str, input_data: Dict[str, Any]) -> bool:
+    def execute_pipeline(self, pipeline_name: str, input_data: Dict[str, Any],
+                         parallel: bool = False) -> bool:
         """Execute a complete pipeline.
         
         Parameters
@@ -164,6 +442,11 @@ class PipelineManager(QObject):
             Name of the pipeline to execute.
         input_data : dict
             Initial data for the pipeline.
+        parallel : bool, optional
+            Whether to run steps on a thread pool as soon as their
+            dependencies have completed. Steps then only see the results of
+            the steps they declare as dependencies (not of every step before
+            them). Default is False.
             
         Returns
         -------
@@ -180,9 +463,10 @@ class PipelineManager(QObject):
         
         # Initialize pipeline data
         self._pipeline_data[pipeline_name] = input_data.copy()
+        self._received_ids[pipeline_name] = set()
         
         # Reset step statuses
-        for step in self._pipelines[pipeline_name]:
+        for step in self._pipelines[pipeline_name].values():
             step.status = StepStatus.PENDING
             step.result = None
             step.error = None
@@ -191,13 +475,22 @@ class PipelineManager(QObject):
             # Resolve execution order
             execution_order = self._resolve_dependencies(pipeline_name)
             
-            # Execute steps in order
-            for step_name in execution_order:
-                step = self._get_step(pipeline_name, step_name)
-                if not self._execute_step(pipeline_name, step):
-                    # Step failed, abort pipeline
-                    self.pipeline_failed.emit(pipeline_name, step.error or "Unknown error")
-                    return False
+            if parallel:
+                failed_step = self._execute_parallel(pipeline_name, execution_order)
+            else:
+                # Execute steps in order
+                failed_step = None
+                for step_name in execution_order:
+                    step = self._get_step(pipeline_name, step_name)
+                    if not self._execute_step(pipeline_name, step):
+                        failed_step = step
+                        break
+            self._flush_signals()
+            
+            if failed_step is not None:
+                # Step failed, abort pipeline
+                self.pipeline_failed.emit(pipeline_name, failed_step.error or "Unknown error")
+                return False
             
             logger.info(f"Pipeline completed successfully: {pipeline_name}")
             self.pipeline_completed.emit(pipeline_name)
@@ -206,9 +499,111 @@ class PipelineManager(QObject):
         except Exception as e:
             error_msg = f"Pipeline execution failed: {e}"
             logger.error(error_msg)
+            self._flush_signals()
             self.pipeline_failed.emit(pipeline_name, error_msg)
             return False
     
+    def _queue_signal(self, signal: Any, *args: Any) -> None:
+        """Emit a step signal, or queue it when called from a worker thread.
+        
+        Queued signals are emitted by ``_flush_signals`` on the manager's
+        thread, which is blocked in ``execute_pipeline`` while steps run.
+        """
+        if QThread.currentThread() == self.thread():
+            # Keep the order if signals from workers are still waiting
+            self._flush_signals()
+            signal.emit(*args)
+            return
+        with self._signals_lock:
+            self._pending_signals.append((signal, args))
+    
+    def _flush_signals(self) -> None:
+        """Emit all queued step signals in the order they were queued."""
+        with self._signals_lock:
+            pending, self._pending_signals = self._pending_signals, []
+        for signal, args in pending:
+            signal.emit(*args)
+    
+    def _execute_parallel(self, pipeline_name: str,
+                          execution_order: List[str]) -> Optional[PipelineStep]:
+        """Execute pipeline steps concurrently in dependency order.
+        
+        A step becomes ready once all of its dependencies have completed.
+        Ready steps are kept in a heap keyed by their number of transitive
+        dependents, so work on the critical path is handed to the thread
+        pool first. After a failure no new steps are started, but steps
+        already running are allowed to finish.
+        
+        Parameters
+        ----------
+        pipeline_name : str
+            Name of the pipeline.
+        execution_order : list
+            Step names in a valid execution order.
+            
+        Returns
+        -------
+        PipelineStep or None
+            The first step that failed, or None if all steps completed.
+        """
+        steps = {name: self._get_step(pipeline_name, name) for name in execution_order}
+        # Reverse edges of the graph execution_order was just resolved from
+        dependents = self._order_cache[pipeline_name][2]
+        
+        # Number of unfinished dependencies per step
+        waiting_on = {name: len(set(step.dependencies)) for name, step in steps.items()}
+        
+        # Transitive dependents per step; every dependent comes later in
+        # the execution order, so one reverse pass sees them all resolved
+        downstream: Dict[str, frozenset] = {}
+        for name in reversed(execution_order):
+            direct = dependents.get(name, ())
+            downstream[name] = frozenset(direct).union(
+                *(downstream[dependent] for dependent in direct)
+            )
+        position = {name: index for index, name in enumerate(execution_order)}
+        
+        def push(name: str) -> None:
+            heapq.heappush(ready, (-len(downstream[name]), position[name], name))
+        
+        ready: List[Tuple[int, int, str]] = []
+        for name in execution_order:
+            if waiting_on[name] == 0:
+                push(name)
+        
+        failed_step = None
+        max_workers = self.max_workers or os.cpu_count() or 1
+        self._thread_pool.setMaxThreadCount(max_workers)
+        done: queue.SimpleQueue = queue.SimpleQueue()
+        running = 0
+        try:
+            while ready or running:
+                # Only fill free workers, so the heap order decides what
+                # runs next instead of the pool's FIFO queue
+                while ready and failed_step is None and running < max_workers:
+                    name = heapq.heappop(ready)[2]
+                    self._thread_pool.start(
+                        _StepRunnable(self, pipeline_name, steps[name], done)
+                    )
+                    running += 1
+                if not running:
+                    break
+                name, success = done.get()
+                running -= 1
+                self._flush_signals()
+                if not success:
+                    failed_step = failed_step or steps[name]
+                if failed_step is not None:
+                    continue
+                for dependent in dependents.get(name, ()):
+                    waiting_on[dependent] -= 1
+                    if waiting_on[dependent] == 0:
+                        push(dependent)
+        finally:
+            self._thread_pool.waitForDone()
+        
+        return failed_step
+    
     def _resolve_dependencies(self, pipeline_name: str) -> List[str]:
         """Resolve step dependencies and return execution order.
         
@@ -227,36 +622,82 @@ class PipelineManager(QObject):
         ValueError
             If circular dependencies are detected.
         """
-        pipeline = self._pipelines[pipeline_name]
-        
-        # Build dependency graph
-        graph = {}
-        for step in pipeline:
-            graph[step.name] = step.dependencies.copy()
-        
-        # Topological sort
-        result = []
-        visited = set()
-        temp_visited = set()
-        
-        def visit(node):
-            if node in temp_visited:
-                raise ValueError(f"Circular dependency detected involving step '{node}'")
-            if node in visited:
-                return
+        # Steps' dependencies are mutable lists, so the cached order is
+        # checked against a snapshot of the graph rather than trusted blindly
+        signature = tuple(
+            (step.name, tuple(step.dependencies))
+            for step in self._pipelines[pipeline_name].values()
+        )
+        cached = self._order_cache.get(pipeline_name)
+        if cached is not None and cached[0] == signature:
+            return list(cached[1])
+        
+        # Steps that only depend on steps added before them are already in
+        # a valid order, as in linear pipelines without any dependencies
+        result = None
+        preceding = set()
+        for name, dependencies in signature:
+            if not preceding.issuperset(dependencies):
+                break
+            preceding.add(name)
+        else:
+            result = [name for name, _ in signature]
+        
+        # With a result cache, execution orders also persist across
+        # restarts, keyed by the dependency graph they were computed from
+        plan_key = None
+        if result is None and self.cache_dir is not None:
+            plan_key = "plan-" + hashlib.blake2b(
+                repr(signature).encode(), digest_size=16
+            ).hexdigest()
+            cached_plan = self._load_cached_result(plan_key)
+            if isinstance(cached_plan, list):
+                result = cached_plan
+        
+        if result is None:
+            # Build dependency graph
+            graph = dict(signature)
+            
+            # Topological sort (iterative depth-first search); a node is
+            # absent from ``state`` until visited, then _IN_PROGRESS until
+            # all of its dependencies are placed, then _DONE
+            result = []
+            state: Dict[str, bool] = {}
+            
+            for root in graph:
+                if root in state:
+                    continue
+                state[root] = _IN_PROGRESS
+                stack = [(root, iter(graph[root]))]
+                while stack:
+                    node, dependencies = stack[-1]
+                    for dependency in dependencies:
+                        dependency_state = state.get(dependency)
+                        if dependency_state is _IN_PROGRESS:
+                            raise ValueError(
+                                f"Circular dependency detected involving step '{dependency}'"
+                            )
+                        if dependency_state is None:
+                            state[dependency] = _IN_PROGRESS
+                            stack.append((dependency, iter(graph.get(dependency, ()))))
+                            break
+                    else:
+                        stack.pop()
+                        state[node] = _DONE
+                        result.append(node)
             
-            temp_visited.add(node)
-            for dependency in graph.get(node, []):
-                visit(dependency)
-            temp_visited.remove(node)
-            visited.add(node)
-            result.append(node)
+            if plan_key is not None:
+                self._store_cached_result(plan_key, result)
         
-        for step_name in graph:
-            if step_name not in visited:
-                visit(step_name)
+        # Reverse edges, so the parallel scheduler finds the steps waiting
+        # on a finished step without scanning the graph
+        dependents: Dict[str, List[str]] = {}
+        for name, dependencies in signature:
+            for dependency in dict.fromkeys(dependencies):
+                dependents.setdefault(dependency, []).append(name)
         
-        return result
+        self._order_cache[pipeline_name] = (signature, result, dependents)
+        return list(result)
     
     def _get_step(self, pipeline_name: str, step_name: str) -> PipelineStep:
         """Get a step by name from a pipeline.
@@ -278,11 +719,12 @@ class PipelineManager(QObject):
         KeyError
             If step is not found.
         """
-        for step in self._pipelines[pipeline_name]:
-            if step.name == step_name:
-                return step
-        
-        raise KeyError(f"Step '{step_name}' not found in pipeline '{pipeline_name}'")
+        try:
+            return self._pipelines[pipeline_name][step_name]
+        except KeyError:
+            raise KeyError(
+                f"Step '{step_name}' not found in pipeline '{pipeline_name}'"
+            ) from None
     
     def _execute_step(self, pipeline_name: str, step: PipelineStep) -> bool:
         """Execute a single pipeline step.
@@ -301,29 +743,56 @@ class PipelineManager(QObject):
         """
         logger.info(f"Executing step: {step.name}")
         step.status = StepStatus.RUNNING
-        self.step_started.emit(step.name)
+        self._queue_signal(self.step_started, step.name)
         
         try:
-            # Prepare step input
-            step_input = self._pipeline_data[pipeline_name].copy()
-            step_input.update(step.parameters)
+            # Prepare step input (parameters shadow pipeline data); it is a
+            # snapshot because parallel steps keep updating the pipeline
+            # data while this one runs
+            with self._data_lock:
+                if step._accepts_var_kw:
+                    step_input = {**self._pipeline_data[pipeline_name], **step.parameters}
+                else:
+                    available = ChainMap(step.parameters, self._pipeline_data[pipeline_name])
+                    step_input = {
+                        name: available[name]
+                        for name in step._param_names if name in available
+                    }
+                received = self._received_ids.setdefault(pipeline_name, set())
+                already_received = frozenset(received)
+                _data_object_ids(step_input, received)
             
-            # Execute step function
-            result = step.function(**step_input)
+            cache_key = None
+            if self.cache_dir is not None and step.cacheable:
+                cache_key = self._result_cache_key(step, step_input, already_received)
+            
+            result = _MISSING
+            if cache_key is not None:
+                result = self._load_cached_result(cache_key)
+                if result is not _MISSING:
+                    logger.info(f"Using cached result for step: {step.name}")
+                    self._queue_signal(self.step_cache_hit, step.name)
+            
+            if result is _MISSING:
+                # Execute step function
+                result = step.function(**step_input)
+                if cache_key is not None:
+                    self._store_cached_result(cache_key, result)
             
             # Store result
             step.result = result
             step.status = StepStatus.COMPLETED
             
             # Update pipeline data with result if it's a dictionary
-            if isinstance(result, dict):
-                self._pipeline_data[pipeline_name].update(result)
-            else:
-                # Store result with step name as key
-                self._pipeline_data[pipeline_name][f"{step.name}_result"] = result
+            with self._data_lock:
+                if isinstance(result, dict):
+                    self._pipeline_data[pipeline_name].update(result)
+                else:
+                    # Store result with step name as key
+                    self._pipeline_data[pipeline_name][f"{step.name}_result"] = result
             
             logger.info(f"Step completed successfully: {step.name}")
-            self.step_completed.emit(step.name, result)
+            self._queue_signal(self.step_completed, step.name, result)
             return True
             
         except Exception as e:
@@ -332,9 +801,126 @@ class PipelineManager(QObject):
             step.status = StepStatus.FAILED
             
             logger.error(f"Step failed: {step.name} - {error_msg}")
-            self.step_failed.emit(step.name, error_msg)
+            self._queue_signal(self.step_failed, step.name, error_msg)
             return False
     
+    def _result_cache_key(self, step: PipelineStep, step_input: Dict[str, Any],
+                          received: FrozenSet[int] = frozenset()) -> Optional[str]:
+        """Hash a step's function and inputs into a result cache key.
+        
+        Data objects whose id is in ``received`` were passed to an earlier
+        step and are fingerprinted by their samples, not their source file.
+        Returns None if the inputs cannot be fingerprinted.
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+        try:
+            _update_function_fingerprint(hasher, step.function)
+            find_source_file = getattr(self.data_manager, 'find_source_file', None)
+            
+            def unreceived_source_file(value: Any) -> Optional[Path]:
+                return None if id(value) in received else find_source_file(value)
+            
+            _update_fingerprint(
+                hasher, step_input,
+                unreceived_source_file if find_source_file is not None else None
+            )
+        except Exception as e:
+            logger.debug(f"Not caching step {step.name}: {e}")
+            return None
+        return hasher.hexdigest()
+    
+    def _load_cached_result(self, key: str) -> Any:
+        """Read a cached step result, or return ``_MISSING``."""
+        path = self.cache_dir / f"{key}.pkl"
+        try:
+            with open(path, 'rb') as f:
+                result = pickle.load(f)
+        except FileNotFoundError:
+            return _MISSING
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cached result {path.name}: {e}")
+            self._remove_cached_file(path)
+            return _MISSING
+        
+        # The file time orders entries for least-recently-used eviction
+        os.utime(path)
+        return result
+    
+    def _store_cached_result(self, key: str, result: Any) -> None:
+        """Write a step result or execution order to the cache, ignoring unpicklable values."""
+        path = self.cache_dir / f"{key}.pkl"
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+                    size = f.tell()
+                old_size = self._cached_file_size(path)
+                os.replace(tmp_name, path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except Exception as e:
+            logger.debug(f"Could not cache {key}: {e}")
+            return
+        
+        if self.cache_max_bytes is None:
+            return
+        with self._cache_lock:
+            if self._cache_bytes is None:
+                self._cache_bytes = self._scan_result_cache()[1]
+            else:
+                self._cache_bytes += size - old_size
+            over_limit = self._cache_bytes > self.cache_max_bytes
+        if over_limit:
+            self._prune_result_cache()
+    
+    @staticmethod
+    def _cached_file_size(path: Path) -> int:
+        """Return the size of a cache file, or 0 if it does not exist."""
+        try:
+            return path.stat().st_size
+        except OSError:
+            return 0
+    
+    def _remove_cached_file(self, path: Path) -> None:
+        """Delete a cache file and subtract it from the running cache size."""
+        size = self._cached_file_size(path)
+        path.unlink(missing_ok=True)
+        with self._cache_lock:
+            if self._cache_bytes is not None:
+                self._cache_bytes -= size
+    
+    def _scan_result_cache(self) -> Tuple[List[Tuple[float, int, Path]], int]:
+        """List the cached files as (mtime, size, path) and their total size."""
+        entries = []
+        for path in self.cache_dir.glob('*.pkl'):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        return entries, sum(size for _, size, _ in entries)
+    
+    def _prune_result_cache(self) -> None:
+        """Delete least recently used results above ``cache_max_bytes``.
+        
+        The directory is scanned again, which also corrects the running
+        size for files changed by other processes.
+        """
+        if self.cache_max_bytes is None:
+            return
+        
+        with self._cache_lock:
+            entries, total = self._scan_result_cache()
+            for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+                if total <= self.cache_max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+            self._cache_bytes = total
+    
     def get_pipeline_result(self, pipeline_name: str) -> Dict[str, Any]:
         """Get the final result data from a pipeline.
         
@@ -381,7 +967,7 @@ class PipelineManager(QObject):
         list
             List of pipeline steps.
         """
-        return self._pipelines.get(pipeline_name, []).copy()
+        return list(self._pipelines.get(pipeline_name, {}).values())
     
     def get_pipeline_names(self) -> List[str]:
         """Get names of all pipelines.
@@ -404,6 +990,7 @@ class PipelineManager(QObject):
         if pipeline_name in self._pipelines:
             self._pipelines[pipeline_name].clear()
             self._pipeline_data[pipeline_name].clear()
+            self._order_cache.pop(pipeline_name, None)
             logger.info(f"Cleared pipeline: {pipeline_name}")
     
     def delete_pipeline(self, pipeline_name: str) -> None:
@@ -417,4 +1004,5 @@ class PipelineManager(QObject):
         if pipeline_name in self._pipelines:
             del self._pipelines[pipeline_name]
             del self._pipeline_data[pipeline_name]
+            self._order_cache.pop(pipeline_name, None)
             logger.info(f"Deleted pipeline: {pipeline_name}")
\ No newline at end of file
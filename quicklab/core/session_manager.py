@@ -2,22 +2,263 @@
 
 This module handles saving and loading of QuickLab sessions, which include
 data objects, analysis results, and UI state.
+
+Sessions are stored in a single HDF5 file: session metadata in attributes of
+the root group and each data object in ``/data_objects/<data_id>``, with its
+samples in a compressed ``data`` dataset, optionally at reduced precision
+(see ``SessionManager.save_session``), its measurement info as FIF bytes and
+what else rebuilding it needs as JSON. Sessions saved to a ``.json`` path
+use the legacy layout of a JSON index plus one ``.fif`` file per data object.
 """
 
+import hashlib
 import json
-import pickle
-from typing import Dict, Any, Optional, List
+import tempfile
+import weakref
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Tuple
 from pathlib import Path
 from datetime import datetime
 
-import h5py
-import numpy as np
 from PyQt6.QtCore import QObject, pyqtSignal
 
+from .data_manager import DataKind, _infer_data_kind, _sample_checksum
 from ..utils.logger import get_logger
 
+try:
+    import orjson
+except ImportError:  # optional speed-up, installed with the ``fast`` extra
+    orjson = None
+
+# h5py and NumPy are imported where sessions are read or written, so that
+# importing this module (and starting the application) does not pay for them
+if TYPE_CHECKING:
+    import h5py
+    import numpy as np
+
 logger = get_logger(__name__)
 
+_SESSION_FORMAT = "quicklab-session"
+_SESSION_FORMAT_VERSION = 1
+_SAVE_PRECISIONS = ('full', 'fp32', 'fp16', 'bf16')
+
+
+def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON, using orjson when it is installed.
+    
+    Values JSON cannot represent are written as their ``str()``; orjson
+    writes NumPy arrays and scalars as numbers instead.
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=str, option=option)
+    return json.dumps(obj, indent=2 if indent else None, default=str).encode()
+
+
+def _json_loads(data: Any) -> Any:
+    """Parse JSON from ``str`` or ``bytes``, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _metadata_record(data_info: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert ``DataManager.get_data_info`` output to plain JSON-able types."""
+    return {**data_info, 'history': list(data_info.get('history', ()))}
+
+
+def _data_digest(data: 'np.ndarray') -> str:
+    """Return the SHA-256 of an array's dtype, shape and samples."""
+    import numpy as np
+    
+    data = np.ascontiguousarray(data)
+    hasher = hashlib.sha256(repr((data.dtype.str, data.shape)).encode())
+    hasher.update(memoryview(data))
+    return hasher.hexdigest()
+
+
+def _same_shape(data_info: Dict[str, Any], shape: Tuple[int, ...]) -> bool:
+    """Return whether stored samples of ``shape`` fit a data object's metadata."""
+    n_times = data_info.get('n_times')
+    return (len(shape) >= 2 and shape[-2] == data_info.get('n_channels')
+            and (n_times is None or shape[-1] == n_times))
+
+
+def _annotations_record(annotations: Any) -> Dict[str, Any]:
+    """Convert ``mne.Annotations`` to plain JSON-able types."""
+    orig_time = annotations.orig_time
+    return {
+        'onset': annotations.onset.tolist(),
+        'duration': annotations.duration.tolist(),
+        'description': annotations.description.tolist(),
+        'ch_names': [list(names) for names in annotations.ch_names],
+        'orig_time': None if orig_time is None else orig_time.isoformat(),
+    }
+
+
+def _rebuild_annotations(record: Dict[str, Any]) -> Any:
+    """Invert ``_annotations_record``."""
+    import mne
+    
+    orig_time = record['orig_time']
+    return mne.Annotations(
+        record['onset'], record['duration'], record['description'],
+        orig_time=None if orig_time is None else datetime.fromisoformat(orig_time),
+        ch_names=record['ch_names']
+    )
+
+
+def _baseline_record(baseline: Optional[Tuple[Any, Any]]) -> Optional[List[Any]]:
+    """Convert a baseline interval to a JSON-able list."""
+    if baseline is None:
+        return None
+    return [None if bound is None else float(bound) for bound in baseline]
+
+
+def _describe_data(data_obj: Any) -> Tuple[DataKind, Dict[str, Any]]:
+    """Return the kind of a data object and what rebuilding it needs.
+    
+    Besides the samples and ``info``, which are stored separately. The
+    returned values are plain JSON-able types.
+    
+    Raises
+    ------
+    ValueError
+        If the object is not a Raw, Epochs or Evoked instance.
+    """
+    kind = _infer_data_kind(data_obj)
+    if kind == DataKind.RAW:
+        extra = {'first_samp': int(data_obj.first_samp),
+                 'annotations': _annotations_record(data_obj.annotations)}
+    elif kind == DataKind.EPOCHS:
+        extra = {'events': data_obj.events.tolist(),
+                 'event_id': {name: int(code) for name, code in data_obj.event_id.items()},
+                 'tmin': float(data_obj.times[0]),
+                 'baseline': _baseline_record(data_obj.baseline)}
+    elif kind == DataKind.EVOKED:
+        extra = {'tmin': float(data_obj.times[0]), 'comment': data_obj.comment,
+                 'nave': int(data_obj.nave), 'kind': str(data_obj.kind),
+                 'baseline': _baseline_record(data_obj.baseline)}
+    else:
+        raise ValueError(f"Cannot store {type(data_obj).__name__} in a session")
+    return kind, extra
+
+
+def _rebuild_data(kind: DataKind, data: 'np.ndarray', info: Any,
+                  extra: Dict[str, Any]) -> Any:
+    """Recreate a data object described by ``_describe_data``."""
+    import mne
+    import numpy as np
+    
+    baseline = extra.get('baseline')
+    if baseline is not None:
+        baseline = tuple(baseline)
+    
+    if kind == DataKind.RAW:
+        raw = mne.io.RawArray(data, info, first_samp=extra['first_samp'], verbose=False)
+        raw.set_annotations(_rebuild_annotations(extra['annotations']))
+        return raw
+    if kind == DataKind.EPOCHS:
+        events = np.array(extra['events'], dtype=int).reshape(-1, 3)
+        return mne.EpochsArray(data, info, events=events, tmin=extra['tmin'],
+                               event_id=extra['event_id'], baseline=baseline,
+                               verbose=False)
+    return mne.EvokedArray(data, info, tmin=extra['tmin'], comment=extra['comment'],
+                           nave=extra['nave'], kind=extra['kind'],
+                           baseline=baseline, verbose=False)
+
+
+def _data_chunks(shape: Tuple[int, ...]) -> Optional[Tuple[int, ...]]:
+    """Return the HDF5 chunk shape for a data array of ``shape``.
+    
+    Chunks span up to 32 channels by 4096 samples (one epoch at a time for
+    epoched data), so reading a channel subset or a time window only
+    decompresses the chunks it touches. Returns None for empty arrays,
+    which cannot be chunked.
+    """
+    if not shape or 0 in shape:
+        return None
+    if len(shape) == 1:
+        return (min(shape[0], 4096),)
+    *leading, n_channels, n_times = shape
+    return (1,) * len(leading) + (min(n_channels, 32), min(n_times, 4096))
+
+
+def _channel_scale(data: 'np.ndarray') -> 'np.ndarray':
+    """Return per-channel factors mapping samples into [-32760, 32760].
+    
+    Channels are the second to last axis; 1-D data gets a single factor.
+    Flat channels get a factor of 1.
+    """
+    import numpy as np
+    
+    axes = tuple(i for i in range(data.ndim) if i != data.ndim - 2)
+    peak = np.max(np.abs(data), axis=axes or None, initial=0.0)
+    return np.where(peak > 0, peak / 32760, 1.0)
+
+
+def _encode_samples(data: 'np.ndarray',
+                    precision: str) -> Tuple['np.ndarray', Optional['np.ndarray']]:
+    """Convert samples to the stored representation for ``precision``.
+    
+    Returns the array to store and, for ``'fp16'``, the per-channel scale
+    that was divided out, since EEG amplitudes in volts fall below the
+    normal range of half precision. ``'bf16'`` is stored as the upper 16
+    bits of each float32, rounded to nearest even, as NumPy has no
+    bfloat16 type.
+    """
+    import numpy as np
+    
+    if precision == 'fp32':
+        return data.astype(np.float32), None
+    if precision == 'fp16':
+        scale = _channel_scale(data)
+        return (data / scale[..., np.newaxis]).astype(np.float16), scale
+    if precision == 'bf16':
+        bits = data.astype(np.float32).view(np.uint32)
+        bits = bits + (0x7FFF + ((bits >> 16) & 1)).astype(np.uint32)
+        return (bits >> 16).astype(np.uint16), None
+    return data, None
+
+
+def _decode_samples(stored: 'np.ndarray', precision: str,
+                    scale: Optional['np.ndarray'], dtype: str) -> 'np.ndarray':
+    """Invert ``_encode_samples``, returning samples of ``dtype``."""
+    import numpy as np
+    
+    if precision == 'bf16':
+        stored = (stored.astype(np.uint32) << 16).view(np.float32)
+    data = stored.astype(dtype)
+    if scale is not None:
+        data *= scale[..., np.newaxis]
+    return data
+
+
+def _info_bytes(info: Any) -> 'np.ndarray':
+    """Serialize measurement info as FIF into a byte array for an HDF5 dataset.
+    
+    MNE only writes and reads FIF through files, so this goes through a
+    temporary one.
+    """
+    import mne
+    import numpy as np
+    
+    with tempfile.TemporaryDirectory(prefix='quicklab_') as tmp_dir:
+        info_path = Path(tmp_dir) / 'info.fif'
+        mne.io.write_info(info_path, info)
+        return np.frombuffer(info_path.read_bytes(), dtype=np.uint8)
+
+
+def _read_info_bytes(dataset: 'h5py.Dataset') -> Any:
+    """Read measurement info stored with ``_info_bytes``."""
+    import mne
+    
+    with tempfile.TemporaryDirectory(prefix='quicklab_') as tmp_dir:
+        info_path = Path(tmp_dir) / 'info.fif'
+        info_path.write_bytes(dataset[()].tobytes())
+        return mne.io.read_info(info_path, verbose=False)
+
 
 class SessionManager(QObject):
     """Manages QuickLab sessions.
@@ -42,76 +283,69 @@ class SessionManager(QObject):
         super().__init__()
         self._current_session_path: Optional[Path] = None
         self._session_metadata: Dict[str, Any] = {}
+        # data_id -> (data object, sample checksum, SHA-256 of its samples)
+        self._digests: Dict[str, Tuple['weakref.ref[Any]', Optional[int], str]] = {}
         
         logger.info("SessionManager initialized")
     
     def save_session(self, 
                     session_path: Path,
                     data_manager,
-                    ui_state: Optional[Dict[str, Any]] = None) -> None:
+                    ui_state: Optional[Dict[str, Any]] = None,
+                    save_precision: str = 'full') -> None:
         """Save a QuickLab session.
         
         Parameters
         ----------
         session_path : Path
-            Path where to save the session.
+            Path where to save the session. Paths ending in ``.json`` are
+            saved in the legacy layout (JSON index and ``.fif`` files);
+            anything else is written as a single HDF5 file.
         data_manager : DataManager
             The data manager containing data objects.
         ui_state : dict, optional
             UI state information to save.
+        save_precision : {'full', 'fp32', 'fp16', 'bf16'}
+            Precision of the samples stored in an HDF5 session. ``'full'``
+            (default) stores them unchanged; the others trade precision for
+            smaller files that load faster, which is usually acceptable for
+            reviewing data. ``'fp16'`` scales each channel to its peak
+            amplitude first. Loading restores the original dtype. Ignored
+            for legacy JSON sessions.
             
         Raises
         ------
+        ValueError
+            If ``save_precision`` is not a supported precision.
         RuntimeError
             If session saving fails.
         """
         session_path = Path(session_path)
+        if save_precision not in _SAVE_PRECISIONS:
+            raise ValueError(
+                f"save_precision must be one of {_SAVE_PRECISIONS}, "
+                f"got {save_precision!r}"
+            )
         
         try:
             # Create session directory if it doesn't exist
             session_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Prepare session data
-            session_data = {
-                'metadata': {
-                    'quicklab_version': '0.1.0',
-                    'created_at': datetime.now().isoformat(),
-                    'data_objects': [],
-                    'ui_state': ui_state or {}
-                },
-                'data_objects': {},
-                'analysis_results': {}
+            metadata = {
+                'quicklab_version': '0.1.0',
+                'created_at': datetime.now().isoformat(),
+                'data_objects': [],
+                'ui_state': ui_state or {}
             }
             
-            # Save data objects
-            data_list = data_manager.get_data_list()
-            for data_id in data_list:
-                try:
-                    data_obj = data_manager.get_data(data_id)
-                    data_info = data_manager.get_data_info(data_id)
-                    
-                    # Save data object to separate file
-                    data_file = session_path.parent / f"{session_path.stem}_{data_id}.fif"
-                    data_obj.save(data_file, overwrite=True)
-                    
-                    # Store reference in session
-                    session_data['data_objects'][data_id] = {
-                        'file_path': str(data_file),
-                        'data_type': data_info['data_type'],
-                        'metadata': data_info
-                    }
-                    
-                    session_data['metadata']['data_objects'].append(data_id)
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to save data object {data_id}: {e}")
-            
-            # Save session file
-            with open(session_path, 'w') as f:
-                json.dump(session_data, f, indent=2, default=str)
+            if session_path.suffix.lower() == '.json':
+                self._save_json_session(session_path, data_manager, metadata)
+            else:
+                self._save_hdf5_session(session_path, data_manager, metadata,
+                                        save_precision)
             
             self._current_session_path = session_path
-            self._session_metadata = session_data['metadata']
+            self._session_metadata = metadata
             
             logger.info(f"Session saved: {session_path}")
             self.session_saved.emit(str(session_path))
@@ -120,6 +354,93 @@ class SessionManager(QObject):
             logger.error(f"Failed to save session: {e}")
             raise RuntimeError(f"Failed to save session: {e}") from e
     
+    def _save_hdf5_session(self, session_path: Path, data_manager,
+                           metadata: Dict[str, Any], precision: str) -> None:
+        """Write a session and its data objects into one HDF5 file."""
+        import h5py
+        
+        with h5py.File(session_path, 'w') as f:
+            objects = f.create_group('data_objects', track_order=True)
+            
+            for data_id in data_manager.get_data_list():
+                try:
+                    data_obj = data_manager.get_data(data_id)
+                    data_info = data_manager.get_data_info(data_id)
+                    kind, extra = _describe_data(data_obj)
+                    data = data_obj.get_data()
+                    digest = _data_digest(data)
+                    stored, scale = _encode_samples(data, precision)
+                    
+                    group = objects.create_group(data_id)
+                    chunks = _data_chunks(data.shape)
+                    # LZF compresses EEG samples nearly as well as gzip at a
+                    # fraction of the CPU cost
+                    dataset = group.create_dataset(
+                        'data', data=stored, chunks=chunks,
+                        compression='lzf' if chunks else None
+                    )
+                    dataset.attrs['precision'] = precision
+                    dataset.attrs['dtype_original'] = data.dtype.str
+                    if scale is not None:
+                        group.create_dataset('scale', data=scale)
+                    group.create_dataset('info', data=_info_bytes(data_obj.info))
+                    group.create_dataset('extra', data=_json_dumps(extra).decode())
+                    group.attrs['kind'] = int(kind)
+                    group.attrs['data_type'] = data_info['data_type']
+                    group.attrs['sha256'] = digest
+                    group.attrs['metadata'] = _json_dumps(
+                        _metadata_record(data_info)
+                    ).decode()
+                    
+                    metadata['data_objects'].append(data_id)
+                    self._remember_digest(data_id, data_obj, digest)
+                    
+                except Exception as e:
+                    logger.warning(f"Failed to save data object {data_id}: {e}")
+                    if data_id in objects:
+                        del objects[data_id]
+            
+            f.attrs['format'] = _SESSION_FORMAT
+            f.attrs['format_version'] = _SESSION_FORMAT_VERSION
+            f.attrs['quicklab_version'] = metadata['quicklab_version']
+            f.attrs['created_at'] = metadata['created_at']
+            f.attrs['ui_state'] = _json_dumps(metadata['ui_state']).decode()
+    
+    def _save_json_session(self, session_path: Path, data_manager,
+                           metadata: Dict[str, Any]) -> None:
+        """Write a legacy JSON session with one ``.fif`` file per data object."""
+        session_data = {
+            'metadata': metadata,
+            'data_objects': {},
+            'analysis_results': {}
+        }
+        
+        # Save data objects
+        for data_id in data_manager.get_data_list():
+            try:
+                data_obj = data_manager.get_data(data_id)
+                data_info = data_manager.get_data_info(data_id)
+                
+                # Save data object to separate file
+                data_file = session_path.parent / f"{session_path.stem}_{data_id}.fif"
+                data_obj.save(data_file, overwrite=True)
+                
+                # Store reference in session
+                session_data['data_objects'][data_id] = {
+                    'file_path': str(data_file),
+                    'data_type': data_info['data_type'],
+                    'metadata': _metadata_record(data_info)
+                }
+                
+                metadata['data_objects'].append(data_id)
+                
+            except Exception as e:
+                logger.warning(f"Failed to save data object {data_id}: {e}")
+        
+        # Save session file
+        with open(session_path, 'wb') as f:
+            f.write(_json_dumps(session_data, indent=True))
+    
     def load_session(self, 
                     session_path: Path,
                     data_manager) -> Dict[str, Any]:
@@ -128,9 +449,11 @@ class SessionManager(QObject):
         Parameters
         ----------
         session_path : Path
-            Path to the session file.
+            Path to the session file, in the HDF5 or the legacy JSON layout.
         data_manager : DataManager
-            The data manager to load data into.
+            The data manager to load data into. Its current data objects are
+            replaced by those of the session, except for data objects of an
+            HDF5 session that are already loaded with identical samples.
             
         Returns
         -------
@@ -150,40 +473,144 @@ class SessionManager(QObject):
             raise FileNotFoundError(f"Session file not found: {session_path}")
         
         try:
-            # Load session file
-            with open(session_path, 'r') as f:
-                session_data = json.load(f)
+            import h5py
             
-            # Clear existing data
-            data_manager.clear_all_data()
-            
-            # Load data objects
-            for data_id, data_info in session_data.get('data_objects', {}).items():
-                try:
-                    data_file = Path(data_info['file_path'])
-                    if data_file.exists():
-                        loaded_id = data_manager.load_data(data_file, data_id)
-                        logger.debug(f"Loaded data object: {loaded_id}")
-                    else:
-                        logger.warning(f"Data file not found: {data_file}")
-                        
-                except Exception as e:
-                    logger.warning(f"Failed to load data object {data_id}: {e}")
+            if h5py.is_hdf5(session_path):
+                metadata = self._load_hdf5_session(session_path, data_manager)
+            else:
+                metadata = self._load_json_session(session_path, data_manager)
             
             # Store session info
             self._current_session_path = session_path
-            self._session_metadata = session_data.get('metadata', {})
+            self._session_metadata = metadata
             
             logger.info(f"Session loaded: {session_path}")
             self.session_loaded.emit(str(session_path))
             
             # Return UI state
-            return session_data.get('metadata', {}).get('ui_state', {})
+            return metadata.get('ui_state', {})
             
         except Exception as e:
             logger.error(f"Failed to load session: {e}")
             raise RuntimeError(f"Failed to load session: {e}") from e
     
+    def _load_hdf5_session(self, session_path: Path, data_manager) -> Dict[str, Any]:
+        """Load an HDF5 session into the data manager and return its metadata."""
+        import h5py
+        
+        with h5py.File(session_path, 'r') as f:
+            stored = f['data_objects']
+            
+            # Keep data objects whose samples are unchanged instead of
+            # reading them again. Only objects whose type and shape match
+            # the stored ones are hashed at all
+            current = data_manager.get_data_list()
+            keep = set()
+            for data_id in current:
+                group = stored.get(data_id)
+                if group is None:
+                    continue
+                try:
+                    data_info = data_manager.get_data_info(data_id)
+                    if (data_info['data_type'] != group.attrs['data_type']
+                            or not _same_shape(data_info, group['data'].shape)):
+                        continue
+                    digest = self._data_object_digest(data_id, data_manager.get_data(data_id))
+                    if digest == group.attrs['sha256']:
+                        keep.add(data_id)
+                except Exception as e:
+                    logger.debug(f"Could not compare data object {data_id}: {e}")
+            data_manager.remove_many([data_id for data_id in current if data_id not in keep])
+            
+            # Load data objects
+            for data_id, group in stored.items():
+                if data_id in keep:
+                    logger.debug(f"Kept unchanged data object: {data_id}")
+                    continue
+                try:
+                    dataset = group['data']
+                    data = _decode_samples(
+                        dataset[()], dataset.attrs.get('precision', 'full'),
+                        group['scale'][()] if 'scale' in group else None,
+                        dataset.attrs.get('dtype_original', dataset.dtype.str)
+                    )
+                    data_obj = _rebuild_data(
+                        DataKind(int(group.attrs['kind'])), data,
+                        _read_info_bytes(group['info']), _json_loads(group['extra'][()])
+                    )
+                    record = _json_loads(group.attrs['metadata'])
+                    loaded_id = data_manager.add_data(
+                        data_obj, data_id, record.get('file_path') or None
+                    )
+                    logger.debug(f"Loaded data object: {loaded_id}")
+                except Exception as e:
+                    logger.warning(f"Failed to load data object {data_id}: {e}")
+            
+            return {
+                'quicklab_version': f.attrs.get('quicklab_version'),
+                'created_at': f.attrs.get('created_at'),
+                'data_objects': list(stored),
+                'ui_state': _json_loads(f.attrs.get('ui_state', '{}')),
+            }
+    
+    def _remember_digest(self, data_id: str, data_obj: Any, digest: str) -> None:
+        """Cache the SHA-256 of a data object's samples."""
+        digests = self._digests
+        
+        def drop(ref: 'weakref.ref[Any]') -> None:
+            # Forget the digest once the data object is garbage collected
+            if digests.get(data_id, (None,))[0] is ref:
+                del digests[data_id]
+        
+        try:
+            ref = weakref.ref(data_obj, drop)
+        except TypeError:
+            return  # Object does not support weak references
+        digests[data_id] = (ref, _sample_checksum(data_obj), digest)
+    
+    def _data_object_digest(self, data_id: str, data_obj: Any) -> str:
+        """Return the SHA-256 of a data object's samples, as ``_data_digest``.
+        
+        The digest cached when the object was last saved or compared is
+        reused while ``data_id`` still holds the same object (i.e. it was
+        not replaced through ``DataManager.update_data``) and its samples
+        still match the Adler-32 checksum recorded with it, which is far
+        cheaper to compute and also catches in-place changes.
+        """
+        entry = self._digests.get(data_id)
+        if entry is not None:
+            ref, checksum, digest = entry
+            if (ref() is data_obj and checksum is not None
+                    and _sample_checksum(data_obj) == checksum):
+                return digest
+        
+        digest = _data_digest(data_obj.get_data())
+        self._remember_digest(data_id, data_obj, digest)
+        return digest
+    
+    def _load_json_session(self, session_path: Path, data_manager) -> Dict[str, Any]:
+        """Load a legacy JSON session into the data manager and return its metadata."""
+        with open(session_path, 'rb') as f:
+            session_data = _json_loads(f.read())
+        
+        # Clear existing data
+        data_manager.clear_all_data()
+        
+        # Load data objects
+        for data_id, data_info in session_data.get('data_objects', {}).items():
+            try:
+                data_file = Path(data_info['file_path'])
+                if data_file.exists():
+                    loaded_id = data_manager.load_data(data_file, data_id)
+                    logger.debug(f"Loaded data object: {loaded_id}")
+                else:
+                    logger.warning(f"Data file not found: {data_file}")
+                    
+            except Exception as e:
+                logger.warning(f"Failed to load data object {data_id}: {e}")
+        
+        return session_data.get('metadata', {})
+    
     def get_current_session_path(self) -> Optional[Path]:
         """Get the path of the currently loaded session.
         
@@ -220,7 +647,7 @@ class SessionManager(QObject):
             'export_time': datetime.now().isoformat()
         }
         
-        with open(output_path, 'w') as f:
-            json.dump(summary, f, indent=2, default=str)
+        with open(output_path, 'wb') as f:
+            f.write(_json_dumps(summary, indent=True))
         
         logger.info(f"Session summary exported: {output_path}")
\ No newline at end of file
@@ -5,14 +5,8 @@ import logging
 from typing import Optional, List
 from pathlib import Path
 
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QIcon
-
-from .core.data_manager import DataManager
-from .core.event_system import EventSystem, EventType
-from .core.session_manager import SessionManager
-from .ui.main_window import MainWindow
+# The core systems and the UI stack are imported when the application is
+# created, so that ``--help`` and ``--version`` do not wait for them
 from .utils.logger import get_logger, setup_file_logging
 from .utils.error_handler import initialize_error_handling, error_boundary
 
@@ -29,11 +23,22 @@ class PyMNEStudioIDE:
     ----------
     app_args : list, optional
         Command line arguments to pass to QApplication.
+    restore_layout : bool, optional
+        Whether the main window restores the layout saved by the previous
+        session. Default is True.
     """
     
-    def __init__(self, app_args: Optional[List[str]] = None):
+    def __init__(self, app_args: Optional[List[str]] = None,
+                 restore_layout: bool = True):
         """Initialize the PyMNE Studio IDE."""
         try:
+            from PyQt6.QtWidgets import QApplication
+            
+            from .core.data_manager import DataManager
+            from .core.event_system import EventSystem
+            from .core.session_manager import SessionManager
+            from .ui.main_window import MainWindow
+            
             # Initialize error handling first
             self.error_handler = initialize_error_handling()
             
@@ -64,7 +69,8 @@ class PyMNEStudioIDE:
             self.main_window = MainWindow(
                 data_manager=self.data_manager,
                 event_system=self.event_system,
-                session_manager=self.session_manager
+                session_manager=self.session_manager,
+                restore_geometry=restore_layout
             )
             
             # Set up logging
@@ -85,6 +91,8 @@ class PyMNEStudioIDE:
     
     def _connect_core_systems(self) -> None:
         """Connect core systems together."""
+        from .core.event_system import EventType
+        
         # Connect data manager signals to event system
         self.data_manager.data_loaded.connect(
             lambda data_id, data_obj: self.event_system.publish_simple(
@@ -112,6 +120,14 @@ class PyMNEStudioIDE:
             )
         )
         
+        self.data_manager.data_batch_removed.connect(
+            lambda data_ids: self.event_system.publish_simple(
+                EventType.DATA_REMOVED,
+                "DataManager",
+                data_ids=data_ids
+            )
+        )
+        
         self.data_manager.active_data_changed.connect(
             lambda data_id: self.event_system.publish_simple(
                 EventType.ACTIVE_DATA_CHANGED,
@@ -178,64 +194,62 @@ class PyMNEStudioIDE:
         self.app.quit()
 
 
-def main() -> int:
-    """Main entry point for PyMNE Studio.
+def run_gui(data_file: Optional[str] = None, debug: bool = False,
+            restore_layout: bool = True) -> int:
+    """Start the PyMNE Studio GUI.
+    
+    Parameters
+    ----------
+    data_file : str, optional
+        Data file to load on startup.
+    debug : bool, optional
+        Whether to enable debug logging. Default is False.
+    restore_layout : bool, optional
+        Whether to restore the window layout saved by the previous session.
+        Default is True.
     
     Returns
     -------
     int
         Application exit code.
     """
-    # Parse command line arguments
-    import argparse
-    
-    parser = argparse.ArgumentParser(
-        description="PyMNE Studio: Advanced EEG/MEG Analysis IDE",
-        prog="pymne-studio"
-    )
-    
-    parser.add_argument(
-        "data_file",
-        nargs="?",
-        help="Data file to load on startup"
-    )
-    
-    parser.add_argument(
-        "--debug",
-        action="store_true",
-        help="Enable debug logging"
-    )
-    
-    parser.add_argument(
-        "--version",
-        action="version",
-        version="PyMNE Studio 0.1.0"
-    )
-    
-    args = parser.parse_args()
-    
     # Set up logging level
-    if args.debug:
+    if debug:
         logging.getLogger('quicklab').setLevel(logging.DEBUG)
     
     try:
         # Initialize and run application
-        app = PyMNEStudioIDE()
+        app = PyMNEStudioIDE(restore_layout=restore_layout)
         
         # Load data file if provided
-        if args.data_file:
+        if data_file:
             try:
-                app.load_data(args.data_file)
-                logger.info(f"Loaded data file: {args.data_file}")
+                app.load_data(data_file)
+                logger.info(f"Loaded data file: {data_file}")
             except Exception as e:
-                logger.error(f"Failed to load data file {args.data_file}: {e}")
+                logger.error(f"Failed to load data file {data_file}: {e}")
         
         return app.run()
-        
+    
     except Exception as e:
         logger.error(f"Fatal error: {e}")
         return 1
 
 
+def main() -> int:
+    """Main entry point for PyMNE Studio.
+    
+    Argument parsing is shared with the console entry point in
+    :mod:`quicklab.cli`.
+    
+    Returns
+    -------
+    int
+        Application exit code.
+    """
+    from .cli import main_gui
+    return main_gui()
+
+
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file
@@ -1,12 +1,13 @@
 """Main application window for QuickLab."""
 
 import sys
-from typing import Optional, Dict, Any
+from functools import partial
+from typing import Optional, Dict, Any, List, Mapping, Set, Tuple
 from pathlib import Path
 
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QMenuBar, QToolBar, QStatusBar, QDockWidget,
+    QMenu, QMenuBar, QToolBar, QStatusBar, QDockWidget,
     QFileDialog, QMessageBox, QApplication,
     QSplitter, QTabWidget
 )
@@ -24,6 +25,42 @@ from ..utils.error_handler import error_boundary, get_error_handler
 
 logger = get_logger(__name__)
 
+# Name filters of the data file dialogs
+_OPEN_FILTERS = (
+    "All Supported (*.fif *.edf *.bdf *.gdf *.set *.cnt *.vhdr)",
+    "FIF files (*.fif)",
+    "EDF files (*.edf)",
+    "BDF files (*.bdf)",
+    "GDF files (*.gdf)",
+    "EEGLAB files (*.set)",
+    "CNT files (*.cnt)",
+    "BrainVision files (*.vhdr)",
+    "All files (*.*)",
+)
+_SAVE_FILTERS = ("FIF files (*.fif)", "All files (*.*)")
+
+# Window layout settings live under this QSettings group
+_SETTINGS_GROUP = "MainWindow"
+
+_settings: Optional[QSettings] = None
+
+
+def _get_settings() -> QSettings:
+    """Get the application's QSettings store.
+    
+    The store is created on first use, once the application name and
+    organization have been set, and shared afterwards.
+    
+    Returns
+    -------
+    QSettings
+        The shared settings object.
+    """
+    global _settings
+    if _settings is None:
+        _settings = QSettings()
+    return _settings
+
 
 class MainWindow(QMainWindow, EventMixin):
     """Main application window for QuickLab.
@@ -41,6 +78,9 @@ class MainWindow(QMainWindow, EventMixin):
         The session management system.
     parent : QWidget, optional
         Parent widget.
+    restore_geometry : bool, optional
+        Whether to restore the window geometry and the dock and splitter
+        layout saved by the previous session. Default is True.
     """
     
     # Signals
@@ -50,7 +90,8 @@ class MainWindow(QMainWindow, EventMixin):
                  data_manager: DataManager,
                  event_system: EventSystem,
                  session_manager: SessionManager,
-                 parent: Optional[QWidget] = None):
+                 parent: Optional[QWidget] = None,
+                 restore_geometry: bool = True):
         """Initialize the MainWindow."""
         super().__init__(parent)
         EventMixin.__init__(self)
@@ -60,6 +101,7 @@ class MainWindow(QMainWindow, EventMixin):
         self.event_system = event_system
         self.session_manager = session_manager
         self.set_event_system(event_system)
+        self._restore_layout = restore_geometry
         
         # Window properties
         self.setWindowTitle("PyMNE Studio - EEG/MEG Analysis IDE")
@@ -67,18 +109,47 @@ class MainWindow(QMainWindow, EventMixin):
         self.resize(1600, 1000)
         
         # Settings
-        self.settings = QSettings()
+        self.settings = _get_settings()
         
-        # Initialize UI components
+        # File dialogs, created on first use and reused afterwards
+        self._open_dialog: Optional[QFileDialog] = None
+        self._save_dialog: Optional[QFileDialog] = None
+        # Data IDs of files opened from the File menu that are still loading
+        self._opening: Set[str] = set()
+        
+        # Initialize the window shell; the data browser, the docks and the
+        # signal connections are set up once it has been painted
         self._setup_ui()
         self._setup_menus()
         self._setup_toolbars()
         self._setup_status_bar()
+        self._restore_geometry()
+        QTimer.singleShot(0, self._deferred_init)
+        
+        logger.info("MainWindow initialized")
+    
+    def _deferred_init(self) -> None:
+        """Set up the parts of the window not needed for its first paint."""
+        # Data browser on the left
+        self.data_browser = DataBrowser(self.data_manager, self.event_system)
+        self.main_splitter.insertWidget(0, self.data_browser)
+        
+        # Set initial splitter sizes (20% for browser, 80% for content)
+        self.main_splitter.setSizes([200, 800])
+        
+        # Initialize dock manager
+        self.dock_manager = DockManager(self)
+        
         self._setup_dockable_modules()
         self._connect_signals()
         self._restore_settings()
         
-        logger.info("MainWindow initialized")
+        # Catch up with data loaded before the signals were connected
+        active_id, active_data = self.data_manager.get_active_data()
+        if active_data is not None:
+            self._on_data_loaded(active_id, active_data)
+        
+        logger.debug("MainWindow deferred initialization done")
     
     def _setup_ui(self) -> None:
         """Set up the main UI layout."""
@@ -90,24 +161,15 @@ class MainWindow(QMainWindow, EventMixin):
         layout = QVBoxLayout(central_widget)
         layout.setContentsMargins(0, 0, 0, 0)
         
-        # Create main splitter
+        # Create main splitter; the data browser is added on its left by
+        # _deferred_init
         self.main_splitter = QSplitter(Qt.Orientation.Horizontal)
         layout.addWidget(self.main_splitter)
         
-        # Data browser on the left
-        self.data_browser = DataBrowser(self.data_manager, self.event_system)
-        self.main_splitter.addWidget(self.data_browser)
-        
         # Main content area (will be populated with dockable modules)
         self.content_area = QWidget()
         self.content_layout = QVBoxLayout(self.content_area)
         self.main_splitter.addWidget(self.content_area)
-        
-        # Set initial splitter sizes (20% for browser, 80% for content)
-        self.main_splitter.setSizes([200, 800])
-        
-        # Initialize dock manager
-        self.dock_manager = DockManager(self)
     
     def _setup_menus(self) -> None:
         """Set up the application menus."""
@@ -172,11 +234,14 @@ class MainWindow(QMainWindow, EventMixin):
         # Tools menu
         tools_menu = menubar.addMenu("&Tools")
         
-        # Preprocessing submenu
-        preprocessing_menu = tools_menu.addMenu("&Preprocessing")
+        # Preprocessing and analysis submenus, filled when first shown
+        self.preprocessing_menu = tools_menu.addMenu("&Preprocessing")
+        self.preprocessing_menu.aboutToShow.connect(self._populate_preprocessing_menu_once)
+        self._preproc_populated = False
         
-        # Analysis submenu
-        analysis_menu = tools_menu.addMenu("&Analysis")
+        self.analysis_menu = tools_menu.addMenu("&Analysis")
+        self.analysis_menu.aboutToShow.connect(self._populate_analysis_menu_once)
+        self._analysis_populated = False
         
         # Help menu
         help_menu = menubar.addMenu("&Help")
@@ -220,129 +285,223 @@ class MainWindow(QMainWindow, EventMixin):
         self.status_bar.showMessage("Ready")
     
     def _setup_dockable_modules(self) -> None:
-        """Set up dockable analysis modules."""
-        # This will be implemented by the dock manager
-        # For now, we'll create placeholder docks
+        """Set up dockable analysis modules.
+        
+        Only the dock shells are created here. Each dock holds a light
+        placeholder until it is first shown, at which point its factory in
+        ``_dock_factories`` builds the real module widget.
+        """
+        self.eegplot_widget = None
+        self._pending_plot_data = None
+        self._dock_factories = {
+            'raw_viewer': self._build_raw_viewer,
+            'epochs_viewer': QWidget,  # Placeholder
+            'ica_viewer': QWidget,  # Placeholder
+            'preprocessing': QWidget,  # Placeholder
+        }
         
-        # Raw data viewer dock
-        raw_dock = QDockWidget("Raw Data Viewer", self)
-        raw_dock.setObjectName("RawDataViewer")
+        dock_specs = [
+            ('raw_viewer', "Raw Data Viewer", "RawDataViewer",
+             Qt.DockWidgetArea.TopDockWidgetArea),
+            ('epochs_viewer', "Epochs Viewer", "EpochsViewer",
+             Qt.DockWidgetArea.TopDockWidgetArea),
+            ('ica_viewer', "ICA Components", "ICAViewer",
+             Qt.DockWidgetArea.BottomDockWidgetArea),
+            ('preprocessing', "Preprocessing", "Preprocessing",
+             Qt.DockWidgetArea.RightDockWidgetArea),
+        ]
+        
+        # Store docks for later reference. Painting is suspended while they
+        # are added so the dock areas are laid out and repainted once.
+        self.docks = {}
+        self.setUpdatesEnabled(False)
+        try:
+            for name, title, object_name, area in dock_specs:
+                dock = QDockWidget(title, self)
+                dock.setObjectName(object_name)
+                dock.setWidget(QWidget())
+                dock.visibilityChanged.connect(
+                    lambda visible, key=name: visible and self._materialize_dock(key)
+                )
+                self.addDockWidget(area, dock)
+                self.docks[name] = dock
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
         
-        # Import and create the advanced EEG plot widget
+        # Add dock visibility actions to menu
+        for name, dock in self.docks.items():
+            action = dock.toggleViewAction()
+            self.modules_menu.addAction(action)
+    
+    def _materialize_dock(self, name: str) -> None:
+        """Build the module widget of a dock the first time it is shown.
+        
+        Parameters
+        ----------
+        name : str
+            Key of the dock in ``self.docks``.
+        """
+        factory = self._dock_factories.pop(name, None)
+        if factory is None:
+            return
+        
+        self.docks[name].setWidget(factory())
+        logger.debug("Materialized dock: %s", name)
+    
+    def _build_raw_viewer(self) -> QWidget:
+        """Create the raw data viewer and load any data that arrived first."""
         from ..visualization.raw_viewer.eegplot_adv import EEGPlotAdvanced
         self.eegplot_widget = EEGPlotAdvanced()
         self.eegplot_widget.set_event_system(self.event_system)
-        raw_dock.setWidget(self.eegplot_widget)
-        self.addDockWidget(Qt.DockWidgetArea.TopDockWidgetArea, raw_dock)
-        
-        # Epochs viewer dock
-        epochs_dock = QDockWidget("Epochs Viewer", self)
-        epochs_dock.setObjectName("EpochsViewer")
-        epochs_widget = QWidget()  # Placeholder
-        epochs_dock.setWidget(epochs_widget)
-        self.addDockWidget(Qt.DockWidgetArea.TopDockWidgetArea, epochs_dock)
-        
-        # ICA viewer dock
-        ica_dock = QDockWidget("ICA Components", self)
-        ica_dock.setObjectName("ICAViewer")
-        ica_widget = QWidget()  # Placeholder
-        ica_dock.setWidget(ica_widget)
-        self.addDockWidget(Qt.DockWidgetArea.BottomDockWidgetArea, ica_dock)
-        
-        # Preprocessing dock
-        preprocessing_dock = QDockWidget("Preprocessing", self)
-        preprocessing_dock.setObjectName("Preprocessing")
-        preprocessing_widget = QWidget()  # Placeholder
-        preprocessing_dock.setWidget(preprocessing_widget)
-        self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, preprocessing_dock)
-        
-        # Store docks for later reference
-        self.docks = {
-            'raw_viewer': raw_dock,
-            'epochs_viewer': epochs_dock,
-            'ica_viewer': ica_dock,
-            'preprocessing': preprocessing_dock,
-        }
         
         # Connect EEG plot widget signals
         self.eegplot_widget.time_selection_changed.connect(self._on_time_selection_changed)
         self.eegplot_widget.channel_selection_changed.connect(self._on_channel_selection_changed)
         
-        # Add dock visibility actions to menu
-        for name, dock in self.docks.items():
-            action = dock.toggleViewAction()
-            self.modules_menu.addAction(action)
+        if self._pending_plot_data is not None:
+            pending, self._pending_plot_data = self._pending_plot_data, None
+            self._load_into_plot(*pending)
+        
+        return self.eegplot_widget
+    
+    def _populate_preprocessing_menu_once(self) -> None:
+        """Fill the Preprocessing menu the first time it is shown."""
+        if self._preproc_populated or not hasattr(self, 'docks'):
+            return
+        
+        self._add_module_actions(self.preprocessing_menu, ['preprocessing'])
+        self._preproc_populated = True
+    
+    def _populate_analysis_menu_once(self) -> None:
+        """Fill the Analysis menu the first time it is shown."""
+        if self._analysis_populated or not hasattr(self, 'docks'):
+            return
+        
+        self._add_module_actions(self.analysis_menu, ['epochs_viewer', 'ica_viewer'])
+        self._analysis_populated = True
+    
+    def _add_module_actions(self, menu: QMenu, dock_names: List[str]) -> None:
+        """Add actions opening the given dockable modules to a menu."""
+        for name in dock_names:
+            dock = self.docks[name]
+            action = menu.addAction(dock.windowTitle())
+            action.triggered.connect(partial(self._show_dock, name))
+    
+    def _show_dock(self, name: str, checked: bool = False) -> None:
+        """Show a dockable module and bring it to the front."""
+        dock = self.docks[name]
+        dock.show()
+        dock.raise_()
     
     def _connect_signals(self) -> None:
         """Connect signals and slots."""
-        # Data manager signals
-        self.data_manager.data_loaded.connect(self._on_data_loaded)
+        # Data manager signals. Changes, removals and the active data reach
+        # the window through the data browser's debounced summary; changes
+        # are also seen directly to drop the status bar's cached info.
+        self.data_manager.data_loaded_batch.connect(self._on_data_loaded_batch)
+        self.data_browser.summary_changed.connect(self._on_summary_changed)
+        self.data_manager.data_load_failed.connect(self._on_data_load_failed)
+        self.data_manager.data_saved.connect(self._on_data_saved)
+        self.data_manager.data_save_failed.connect(self._on_data_save_failed)
         self.data_manager.data_changed.connect(self._on_data_changed)
-        self.data_manager.data_removed.connect(self._on_data_removed)
-        self.data_manager.active_data_changed.connect(self._on_active_data_changed)
         
         # Event system subscription
         self.subscribe_to_event(EventType.ANALYSIS_STARTED, self._on_analysis_started)
         self.subscribe_to_event(EventType.ANALYSIS_COMPLETED, self._on_analysis_completed)
         self.subscribe_to_event(EventType.ANALYSIS_FAILED, self._on_analysis_failed)
+        
+        # Memory usage is refreshed when it is likely to have changed
+        for event_type in (EventType.DATA_LOADED, EventType.DATA_REMOVED,
+                           EventType.ANALYSIS_COMPLETED):
+            self.subscribe_to_event(event_type, self._on_memory_event)
     
-    def _restore_settings(self) -> None:
-        """Restore window settings from previous session."""
-        # Restore geometry
-        geometry = self.settings.value("geometry")
+    def _restore_geometry(self) -> None:
+        """Restore the window geometry from the previous session."""
+        if not self._restore_layout:
+            return
+        
+        self.settings.beginGroup(_SETTINGS_GROUP)
+        try:
+            geometry = self.settings.value("geometry")
+        finally:
+            self.settings.endGroup()
+        
         if geometry:
             self.restoreGeometry(geometry)
+    
+    def _restore_settings(self) -> None:
+        """Restore the dock and splitter layout from the previous session."""
+        if not self._restore_layout:
+            return
+        
+        self.settings.beginGroup(_SETTINGS_GROUP)
+        try:
+            state = self.settings.value("windowState")
+            splitter_state = self.settings.value("splitterState")
+        finally:
+            self.settings.endGroup()
         
         # Restore window state (docks, toolbars)
-        state = self.settings.value("windowState")
         if state:
             self.restoreState(state)
         
         # Restore splitter state
-        splitter_state = self.settings.value("splitterState")
         if splitter_state:
             self.main_splitter.restoreState(splitter_state)
     
     def _save_settings(self) -> None:
-        """Save window settings."""
-        self.settings.setValue("geometry", self.saveGeometry())
-        self.settings.setValue("windowState", self.saveState())
-        self.settings.setValue("splitterState", self.main_splitter.saveState())
+        """Save window settings.
+        
+        Values identical to the stored ones are not written again, and the
+        store is synced once at the end.
+        """
+        values = {"geometry": self.saveGeometry()}
+        # Closed before the docks existed; keep the saved layout
+        if hasattr(self, 'data_browser'):
+            values["windowState"] = self.saveState()
+            values["splitterState"] = self.main_splitter.saveState()
+        
+        self.settings.beginGroup(_SETTINGS_GROUP)
+        try:
+            for key, value in values.items():
+                if self.settings.value(key) != value:
+                    self.settings.setValue(key, value)
+        finally:
+            self.settings.endGroup()
+        self.settings.sync()
     
     @error_boundary("MainWindow", show_dialog=True)
     def _open_data_file(self) -> None:
         """Open a data file dialog and load the selected file."""
         try:
-            file_dialog = QFileDialog(self)
-            file_dialog.setWindowTitle("Open Data File")
-            file_dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
-            
-            # Set file filters for supported formats
-            filters = [
-                "All Supported (*.fif *.edf *.bdf *.gdf *.set *.cnt *.vhdr)",
-                "FIF files (*.fif)",
-                "EDF files (*.edf)",
-                "BDF files (*.bdf)",
-                "GDF files (*.gdf)",
-                "EEGLAB files (*.set)",
-                "CNT files (*.cnt)",
-                "BrainVision files (*.vhdr)",
-                "All files (*.*)"
-            ]
-            file_dialog.setNameFilters(filters)
+            file_dialog = self._open_dialog
+            if file_dialog is None:
+                file_dialog = self._open_dialog = QFileDialog(self)
+                file_dialog.setWindowTitle("Open Data File")
+                file_dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+                file_dialog.setNameFilters(list(_OPEN_FILTERS))
+                
+                # Start where the last file was opened instead of the cwd
+                last_dir = self.settings.value("lastOpenDir")
+                if last_dir:
+                    file_dialog.setDirectory(last_dir)
             
             if file_dialog.exec() == QFileDialog.DialogCode.Accepted:
                 file_path = file_dialog.selectedFiles()[0]
+                self.settings.setValue("lastOpenDir", str(Path(file_path).parent))
+                # The file is read on a worker thread; the result arrives
+                # through data_loaded_batch or data_load_failed
                 error_handler = get_error_handler()
                 data_id = error_handler.safe_execute(
-                    self.data_manager.load_data, file_path,
+                    self.data_manager.load_data_async, file_path,
                     module_name="DataManager",
                     context=f"Loading {file_path}"
                 )
                 
                 if data_id:
-                    self.status_bar.showMessage(f"Loaded data: {data_id}", 3000)
-                    logger.info(f"Loaded data file: {file_path}")
+                    self._opening.add(data_id)
+                    self.status_bar.showMessage(f"Loading {Path(file_path).name}...")
                 else:
                     self.status_bar.showMessage("Failed to load data file", 5000)
                     
@@ -359,27 +518,32 @@ class MainWindow(QMainWindow, EventMixin):
                 QMessageBox.information(self, "No Data", "No data to save.")
                 return
             
-            file_dialog = QFileDialog(self)
-            file_dialog.setWindowTitle("Save Data File")
-            file_dialog.setFileMode(QFileDialog.FileMode.AnyFile)
-            file_dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptSave)
-            file_dialog.setDefaultSuffix("fif")
-            
-            filters = ["FIF files (*.fif)", "All files (*.*)"]
-            file_dialog.setNameFilters(filters)
+            file_dialog = self._save_dialog
+            if file_dialog is None:
+                file_dialog = self._save_dialog = QFileDialog(self)
+                file_dialog.setWindowTitle("Save Data File")
+                file_dialog.setFileMode(QFileDialog.FileMode.AnyFile)
+                file_dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptSave)
+                file_dialog.setDefaultSuffix("fif")
+                file_dialog.setNameFilters(list(_SAVE_FILTERS))
+                
+                last_dir = self.settings.value("lastOpenDir")
+                if last_dir:
+                    file_dialog.setDirectory(last_dir)
             
             if file_dialog.exec() == QFileDialog.DialogCode.Accepted:
                 file_path = file_dialog.selectedFiles()[0]
+                # Written on a worker thread; the result arrives through
+                # data_saved or data_save_failed
                 error_handler = get_error_handler()
-                success = error_handler.safe_execute(
-                    self.data_manager.save_data, active_id, file_path, overwrite=True,
+                started = error_handler.safe_execute(
+                    self.data_manager.save_data_async, active_id, file_path, overwrite=True,
                     module_name="DataManager",
                     context=f"Saving to {file_path}"
                 )
                 
-                if success:
-                    self.status_bar.showMessage(f"Saved data: {active_id}", 3000)
-                    logger.info(f"Saved data to: {file_path}")
+                if started:
+                    self.status_bar.showMessage(f"Saving {active_id}...")
                 else:
                     self.status_bar.showMessage("Failed to save data file", 5000)
                     
@@ -404,6 +568,9 @@ class MainWindow(QMainWindow, EventMixin):
     
     def _reset_layout(self) -> None:
         """Reset the window layout to default."""
+        if not hasattr(self, 'data_browser'):
+            return
+        
         # Reset dock positions
         for dock in self.docks.values():
             dock.setVisible(True)
@@ -427,55 +594,108 @@ class MainWindow(QMainWindow, EventMixin):
     
     # Event handling methods
     @error_boundary("MainWindow", show_dialog=False)
+    def _on_data_loaded_batch(self, loaded: List[Tuple[str, Any]]) -> None:
+        """Handle a batch of data loaded events.
+        
+        Only the most recently loaded data is shown, so loading many files
+        updates the plot widget once.
+        """
+        opened = [data_id for data_id, _ in loaded if data_id in self._opening]
+        if opened:
+            self._opening.difference_update(opened)
+            self.status_bar.showMessage(f"Loaded data: {opened[-1]}", 3000)
+            logger.info("Loaded data file(s): %s", ", ".join(opened))
+        
+        if loaded:
+            self._on_data_loaded(*loaded[-1])
+    
+    def _on_data_load_failed(self, data_id: str, message: str) -> None:
+        """Handle a failed background load."""
+        if data_id in self._opening:
+            self._opening.discard(data_id)
+            self.status_bar.showMessage("Failed to load data file", 5000)
+    
+    def _on_data_saved(self, data_id: str, file_path: str) -> None:
+        """Handle a completed background save."""
+        self.status_bar.showMessage(f"Saved data: {data_id}", 3000)
+        logger.info("Saved data to: %s", file_path)
+    
+    def _on_data_save_failed(self, data_id: str, message: str) -> None:
+        """Handle a failed background save."""
+        self.status_bar.showMessage("Failed to save data file", 5000)
+    
     def _on_data_loaded(self, data_id: str, data_obj: Any) -> None:
         """Handle data loaded event."""
+        if not hasattr(self, 'data_browser'):
+            return
         try:
-            self.save_action.setEnabled(True)
-            
-            # Update status widget with error handling
-            error_handler = get_error_handler()
-            error_handler.safe_execute(
-                self.status_widget.update_data_info, data_id, data_obj,
-                module_name="StatusWidget",
-                context="Updating data info"
-            )
-            
             # Load data into EEG plot widget if it's Raw data
             if hasattr(data_obj, 'info') and hasattr(data_obj, 'get_data'):
-                success = error_handler.safe_execute(
-                    self.eegplot_widget.load_data, data_obj,
-                    module_name="EEGPlotWidget",
-                    context=f"Loading data {data_id}"
-                )
-                
-                if success:
-                    logger.info(f"Loaded data into EEG plot widget: {data_id}")
+                if self.eegplot_widget is None:
+                    # The viewer loads it when its dock is first shown
+                    self._pending_plot_data = (data_id, data_obj)
                 else:
-                    logger.warning(f"Failed to load data into EEG widget: {data_id}")
+                    self._load_into_plot(data_id, data_obj)
             
-            logger.debug(f"UI updated for loaded data: {data_id}")
+            logger.debug("UI updated for loaded data: %s", data_id)
             
         except Exception as e:
             error_handler = get_error_handler()
             error_handler.handle_module_error("MainWindow", e, f"Handling data loaded event for {data_id}")
     
+    def _load_into_plot(self, data_id: str, data_obj: Any) -> None:
+        """Load data into the EEG plot widget."""
+        error_handler = get_error_handler()
+        success = error_handler.safe_execute(
+            self.eegplot_widget.load_data, data_obj,
+            module_name="EEGPlotWidget",
+            context=f"Loading data {data_id}"
+        )
+        
+        if success:
+            logger.info(f"Loaded data into EEG plot widget: {data_id}")
+        else:
+            logger.warning(f"Failed to load data into EEG widget: {data_id}")
+    
     def _on_data_changed(self, data_id: str, data_obj: Any) -> None:
-        """Handle data changed event."""
-        self.status_widget.update_data_info(data_id, data_obj)
-        logger.debug(f"UI updated for changed data: {data_id}")
-    
-    def _on_data_removed(self, data_id: str) -> None:
-        """Handle data removed event."""
-        if not self.data_manager.get_data_list():
-            self.save_action.setEnabled(False)
-        logger.debug(f"UI updated for removed data: {data_id}")
-    
-    def _on_active_data_changed(self, data_id: str) -> None:
-        """Handle active data changed event."""
-        active_id, active_data = self.data_manager.get_active_data()
-        if active_data:
-            self.status_widget.update_data_info(active_id, active_data)
-        logger.debug(f"UI updated for active data change: {data_id}")
+        """Handle data changed signal.
+        
+        Parameters
+        ----------
+        data_id : str
+            The data identifier.
+        data_obj : Any
+            The changed data object.
+        """
+        # The object may have been modified in place
+        self.status_widget.invalidate_data_info(data_obj)
+    
+    def _on_summary_changed(self, n_data: int, active_id: Optional[str],
+                            active_info: Optional[Mapping[str, Any]]) -> None:
+        """Handle a data browser summary update.
+        
+        Parameters
+        ----------
+        n_data : int
+            Number of loaded data objects.
+        active_id : str or None
+            Identifier of the active data, if any.
+        active_info : Mapping or None
+            Metadata of the active data, if any.
+        """
+        self.save_action.setEnabled(n_data > 0)
+        
+        if active_id is None:
+            self.status_widget.clear_data_info()
+        else:
+            _, active_data = self.data_manager.get_active_data()
+            error_handler = get_error_handler()
+            error_handler.safe_execute(
+                self.status_widget.update_data_info, active_id, active_data,
+                module_name="StatusWidget",
+                context="Updating data info"
+            )
+        logger.debug("UI updated for %d data objects, active: %s", n_data, active_id)
     
     def _on_analysis_started(self, event) -> None:
         """Handle analysis started event."""
@@ -491,11 +711,15 @@ class MainWindow(QMainWindow, EventMixin):
         self.status_bar.showMessage(f"Analysis failed: {error_msg}", 5000)
         QMessageBox.warning(self, "Analysis Failed", f"Analysis failed:\n{error_msg}")
     
+    def _on_memory_event(self, event) -> None:
+        """Refresh the memory usage after an event that changes it."""
+        self.status_widget.refresh_memory()
+    
     def _on_time_selection_changed(self, time_range: tuple) -> None:
         """Handle time selection changes from EEG plot widget."""
         start_time, end_time = time_range
         self.status_bar.showMessage(f"Time selection: {start_time:.2f}s - {end_time:.2f}s", 3000)
-        logger.debug(f"Time selection changed: {start_time:.2f}s - {end_time:.2f}s")
+        logger.debug("Time selection changed: %.2fs - %.2fs", start_time, end_time)
     
     def _on_channel_selection_changed(self, channels: list) -> None:
         """Handle channel selection changes from EEG plot widget."""
@@ -503,7 +727,7 @@ class MainWindow(QMainWindow, EventMixin):
             self.status_bar.showMessage(f"Selected {len(channels)} channel(s): {', '.join(channels[:3])}{'...' if len(channels) > 3 else ''}", 3000)
         else:
             self.status_bar.showMessage("No channels selected", 2000)
-        logger.debug(f"Channel selection changed: {channels}")
+        logger.debug("Channel selection changed: %s", channels)
     
     def closeEvent(self, event) -> None:
         """Handle window close event."""
@@ -1,12 +1,15 @@
 """Data browser widget for QuickLab."""
 
-from typing import Optional, Dict, Any
+from collections import defaultdict
+from typing import Optional, Dict, Any, List, Mapping, Sequence, Tuple
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTreeWidget, QTreeWidgetItem,
-    QLabel, QPushButton, QMenu, QMessageBox
+    QWidget, QVBoxLayout, QHBoxLayout, QTreeView,
+    QLabel, QPushButton, QMenu, QMessageBox, QHeaderView
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QAction, QContextMenuEvent
+from PyQt6.QtCore import (
+    Qt, QAbstractTableModel, QModelIndex, QTimer, pyqtSignal
+)
+from PyQt6.QtGui import QAction, QContextMenuEvent, QFont
 
 from ...core.data_manager import DataManager
 from ...core.event_system import EventSystem, EventType, EventMixin
@@ -14,6 +17,158 @@ from ...utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Info panel and properties dialog texts, filled from get_data_info fields
+_INFO_HTML = (
+    "<b>{data_id}</b><br>"
+    "Type: {data_type}<br>"
+    "Channels: {n_channels}<br>"
+    "Sampling Rate: {sampling_rate} Hz<br>"
+    "Modified: {modified_str}"
+)
+_PROPERTIES_TEXT = (
+    "Data ID: {data_id}\n"
+    "Type: {data_type}\n"
+    "File: {file_path}\n"
+    "Channels: {n_channels}\n"
+    "Sampling Rate: {sampling_rate} Hz\n"
+    "Time Points: {n_times}\n"
+    "Loaded: {loaded_at}\n"
+    "Modified: {modified_str}\n"
+)
+
+
+def _info_fields(data_id: str, data_info: Mapping[str, Any]) -> Dict[str, Any]:
+    """Return the fields of a data info mapping for the text templates.
+    
+    Missing and None fields read as 'N/A'.
+    """
+    fields = defaultdict(lambda: 'N/A', {
+        key: value for key, value in data_info.items() if value is not None
+    })
+    fields['data_id'] = data_id
+    fields['modified_str'] = 'Yes' if data_info.get('modified', False) else 'No'
+    return fields
+
+
+class _DataTableModel(QAbstractTableModel):
+    """Table model holding one row of column texts per data object.
+    
+    Rows are kept in the order the data objects were added. The active data
+    object's row is shown in bold, and the data ID of a row is available
+    through ``Qt.ItemDataRole.UserRole``.
+    
+    Parameters
+    ----------
+    parent : QObject, optional
+        Parent object.
+    """
+    
+    HEADERS = ("Name", "Type", "Channels", "Time Points")
+    
+    def __init__(self, parent=None):
+        """Initialize the model."""
+        super().__init__(parent)
+        self._rows: List[Tuple[str, ...]] = []
+        self._row_of: Dict[str, int] = {}
+        self._active_id: Optional[str] = None
+        self._bold = QFont()
+        self._bold.setBold(True)
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return the number of data objects."""
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return the number of columns."""
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """Return the text, data ID or font of a cell."""
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return row[index.column()]
+        if role == Qt.ItemDataRole.UserRole:
+            return row[0]
+        if role == Qt.ItemDataRole.FontRole and row[0] == self._active_id:
+            return self._bold
+        return None
+    
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """Return the column titles."""
+        if (orientation == Qt.Orientation.Horizontal
+                and role == Qt.ItemDataRole.DisplayRole):
+            return self.HEADERS[section]
+        return None
+    
+    def ids(self) -> List[str]:
+        """Return the data IDs of all rows."""
+        return list(self._row_of)
+    
+    def set_row(self, texts: Sequence[str]) -> None:
+        """Add the row of a data object, or update its changed cells.
+        
+        Parameters
+        ----------
+        texts : sequence of str
+            Column texts, starting with the data ID.
+        """
+        texts = tuple(texts)
+        row = self._row_of.get(texts[0])
+        if row is None:
+            row = len(self._rows)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._rows.append(texts)
+            self._row_of[texts[0]] = row
+            self.endInsertRows()
+            return
+        
+        old = self._rows[row]
+        if old == texts:
+            return
+        self._rows[row] = texts
+        changed = [col for col, (a, b) in enumerate(zip(old, texts)) if a != b]
+        self.dataChanged.emit(self.index(row, changed[0]), self.index(row, changed[-1]))
+    
+    def remove_row(self, data_id: str) -> None:
+        """Remove the row of a data object, if present."""
+        row = self._row_of.pop(data_id, None)
+        if row is None:
+            return
+        
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        for later in range(row, len(self._rows)):
+            self._row_of[self._rows[later][0]] = later
+        self.endRemoveRows()
+    
+    def active_id(self) -> Optional[str]:
+        """Return the data ID of the row shown in bold."""
+        return self._active_id
+    
+    def set_active(self, data_id: Optional[str]) -> bool:
+        """Show the row of the given data object in bold.
+        
+        Returns
+        -------
+        bool
+            Whether the active data object changed.
+        """
+        if data_id == self._active_id:
+            return False
+        
+        old, self._active_id = self._active_id, data_id
+        for key in (old, data_id):
+            row = self._row_of.get(key) if key else None
+            if row is not None:
+                self.dataChanged.emit(
+                    self.index(row, 0), self.index(row, len(self.HEADERS) - 1),
+                    [Qt.ItemDataRole.FontRole]
+                )
+        return True
+
 
 class DataBrowser(QWidget, EventMixin):
     """Data browser widget for managing loaded data objects.
@@ -34,10 +189,15 @@ class DataBrowser(QWidget, EventMixin):
     -------
     data_selected : str
         Emitted when a data object is selected (data_id).
+    summary_changed : int, object, object
+        Emitted once per burst of data manager notifications with the
+        number of data objects and the ID and info mapping of the active
+        one (count, active_id, active_info), both None if there is none.
     """
     
     # Signals
     data_selected = pyqtSignal(str)
+    summary_changed = pyqtSignal(int, object, object)
     
     def __init__(self, 
                  data_manager: DataManager,
@@ -51,9 +211,23 @@ class DataBrowser(QWidget, EventMixin):
         self.event_system = event_system
         self.set_event_system(event_system)
         
+        # Rows by data ID, updated one by one as data changes
+        self._model = _DataTableModel(self)
+        
+        # Coalesces the summary updates of bursts of data manager signals
+        # into one per event loop iteration
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._update_summary)
+        
         self._setup_ui()
         self._connect_signals()
         
+        # Show data loaded before the browser was created
+        if self.data_manager.get_data_list():
+            self._refresh_data_list()
+        
         logger.debug("DataBrowser initialized")
     
     def _setup_ui(self) -> None:
@@ -77,91 +251,130 @@ class DataBrowser(QWidget, EventMixin):
         layout.addLayout(header_layout)
         
         # Data tree
-        self.data_tree = QTreeWidget()
-        self.data_tree.setHeaderLabels(["Name", "Type", "Channels", "Time Points"])
+        self.data_tree = QTreeView()
+        self.data_tree.setModel(self._model)
         self.data_tree.setRootIsDecorated(False)
+        self.data_tree.setUniformRowHeights(True)
         self.data_tree.setAlternatingRowColors(True)
-        self.data_tree.itemClicked.connect(self._on_item_clicked)
-        self.data_tree.itemDoubleClicked.connect(self._on_item_double_clicked)
+        # Qt keeps the columns fitted to their contents as rows change
+        header = self.data_tree.header()
+        for col in range(self._model.columnCount()):
+            header.setSectionResizeMode(col, QHeaderView.ResizeMode.ResizeToContents)
+        self.data_tree.clicked.connect(self._on_item_clicked)
+        self.data_tree.doubleClicked.connect(self._on_item_double_clicked)
         self.data_tree.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.data_tree.customContextMenuRequested.connect(self._show_context_menu)
         
         layout.addWidget(self.data_tree)
         
+        self._setup_context_menu()
+        
         # Info panel
         self.info_label = QLabel("No data loaded")
         self.info_label.setWordWrap(True)
         self.info_label.setStyleSheet("padding: 5px; background-color: #f0f0f0; border: 1px solid #ccc;")
         layout.addWidget(self.info_label)
     
+    def _setup_context_menu(self) -> None:
+        """Build the context menu for data operations.
+        
+        The menu is built once; each action stores its handler, which is
+        called with the data ID of the item the menu was opened on.
+        """
+        self._context_menu = QMenu(self)
+        self._context_target: Optional[str] = None
+        
+        # Set as active action
+        set_active_action = self._context_menu.addAction("Set as Active")
+        set_active_action.setData(self._set_active_data)
+        
+        self._context_menu.addSeparator()
+        
+        # View properties action
+        properties_action = self._context_menu.addAction("Properties...")
+        properties_action.setData(self._show_properties)
+        
+        # Export action
+        export_action = self._context_menu.addAction("Export...")
+        export_action.setData(self._export_data)
+        
+        self._context_menu.addSeparator()
+        
+        # Remove action
+        remove_action = self._context_menu.addAction("Remove")
+        remove_action.setData(self._remove_data)
+        
+        self._context_menu.triggered.connect(self._on_context_action)
+    
     def _connect_signals(self) -> None:
         """Connect signals and slots."""
         # Data manager signals
-        self.data_manager.data_loaded.connect(self._on_data_loaded)
+        self.data_manager.data_loaded_batch.connect(self._on_data_loaded_batch)
         self.data_manager.data_changed.connect(self._on_data_changed)
         self.data_manager.data_removed.connect(self._on_data_removed)
+        self.data_manager.data_batch_removed.connect(self._on_data_batch_removed)
         self.data_manager.active_data_changed.connect(self._on_active_data_changed)
     
     def _refresh_data_list(self) -> None:
-        """Refresh the data list display."""
-        self.data_tree.clear()
-        
-        data_list = self.data_manager.get_data_list()
+        """Synchronize the tree with all data objects of the data manager."""
+        table = self.data_manager.get_data_table()
         active_id, _ = self.data_manager.get_active_data()
         
-        for data_id in data_list:
-            try:
-                data_obj = self.data_manager.get_data(data_id)
-                data_info = self.data_manager.get_data_info(data_id)
-                
-                # Create tree item
-                item = QTreeWidgetItem([
-                    data_id,
-                    data_info.get('data_type', 'Unknown'),
-                    str(data_info.get('n_channels', 'N/A')),
-                    str(data_info.get('n_times', 'N/A'))
-                ])
-                
-                # Store data ID in item
-                item.setData(0, Qt.ItemDataRole.UserRole, data_id)
-                
-                # Highlight active data
-                if data_id == active_id:
-                    font = item.font(0)
-                    font.setBold(True)
-                    for col in range(self.data_tree.columnCount()):
-                        item.setFont(col, font)
-                
-                self.data_tree.addTopLevelItem(item)
-                
-            except Exception as e:
-                logger.error(f"Error adding data item {data_id}: {e}")
+        for data_id in set(self._model.ids()).difference(table[0]):
+            self._model.remove_row(data_id)
+        for row in zip(*table):
+            self._model.set_row(row)
+        self._model.set_active(active_id)
         
-        # Resize columns to content
-        for col in range(self.data_tree.columnCount()):
-            self.data_tree.resizeColumnToContents(col)
-        
-        # Update info panel
-        if data_list:
-            self.info_label.setText(f"Loaded {len(data_list)} data object(s)")
+        self._refresh_timer.start()
+    
+    def _update_summary(self) -> None:
+        """Update the info panel and emit ``summary_changed``."""
+        n_data = self._model.rowCount()
+        if n_data:
+            self.info_label.setText(f"Loaded {n_data} data object(s)")
         else:
             self.info_label.setText("No data loaded")
+        
+        active_id = self._model.active_id()
+        active_info = None
+        if active_id is not None:
+            try:
+                active_info = self.data_manager.get_data_info(active_id)
+            except KeyError:
+                active_id = None
+        self.summary_changed.emit(n_data, active_id, active_info)
+    
+    def _item_texts(self, data_id: str) -> Tuple[str, ...]:
+        """Return the column texts of a data object's row."""
+        data_info = self.data_manager.get_data_info(data_id)
+        n_channels = data_info.get('n_channels')
+        n_times = data_info.get('n_times')
+        return (
+            data_id,
+            data_info.get('data_type', 'Unknown'),
+            'N/A' if n_channels is None else str(n_channels),
+            'N/A' if n_times is None else str(n_times)
+        )
     
-    def _on_item_clicked(self, item: QTreeWidgetItem, column: int) -> None:
+    def _update_item(self, data_id: str) -> None:
+        """Add the row of a data object, or update its changed cells."""
+        try:
+            self._model.set_row(self._item_texts(data_id))
+        except Exception as e:
+            logger.error(f"Error updating data item {data_id}: {e}")
+    
+    def _on_item_clicked(self, index: QModelIndex) -> None:
         """Handle item click."""
-        data_id = item.data(0, Qt.ItemDataRole.UserRole)
+        data_id = index.data(Qt.ItemDataRole.UserRole)
         if data_id:
             try:
                 data_info = self.data_manager.get_data_info(data_id)
                 
                 # Update info display
-                info_text = f"<b>{data_id}</b><br>"
-                info_text += f"Type: {data_info.get('data_type', 'Unknown')}<br>"
-                info_text += f"Channels: {data_info.get('n_channels', 'N/A')}<br>"
-                info_text += f"Sampling Rate: {data_info.get('sampling_rate', 'N/A')} Hz<br>"
-                info_text += f"Modified: {'Yes' if data_info.get('modified', False) else 'No'}"
-                
-                self.info_label.setText(info_text)
+                self.info_label.setText(
+                    _INFO_HTML.format_map(_info_fields(data_id, data_info))
+                )
                 
                 # Emit selection signal
                 self.data_selected.emit(data_id)
@@ -169,55 +382,35 @@ class DataBrowser(QWidget, EventMixin):
             except Exception as e:
                 logger.error(f"Error handling item click: {e}")
     
-    def _on_item_double_clicked(self, item: QTreeWidgetItem, column: int) -> None:
+    def _on_item_double_clicked(self, index: QModelIndex) -> None:
         """Handle item double click - set as active data."""
-        data_id = item.data(0, Qt.ItemDataRole.UserRole)
+        data_id = index.data(Qt.ItemDataRole.UserRole)
         if data_id:
             try:
                 self.data_manager.set_active_data(data_id)
-                logger.debug(f"Set active data: {data_id}")
+                logger.debug("Set active data: %s", data_id)
             except Exception as e:
                 logger.error(f"Error setting active data: {e}")
     
     def _show_context_menu(self, position) -> None:
         """Show context menu for data operations."""
-        item = self.data_tree.itemAt(position)
-        if not item:
+        index = self.data_tree.indexAt(position)
+        if not index.isValid():
             return
         
-        data_id = item.data(0, Qt.ItemDataRole.UserRole)
+        data_id = index.data(Qt.ItemDataRole.UserRole)
         if not data_id:
             return
         
-        # Create context menu
-        menu = QMenu(self)
-        
-        # Set as active action
-        set_active_action = QAction("Set as Active", self)
-        set_active_action.triggered.connect(lambda: self._set_active_data(data_id))
-        menu.addAction(set_active_action)
-        
-        menu.addSeparator()
-        
-        # View properties action
-        properties_action = QAction("Properties...", self)
-        properties_action.triggered.connect(lambda: self._show_properties(data_id))
-        menu.addAction(properties_action)
-        
-        # Export action
-        export_action = QAction("Export...", self)
-        export_action.triggered.connect(lambda: self._export_data(data_id))
-        menu.addAction(export_action)
-        
-        menu.addSeparator()
-        
-        # Remove action
-        remove_action = QAction("Remove", self)
-        remove_action.triggered.connect(lambda: self._remove_data(data_id))
-        menu.addAction(remove_action)
-        
         # Show menu
-        menu.exec(self.data_tree.mapToGlobal(position))
+        self._context_target = data_id
+        self._context_menu.exec(self.data_tree.mapToGlobal(position))
+    
+    def _on_context_action(self, action: QAction) -> None:
+        """Run the handler of a context menu action on the menu's item."""
+        handler = action.data()
+        if handler is not None and self._context_target is not None:
+            handler(self._context_target)
     
     def _set_active_data(self, data_id: str) -> None:
         """Set data as active."""
@@ -230,24 +423,17 @@ class DataBrowser(QWidget, EventMixin):
         """Show data properties dialog."""
         try:
             data_info = self.data_manager.get_data_info(data_id)
-            data_obj = self.data_manager.get_data(data_id)
             
             # Create properties text
-            props_text = f"Data ID: {data_id}\\n"
-            props_text += f"Type: {data_info.get('data_type', 'Unknown')}\\n"
-            props_text += f"File: {data_info.get('file_path', 'N/A')}\\n"
-            props_text += f"Channels: {data_info.get('n_channels', 'N/A')}\\n"
-            props_text += f"Sampling Rate: {data_info.get('sampling_rate', 'N/A')} Hz\\n"
-            props_text += f"Time Points: {data_info.get('n_times', 'N/A')}\\n"
-            props_text += f"Loaded: {data_info.get('loaded_at', 'N/A')}\\n"
-            props_text += f"Modified: {'Yes' if data_info.get('modified', False) else 'No'}\\n"
+            parts = [_PROPERTIES_TEXT.format_map(_info_fields(data_id, data_info))]
             
             # Add history if available
             history = data_info.get('history', [])
             if history:
-                props_text += "\\nHistory:\\n"
-                for entry in history[-5:]:  # Show last 5 operations
-                    props_text += f"  - {entry.get('operation', 'Unknown')} at {entry.get('timestamp', 'N/A')}\\n"
+                parts.append("\nHistory:\n")
+                for entry in list(history)[-5:]:  # Show last 5 operations
+                    parts.append(f"  - {entry.get('operation', 'Unknown')} at {entry.get('timestamp', 'N/A')}\n")
+            props_text = "".join(parts)
             
             QMessageBox.information(self, f"Properties - {data_id}", props_text)
             
@@ -276,18 +462,29 @@ class DataBrowser(QWidget, EventMixin):
                 QMessageBox.warning(self, "Error", f"Failed to remove data: {e}")
     
     # Event handlers
-    def _on_data_loaded(self, data_id: str, data_obj) -> None:
-        """Handle data loaded event."""
-        self._refresh_data_list()
+    def _on_data_loaded_batch(self, loaded: list) -> None:
+        """Handle a batch of data loaded events."""
+        for data_id, _ in loaded:
+            self._update_item(data_id)
+        self._refresh_timer.start()
     
     def _on_data_changed(self, data_id: str, data_obj) -> None:
         """Handle data changed event."""
-        self._refresh_data_list()
+        self._update_item(data_id)
+        self._refresh_timer.start()
     
     def _on_data_removed(self, data_id: str) -> None:
         """Handle data removed event."""
-        self._refresh_data_list()
+        self._model.remove_row(data_id)
+        self._refresh_timer.start()
+    
+    def _on_data_batch_removed(self, data_ids: list) -> None:
+        """Handle batch data removed event."""
+        for data_id in data_ids:
+            self._model.remove_row(data_id)
+        self._refresh_timer.start()
     
     def _on_active_data_changed(self, data_id: str) -> None:
         """Handle active data changed event."""
-        self._refresh_data_list()
\ No newline at end of file
+        if self._model.set_active(data_id):
+            self._refresh_timer.start()
\ No newline at end of file
@@ -1,14 +1,21 @@
 """Dock manager for handling dockable widgets in QuickLab."""
 
-from typing import Dict, Optional, Any, Type
+import base64
+from typing import Dict, List, NamedTuple, Optional, Any, Tuple, Type
 from PyQt6.QtWidgets import QWidget, QDockWidget, QMainWindow
-from PyQt6.QtCore import Qt, QObject, pyqtSignal
+from PyQt6.QtCore import Qt, QObject, pyqtSignal, QByteArray, QDataStream, QIODevice
 
 from ...utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+class _ResetSpec(NamedTuple):
+    """The part of a dock's configuration used to reset the layout."""
+    
+    area: Qt.DockWidgetArea
+
+
 class DockManager(QObject):
     """Manages dockable widgets in the main window.
     
@@ -41,7 +48,12 @@ class DockManager(QObject):
         
         self.main_window = main_window
         self.docks: Dict[str, QDockWidget] = {}
+        # The same docks in insertion order, for the methods that walk them all
+        self._dock_order: List[Tuple[str, QDockWidget]] = []
         self.dock_configs: Dict[str, Dict[str, Any]] = {}
+        self._reset_specs: Dict[str, _ResetSpec] = {}
+        # Last visibility reported by each dock's visibilityChanged signal
+        self._visible: Dict[str, bool] = {}
         
         logger.debug("DockManager initialized")
     
@@ -97,12 +109,14 @@ class DockManager(QObject):
         # Create dock widget
         dock = QDockWidget(title, self.main_window)
         dock.setObjectName(dock_id)
+        # Kept separately so renaming the object does not lose the ID
+        dock.setProperty('dock_id', dock_id)
         dock.setWidget(widget)
         dock.setAllowedAreas(Qt.DockWidgetArea.AllDockWidgetAreas)
         
         # Connect visibility signal
         dock.visibilityChanged.connect(
-            lambda visible: self.dock_visibility_changed.emit(dock_id, visible)
+            self._on_dock_visibility_changed, Qt.ConnectionType.DirectConnection
         )
         
         # Add to main window
@@ -110,6 +124,7 @@ class DockManager(QObject):
         
         # Store references
         self.docks[dock_id] = dock
+        self._dock_order.append((dock_id, dock))
         self.dock_configs[dock_id] = {
             'title': title,
             'widget_class': widget_class,
@@ -117,12 +132,24 @@ class DockManager(QObject):
             'widget_args': widget_args,
             'widget_kwargs': widget_kwargs
         }
+        self._reset_specs[dock_id] = _ResetSpec(area)
+        self._visible[dock_id] = dock.isVisible()
         
         logger.debug(f"Added dock: {dock_id}")
         self.dock_added.emit(dock_id, dock)
         
         return dock
     
+    def _on_dock_visibility_changed(self, visible: bool) -> None:
+        """Forward a dock's visibility change with its ID."""
+        dock = self.sender()
+        dock_id = dock.property('dock_id') if dock is not None else None
+        if dock_id in self._visible:
+            # visibilityChanged also fires when a tab is (de)selected, which
+            # does not change isVisible(), so read the state back once here
+            self._visible[dock_id] = dock.isVisible()
+            self.dock_visibility_changed.emit(dock_id, visible)
+    
     def remove_dock(self, dock_id: str) -> None:
         """Remove a dockable widget.
         
@@ -139,15 +166,25 @@ class DockManager(QObject):
         if dock_id not in self.docks:
             raise KeyError(f"Dock with ID '{dock_id}' not found")
         
-        dock = self.docks[dock_id]
+        dock = self.docks.pop(dock_id)
+        self._dock_order.remove((dock_id, dock))
+        del self.dock_configs[dock_id]
+        del self._reset_specs[dock_id]
+        del self._visible[dock_id]
+        
+        # Stop forwarding signals before the dock is hidden and removed
+        try:
+            dock.visibilityChanged.disconnect(self._on_dock_visibility_changed)
+        except (TypeError, RuntimeError):
+            pass
         
         # Remove from main window
+        dock.hide()
         self.main_window.removeDockWidget(dock)
         
-        # Clean up
+        # Detach from the main window so it is not kept alive until deletion
+        dock.setParent(None)
         dock.deleteLater()
-        del self.docks[dock_id]
-        del self.dock_configs[dock_id]
         
         logger.debug(f"Removed dock: {dock_id}")
         self.dock_removed.emit(dock_id)
@@ -221,10 +258,20 @@ class DockManager(QObject):
         KeyError
             If dock_id doesn't exist.
         """
-        if dock_id not in self.docks:
-            raise KeyError(f"Dock with ID '{dock_id}' not found")
+        try:
+            return self._visible[dock_id]
+        except KeyError:
+            raise KeyError(f"Dock with ID '{dock_id}' not found") from None
+    
+    def visible_dock_ids(self) -> list:
+        """Get list of the IDs of the visible docks.
         
-        return self.docks[dock_id].isVisible()
+        Returns
+        -------
+        list
+            List of dock identifiers.
+        """
+        return [dock_id for dock_id, visible in self._visible.items() if visible]
     
     def get_dock_list(self) -> list:
         """Get list of all dock IDs.
@@ -234,7 +281,7 @@ class DockManager(QObject):
         list
             List of dock identifiers.
         """
-        return list(self.docks.keys())
+        return [dock_id for dock_id, _ in self._dock_order]
     
     def tabify_docks(self, dock_ids: list) -> None:
         """Tabify multiple docks together.
@@ -252,18 +299,19 @@ class DockManager(QObject):
         if len(dock_ids) < 2:
             raise ValueError("Need at least 2 docks to tabify")
         
-        # Check all docks exist
-        for dock_id in dock_ids:
-            if dock_id not in self.docks:
-                raise KeyError(f"Dock with ID '{dock_id}' not found")
+        # Resolve all docks before changing the layout
+        try:
+            first, *others = [self.docks[dock_id] for dock_id in dock_ids]
+        except KeyError as e:
+            raise KeyError(f"Dock with ID '{e.args[0]}' not found") from None
         
         # Tabify docks
-        docks = [self.docks[dock_id] for dock_id in dock_ids]
-        for i in range(1, len(docks)):
-            self.main_window.tabifyDockWidget(docks[0], docks[i])
+        tabify = self.main_window.tabifyDockWidget
+        for dock in others:
+            tabify(first, dock)
         
         # Raise the first dock
-        docks[0].raise_()
+        first.raise_()
         
         logger.debug(f"Tabified docks: {dock_ids}")
     
@@ -289,41 +337,54 @@ class DockManager(QObject):
     
     def reset_dock_layout(self) -> None:
         """Reset all docks to their default layout."""
-        for dock_id, config in self.dock_configs.items():
-            if dock_id in self.docks:
-                dock = self.docks[dock_id]
-                
-                # Remove and re-add to reset position
-                self.main_window.removeDockWidget(dock)
-                self.main_window.addDockWidget(config['area'], dock)
-                
-                # Ensure visible
-                dock.setVisible(True)
-                dock.setFloating(False)
+        # Bound once, outside the loop
+        reset_specs = self._reset_specs
+        remove_dock = self.main_window.removeDockWidget
+        add_dock = self.main_window.addDockWidget
+        for dock_id, dock in self._dock_order:
+            # Remove and re-add to reset position
+            remove_dock(dock)
+            add_dock(reset_specs[dock_id].area, dock)
+            
+            # Ensure visible
+            dock.setVisible(True)
+            dock.setFloating(False)
         
         logger.debug("Reset dock layout")
     
     def save_dock_state(self) -> Dict[str, Any]:
         """Save current dock state.
         
+        The main window state and the state of every dock are written to a
+        single ``QDataStream`` blob, stored base64-encoded.
+        
         Returns
         -------
         dict
-            Dictionary containing dock state information.
+            Dictionary with the encoded state under the ``'blob'`` key.
         """
-        state = {}
-        
-        for dock_id, dock in self.docks.items():
-            state[dock_id] = {
-                'visible': dock.isVisible(),
-                'floating': dock.isFloating(),
-                'geometry': dock.saveGeometry().data().hex() if dock.isFloating() else None
-            }
-        
-        # Save main window dock state
-        state['_window_state'] = self.main_window.saveState().data().hex()
-        
-        return state
+        ba = QByteArray()
+        stream = QDataStream(ba, QIODevice.OpenModeFlag.WriteOnly)
+        
+        stream.writeBytes(bytes(self.main_window.saveState()))
+        stream.writeInt32(len(self._dock_order))
+        
+        # Bound once, outside the loop
+        write_string = stream.writeQString
+        write_bool = stream.writeBool
+        write_bytes = stream.writeBytes
+        is_floating = QDockWidget.isFloating
+        is_visible = QDockWidget.isVisible
+        save_geometry = QDockWidget.saveGeometry
+        for dock_id, dock in self._dock_order:
+            floating = is_floating(dock)
+            write_string(dock_id)
+            write_bool(is_visible(dock))
+            write_bool(floating)
+            write_bytes(bytes(save_geometry(dock)) if floating else b'')
+        
+        del stream
+        return {'blob': base64.b64encode(bytes(ba)).decode('ascii')}
     
     def restore_dock_state(self, state: Dict[str, Any]) -> None:
         """Restore dock state.
@@ -331,13 +392,60 @@ class DockManager(QObject):
         Parameters
         ----------
         state : dict
-            Dictionary containing dock state information.
+            Dictionary returned by :meth:`save_dock_state`. States saved by
+            earlier versions, with hex-encoded ``'_window_state'`` and
+            per-dock entries, are restored too.
+        """
+        if 'blob' not in state:
+            self._restore_legacy_dock_state(state)
+            return
+        
+        try:
+            ba = QByteArray(base64.b64decode(state['blob'], validate=True))
+            stream = QDataStream(ba, QIODevice.OpenModeFlag.ReadOnly)
+            
+            window_state = stream.readBytes()
+            dock_states = []
+            for _ in range(stream.readInt32()):
+                dock_states.append((stream.readQString(), stream.readBool(),
+                                    stream.readBool(), stream.readBytes()))
+            if stream.status() != QDataStream.Status.Ok:
+                raise ValueError("Corrupt dock state")
+            
+            # Restore main window state first
+            self.main_window.restoreState(QByteArray(window_state))
+            
+            # Restore individual dock states
+            for dock_id, visible, floating, geometry in dock_states:
+                dock = self.docks.get(dock_id)
+                if dock is None:
+                    continue
+                
+                dock.setVisible(visible)
+                dock.setFloating(floating)
+                if floating and geometry:
+                    dock.restoreGeometry(QByteArray(geometry))
+            
+            logger.debug("Restored dock state")
+            
+        except Exception as e:
+            logger.warning(f"Failed to restore dock state: {e}")
+            self.reset_dock_layout()
+    
+    def _restore_legacy_dock_state(self, state: Dict[str, Any]) -> None:
+        """Restore a dock state saved with hex-encoded per-dock entries.
+        
+        Parameters
+        ----------
+        state : dict
+            Dictionary with an optional ``'_window_state'`` and an entry per
+            dock ID.
         """
         try:
             # Restore main window state first
             if '_window_state' in state:
                 window_state = bytes.fromhex(state['_window_state'])
-                self.main_window.restoreState(window_state)
+                self.main_window.restoreState(QByteArray(window_state))
             
             # Restore individual dock states
             for dock_id, dock_state in state.items():
@@ -354,12 +462,12 @@ class DockManager(QObject):
                 if 'floating' in dock_state:
                     dock.setFloating(dock_state['floating'])
                     
-                    if dock_state['floating'] and 'geometry' in dock_state and dock_state['geometry']:
+                    if dock_state['floating'] and dock_state.get('geometry'):
                         geometry = bytes.fromhex(dock_state['geometry'])
-                        dock.restoreGeometry(geometry)
+                        dock.restoreGeometry(QByteArray(geometry))
             
-            logger.debug("Restored dock state")
+            logger.debug("Restored dock state from the previous format")
             
         except Exception as e:
             logger.warning(f"Failed to restore dock state: {e}")
-            self.reset_dock_layout()
\ No newline at end of file
+            self.reset_dock_layout()
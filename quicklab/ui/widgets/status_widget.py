@@ -1,11 +1,20 @@
 """Status widget for displaying application status information."""
 
-from typing import Optional, Any
+import os
+import sys
+import weakref
+from typing import Callable, Dict, Optional, Any
 from PyQt6.QtWidgets import QWidget, QHBoxLayout, QLabel
 from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QHideEvent, QShowEvent
 
 from ...utils.logger import get_logger
 
+try:
+    import psutil
+except ImportError:  # only needed where procfs is not available
+    psutil = None
+
 logger = get_logger(__name__)
 
 
@@ -21,10 +30,42 @@ class StatusWidget(QWidget):
         Parent widget.
     """
     
+    # One stylesheet on the widget styles every separator label
+    _SEPARATOR_NAME = "statusSeparator"
+    _STYLE_SHEET = f"QLabel#{_SEPARATOR_NAME} {{ color: gray; }}"
+    
+    # Data info text templates
+    _DATA_TEXT = "{}: {}ch, {:.0f}Hz"
+    _DATA_DURATION_TEXT = "{}: {}ch, {:.0f}Hz, {:.1f}s"
+    
+    # Memory is refreshed on demand; this slow heartbeat runs while shown
+    _MEMORY_INTERVAL_MS = 10000
+    
+    # Number of data objects whose channel count and sampling rate are kept
+    _INFO_CACHE_SIZE = 8
+    
+    # Minimum label widths in pixels
+    _DATA_MIN_WIDTH = 150
+    _MEMORY_MIN_WIDTH = 100
+    _STATUS_MIN_WIDTH = 80
+    
     def __init__(self, parent: Optional[QWidget] = None):
         """Initialize the StatusWidget."""
         super().__init__(parent)
         
+        # Label texts waiting for the next flush, and the texts shown
+        self._pending: Dict[str, str] = {}
+        self._flush_armed = False
+        self._current = {'data': "No data", 'memory': "Memory: 0 MB", 'status': "Ready"}
+        
+        # Last progress shown, and the message template for its operation
+        self._last_progress: Optional[tuple] = None
+        self._progress_op: Optional[str] = None
+        self._progress_tmpl = ""
+        
+        # id(data_obj) -> (weak reference, nchan, sfreq, has_n_times)
+        self._info_cache: Dict[int, tuple] = {}
+        
         self._setup_ui()
         self._setup_timer()
         
@@ -32,39 +73,82 @@ class StatusWidget(QWidget):
     
     def _setup_ui(self) -> None:
         """Set up the user interface."""
+        self.setStyleSheet(self._STYLE_SHEET)
+        
         layout = QHBoxLayout(self)
         layout.setContentsMargins(5, 2, 5, 2)
         
         # Data info label
         self.data_label = QLabel("No data")
-        self.data_label.setMinimumWidth(150)
+        self.data_label.setMinimumWidth(self._DATA_MIN_WIDTH)
         layout.addWidget(self.data_label)
         
         # Separator
         separator1 = QLabel("|")
-        separator1.setStyleSheet("color: gray;")
+        separator1.setObjectName(self._SEPARATOR_NAME)
         layout.addWidget(separator1)
         
         # Memory usage label
         self.memory_label = QLabel("Memory: 0 MB")
-        self.memory_label.setMinimumWidth(100)
+        self.memory_label.setMinimumWidth(self._MEMORY_MIN_WIDTH)
         layout.addWidget(self.memory_label)
         
         # Separator
         separator2 = QLabel("|")
-        separator2.setStyleSheet("color: gray;")
+        separator2.setObjectName(self._SEPARATOR_NAME)
         layout.addWidget(separator2)
         
         # Progress/status label
         self.status_label = QLabel("Ready")
-        self.status_label.setMinimumWidth(80)
+        self.status_label.setMinimumWidth(self._STATUS_MIN_WIDTH)
         layout.addWidget(self.status_label)
+        
+        self._labels = {
+            'data': self.data_label,
+            'memory': self.memory_label,
+            'status': self.status_label,
+        }
+    
+    def _queue(self, key: str, text: str) -> None:
+        """Queue a label text to be set on the next event loop iteration.
+        
+        Parameters
+        ----------
+        key : str
+            Label key: 'data', 'memory' or 'status'.
+        text : str
+            Text to show.
+        """
+        self._pending[key] = text
+        if not self._flush_armed:
+            self._flush_armed = True
+            QTimer.singleShot(0, self._flush)
+    
+    def _flush(self) -> None:
+        """Set the queued label texts that differ from the shown ones."""
+        pending, self._pending = self._pending, {}
+        self._flush_armed = False
+        for key, text in pending.items():
+            if self._current[key] != text:
+                self._current[key] = text
+                self._labels[key].setText(text)
     
     def _setup_timer(self) -> None:
         """Set up timer for periodic updates."""
-        self.update_timer = QTimer()
+        # The way the memory usage is read is chosen once, not per tick
+        self._get_rss = self._make_rss_getter()
+        self._last_mb: Optional[int] = None
+        self._memory_available = True
+        
+        # Started and stopped with the widget's visibility
+        self.update_timer = QTimer(self)
+        self.update_timer.setInterval(self._MEMORY_INTERVAL_MS)
         self.update_timer.timeout.connect(self._update_memory_usage)
-        self.update_timer.start(2000)  # Update every 2 seconds
+        
+        # Restores "Ready" after a status set with a timeout
+        self._reset_timer = QTimer(self)
+        self._reset_timer.setSingleShot(True)
+        self._reset_timer.timeout.connect(self._reset_status)
     
     def update_data_info(self, data_id: str, data_obj: Any) -> None:
         """Update data information display.
@@ -77,37 +161,142 @@ class StatusWidget(QWidget):
             The MNE data object.
         """
         try:
-            if hasattr(data_obj, 'info'):
-                n_channels = data_obj.info['nchan']
-                sfreq = data_obj.info['sfreq']
-                
-                if hasattr(data_obj, 'n_times'):
+            cached = self._info_cache.get(id(data_obj))
+            if cached is None or cached[0]() is not data_obj:
+                cached = self._cache_data_info(data_obj)
+            
+            if cached is None:
+                info_text = f"{data_id}: {type(data_obj).__name__}"
+            else:
+                _, n_channels, sfreq, has_n_times = cached
+                if has_n_times:
                     duration = data_obj.n_times / sfreq
-                    info_text = f"{data_id}: {n_channels}ch, {sfreq:.0f}Hz, {duration:.1f}s"
+                    info_text = self._DATA_DURATION_TEXT.format(
+                        data_id, n_channels, sfreq, duration
+                    )
                 else:
-                    info_text = f"{data_id}: {n_channels}ch, {sfreq:.0f}Hz"
-            else:
-                info_text = f"{data_id}: {type(data_obj).__name__}"
+                    info_text = self._DATA_TEXT.format(data_id, n_channels, sfreq)
             
-            self.data_label.setText(info_text)
+            self._queue('data', info_text)
             
         except Exception as e:
             logger.warning(f"Error updating data info: {e}")
-            self.data_label.setText(f"{data_id}: Error")
+            self._queue('data', f"{data_id}: Error")
+    
+    def _cache_data_info(self, data_obj: Any) -> Optional[tuple]:
+        """Read and cache the fields of a data object shown in the label.
+        
+        Parameters
+        ----------
+        data_obj : Any
+            The MNE data object.
+        
+        Returns
+        -------
+        tuple or None
+            The cache entry, or None if the object has no MNE info.
+        """
+        info = getattr(data_obj, 'info', None)
+        if info is None:
+            return None
+        
+        try:
+            ref = weakref.ref(data_obj)
+        except TypeError:
+            ref = None
+        entry = (ref, info['nchan'], info['sfreq'], hasattr(data_obj, 'n_times'))
+        
+        # Objects that cannot be weakly referenced are not cached, as their
+        # id could be reused by another object
+        if ref is not None:
+            cache = self._info_cache
+            cache.pop(id(data_obj), None)
+            if len(cache) >= self._INFO_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            cache[id(data_obj)] = entry
+        return entry
+    
+    def invalidate_data_info(self, data_obj: Any) -> None:
+        """Forget the cached channel count and sampling rate of an object.
+        
+        Call this when a data object is modified in place.
+        
+        Parameters
+        ----------
+        data_obj : Any
+            The MNE data object.
+        """
+        self._info_cache.pop(id(data_obj), None)
+    
+    @staticmethod
+    def _make_rss_getter() -> Callable[[], Optional[int]]:
+        """Select how the resident set size of this process is read.
+        
+        Returns
+        -------
+        callable
+            Function returning the resident set size in bytes, or None if
+            it cannot be read on this system.
+        """
+        if sys.platform.startswith('linux') and os.path.exists('/proc/self/statm'):
+            page_size = os.sysconf('SC_PAGE_SIZE')
+            
+            def read_statm() -> Optional[int]:
+                with open('/proc/self/statm', 'rb') as f:
+                    return int(f.read().split()[1]) * page_size
+            
+            return read_statm
+        
+        if psutil is not None:
+            process = psutil.Process()
+            return lambda: process.memory_info().rss
+        
+        return lambda: None
+    
+    def refresh_memory(self) -> None:
+        """Refresh the memory usage display now.
+        
+        Meant to be called after operations that change memory usage, such
+        as loading or removing data.
+        """
+        if self._memory_available:
+            self._update_memory_usage()
+    
+    def showEvent(self, event: QShowEvent) -> None:
+        """Refresh the memory usage and start polling when shown."""
+        super().showEvent(event)
+        if self._memory_available:
+            self.update_timer.start()
+            QTimer.singleShot(0, self.refresh_memory)
+    
+    def hideEvent(self, event: QHideEvent) -> None:
+        """Stop polling the memory usage when hidden."""
+        super().hideEvent(event)
+        self.update_timer.stop()
     
     def _update_memory_usage(self) -> None:
         """Update memory usage display."""
+        if not self.isVisible():
+            return
+        
         try:
-            import psutil
-            process = psutil.Process()
-            memory_mb = process.memory_info().rss / 1024 / 1024
-            self.memory_label.setText(f"Memory: {memory_mb:.0f} MB")
-            
-        except ImportError:
-            # psutil not available
-            self.memory_label.setText("Memory: N/A")
+            rss = self._get_rss()
         except Exception as e:
             logger.debug(f"Error updating memory usage: {e}")
+            return
+        
+        if rss is None:
+            # Neither procfs nor psutil available; there is nothing to poll
+            self._memory_available = False
+            self.update_timer.stop()
+            self._queue('memory', "Memory: N/A")
+            return
+        
+        memory_mb = round(rss / 1024 / 1024)
+        
+        if memory_mb != self._last_mb:
+            self._last_mb = memory_mb
+            self._queue('memory', f"Memory: {memory_mb} MB")
     
     def set_status(self, status: str, timeout: Optional[int] = None) -> None:
         """Set status message.
@@ -119,14 +308,23 @@ class StatusWidget(QWidget):
         timeout : int, optional
             Timeout in milliseconds to clear the message.
         """
-        self.status_label.setText(status)
+        self._queue('status', status)
+        self._last_progress = None
         
+        # A new status cancels the reset pending for the previous one
         if timeout:
-            QTimer.singleShot(timeout, lambda: self.status_label.setText("Ready"))
+            self._reset_timer.start(timeout)
+        else:
+            self._reset_timer.stop()
+    
+    def _reset_status(self) -> None:
+        """Show the idle status message."""
+        self._queue('status', "Ready")
+        self._last_progress = None
     
     def clear_data_info(self) -> None:
         """Clear data information display."""
-        self.data_label.setText("No data")
+        self._queue('data', "No data")
     
     def set_progress(self, progress: int, operation: str = "") -> None:
         """Set progress information.
@@ -138,11 +336,21 @@ class StatusWidget(QWidget):
         operation : str, optional
             Description of the operation.
         """
-        if operation:
-            self.status_label.setText(f"{operation}: {progress}%")
-        else:
-            self.status_label.setText(f"Progress: {progress}%")
+        if (operation, progress) == self._last_progress:
+            return
+        
+        if operation != self._progress_op:
+            self._progress_op = operation
+            if operation:
+                escaped = operation.replace('{', '{{').replace('}', '}}')
+                self._progress_tmpl = escaped + ": {}%"
+            else:
+                self._progress_tmpl = "Progress: {}%"
+        
+        self._queue('status', self._progress_tmpl.format(progress))
+        self._last_progress = (operation, progress)
     
     def clear_progress(self) -> None:
         """Clear progress display."""
-        self.status_label.setText("Ready")
\ No newline at end of file
+        self._queue('status', "Ready")
+        self._last_progress = None
\ No newline at end of file
@@ -1,12 +1,18 @@
 """Tests for core QuickLab modules."""
 
+import json
+import os
 import pytest
 import tempfile
+from collections import deque
 from pathlib import Path
 from unittest.mock import Mock, patch
 
-from quicklab.core.data_manager import DataManager
+from quicklab.core.data_manager import (
+    DataManager, DataKind, _DataManagerCore, _fif_kind
+)
 from quicklab.core.event_system import EventSystem, EventType, Event
+from quicklab.core.pipeline_manager import PipelineManager, PipelineStep
 from quicklab.core.session_manager import SessionManager
 
 
@@ -20,9 +26,9 @@ class TestDataManager:
     def test_initialization(self):
         """Test DataManager initialization."""
         assert self.data_manager._data_objects == {}
-        assert self.data_manager._data_metadata == {}
+        assert len(self.data_manager._data_metadata) == 0
         assert self.data_manager._active_data_id is None
-        assert self.data_manager._data_counter == 0
+        assert self.data_manager._basename_counters == {}
     
     def test_generate_data_id(self):
         """Test data ID generation."""
@@ -35,6 +41,14 @@ class TestDataManager:
         data_id = self.data_manager._generate_data_id("test.fif")
         assert data_id == "test_1"
     
+    def test_generate_data_id_skips_taken_suffix(self):
+        """Test data ID generation skips IDs that were assigned explicitly."""
+        self.data_manager._data_objects["run"] = Mock()
+        self.data_manager._data_objects["run_1"] = Mock()
+        
+        assert self.data_manager._generate_data_id("run.fif") == "run_2"
+        assert self.data_manager._generate_data_id("run.fif") == "run_3"
+    
     def test_get_data_list(self):
         """Test getting data list."""
         assert self.data_manager.get_data_list() == []
@@ -64,16 +78,306 @@ class TestDataManager:
         """Test clearing all data."""
         # Add mock data
         self.data_manager._data_objects["test"] = Mock()
-        self.data_manager._data_metadata["test"] = {}
+        self.data_manager._data_metadata.add("test", "test.fif", "Raw", True)
         self.data_manager._active_data_id = "test"
-        self.data_manager._data_counter = 1
+        self.data_manager._basename_counters["test"] = 1
         
         self.data_manager.clear_all_data()
         
         assert self.data_manager._data_objects == {}
-        assert self.data_manager._data_metadata == {}
+        assert len(self.data_manager._data_metadata) == 0
         assert self.data_manager._active_data_id is None
-        assert self.data_manager._data_counter == 0
+        # ID counters survive clearing so IDs are never reused
+        assert self.data_manager._basename_counters == {"test": 1}
+        assert self.data_manager._generate_data_id("test.fif") == "test_1"
+    
+    def test_resolve_preload_large_file(self, tmp_path):
+        """Test files above the mmap threshold are not preloaded."""
+        file_path = tmp_path / "big_raw.fif"
+        file_path.write_bytes(b"x" * 16)
+        
+        self.data_manager.mmap_threshold_bytes = 8
+        assert self.data_manager._resolve_preload(file_path, True) is False
+        
+        self.data_manager.mmap_threshold_bytes = None
+        assert self.data_manager._resolve_preload(file_path, True) is True
+    
+    def test_memory_accounting(self):
+        """Test in-memory data size is tracked across update and removal."""
+        self.data_manager._data_objects["test"] = Mock()
+        self.data_manager._data_metadata.add("test", "test.fif", "Raw", True)
+        
+        data_obj = Mock()
+        data_obj._data.nbytes = 100
+        self.data_manager.update_data("test", data_obj)
+        assert self.data_manager._total_nbytes == 100
+        
+        self.data_manager.remove_data("test")
+        assert self.data_manager._total_nbytes == 0
+        assert "test" not in self.data_manager._access_order
+    
+    def test_remove_many(self):
+        """Test removing several data objects at once."""
+        for data_id in ("a", "b", "c"):
+            self.data_manager._data_objects[data_id] = Mock()
+            self.data_manager._data_metadata.add(data_id, f"{data_id}.fif", "Raw", True)
+        self.data_manager._active_data_id = "a"
+        
+        removed = self.data_manager.remove_many(["a", "b", "missing"])
+        
+        assert removed == ["a", "b"]
+        assert self.data_manager.get_data_list() == ["c"]
+        assert self.data_manager._active_data_id == "c"
+    
+    def test_metadata_store_remove_keeps_rows_dense(self):
+        """Test metadata rows stay addressable after removal."""
+        store = self.data_manager._data_metadata
+        for data_id in ("a", "b", "c"):
+            store.add(data_id, f"{data_id}.fif", "Raw", True)
+        store.modified[store.row("c")] = True
+        
+        assert store.remove("a")
+        assert not store.remove("a")
+        
+        assert len(store) == 2
+        assert store.record("c")['file_path'] == "c.fif"
+        assert store.record("b")['modified'] is False
+        assert store.find_modified() == ["c"]
+        assert store.record("c")['kind'] is DataKind.UNKNOWN
+    
+    def test_data_info_cache_invalidated_on_update(self):
+        """Test cached data info is refreshed after an update."""
+        self.data_manager._data_objects["test"] = Mock(spec=[])
+        self.data_manager._data_metadata.add("test", "test.fif", "Raw", True)
+        
+        info = self.data_manager.get_data_info("test")
+        assert self.data_manager.get_data_info("test") is info
+        assert info['modified'] is False
+        
+        self.data_manager.update_data("test", Mock(spec=[]))
+        assert self.data_manager.get_data_info("test")['modified'] is True
+    
+    def test_get_data_table(self):
+        """Test the data table columns follow additions, updates and removals."""
+        for data_id in ("a", "b"):
+            self.data_manager._data_objects[data_id] = Mock(spec=[])
+            self.data_manager._data_metadata.add(data_id, f"{data_id}.fif", "Raw", True)
+        
+        data_obj = Mock(spec=['info', 'n_times'])
+        data_obj.info = {'nchan': 4}
+        data_obj.n_times = 100
+        self.data_manager.update_data("b", data_obj)
+        self.data_manager.remove_data("a")
+        
+        assert self.data_manager.get_data_table() == (["b"], ["Mock"], ["4"], ["100"])
+    
+    def test_epochs_evoked_filename_detection(self):
+        """Test epochs/evoked files are recognized by MNE naming conventions."""
+        assert _fif_kind("sub-01_task-rest-epo.fif") == "epo"
+        assert _fif_kind("sub01_EPO.FIF") == "epo"
+        assert _fif_kind("europe.fif") is None
+        assert _fif_kind("sub-epoch_raw.fif") is None
+        
+        assert _fif_kind("sub-01-ave.fif") == "ave"
+        assert _fif_kind("wave_raw.fif") is None
+    
+    def test_load_many(self, tmp_path):
+        """Test batch loading registers files in order and skips failures."""
+        core = _DataManagerCore()
+        paths = [tmp_path / "a_raw.fif", tmp_path / "missing_raw.fif", tmp_path / "a_raw.edf"]
+        paths[0].write_bytes(b"")
+        paths[2].write_bytes(b"")
+        
+        with patch.object(core, "_load_data_by_extension", return_value=Mock(spec=[])):
+            data_ids = core.load_many(paths)
+        
+        assert data_ids == ["a_raw", "a_raw_1"]
+        assert core.get_data_list() == ["a_raw", "a_raw_1"]
+    
+    def test_load_many_reports_failures_on_calling_thread(self, tmp_path):
+        """Test each failed read is reported once, from the calling thread."""
+        import threading
+        
+        core = _DataManagerCore()
+        paths = [tmp_path / "a.xyz", tmp_path / "b.xyz", tmp_path / "c_raw.fif"]
+        for path in paths:
+            path.write_bytes(b"")
+        
+        reported = []
+        core._report_error = lambda *args: reported.append(threading.current_thread())
+        readers = {".fif": Mock(return_value=Mock(spec=[]))}
+        with patch("quicklab.core.data_manager._get_readers", return_value=readers):
+            data_ids = core.load_many(paths)
+        
+        assert data_ids == ["c_raw"]
+        assert reported == [threading.current_thread()] * 2
+    
+    def test_reload_reuses_unmodified_data(self, tmp_path):
+        """Test loading an already loaded, unchanged file copies the data."""
+        core = _DataManagerCore()
+        path = tmp_path / "a_raw.fif"
+        path.write_bytes(b"")
+        data_obj = Mock(spec=["copy"])
+        data_obj.copy.return_value = Mock(spec=[])
+        
+        with patch.object(core, "_load_data_by_extension", return_value=data_obj) as read:
+            first = core.load_data(path)
+            second = core.load_data(path)
+            assert read.call_count == 1
+            assert core.get_data(second) is data_obj.copy.return_value
+            
+            # Modified data no longer matches the file
+            core.update_data(first, data_obj)
+            core.update_data(second, Mock(spec=[]))
+            core.load_data(path)
+            assert read.call_count == 2
+    
+    def test_reload_after_in_place_change_reads_file(self, tmp_path):
+        """Test data changed in place is not reused for its file."""
+        mne = pytest.importorskip("mne")
+        import numpy as np
+        
+        core = _DataManagerCore()
+        path = tmp_path / "a_raw.fif"
+        path.write_bytes(b"")
+        raw = mne.io.RawArray(np.ones((2, 100)), mne.create_info(2, 100.0, "eeg"),
+                              verbose=False)
+        fresh = mne.io.RawArray(np.ones((2, 100)), mne.create_info(2, 100.0, "eeg"),
+                                verbose=False)
+        
+        with patch.object(core, "_load_data_by_extension",
+                          side_effect=[raw, fresh]) as read:
+            core.load_data(path, preload=True)
+            raw.apply_function(lambda x: x * 0)
+            
+            assert core.find_source_file(raw) is None
+            reloaded = core.get_data(core.load_data(path, preload=True))
+            assert read.call_count == 2
+            assert reloaded is fresh
+    
+    def test_evict_keeps_in_place_changes(self, tmp_path):
+        """Test data changed in place is spilled rather than dropped on eviction."""
+        mne = pytest.importorskip("mne")
+        import numpy as np
+        
+        core = _DataManagerCore()
+        paths = [tmp_path / "a_raw.fif", tmp_path / "b_raw.fif"]
+        raws = []
+        for path in paths:
+            raw = mne.io.RawArray(np.ones((2, 100)), mne.create_info(2, 100.0, "eeg"),
+                                  verbose=False)
+            raw.save(path, verbose=False)
+            raws.append(raw)
+        
+        reread = mne.io.read_raw_fif(paths[0], preload=True, verbose=False)
+        with patch.object(core, "_load_data_by_extension", side_effect=raws + [reread]):
+            first = core.load_data(paths[0], preload=True)
+            raws[0].apply_function(lambda x: x * 0)
+            core.set_active_data(core.load_data(paths[1], preload=True))
+            core.max_bytes = raws[0]._data.nbytes
+            core.load_data(paths[0], preload=True)
+        
+        assert core._data_objects[first].spilled
+        assert not core.get_data(first).get_data().any()
+    
+    def test_reload_lazily_does_not_copy_preloaded_data(self, tmp_path):
+        """Test a lazy load reads the file instead of copying preloaded data."""
+        core = _DataManagerCore()
+        path = tmp_path / "a_raw.fif"
+        path.write_bytes(b"")
+        data_obj = Mock(spec=["copy", "preload"], preload=True)
+        
+        with patch.object(core, "_load_data_by_extension", return_value=data_obj) as read:
+            core.load_data(path, preload=True)
+            core.load_data(path, preload=False)
+            assert read.call_count == 2
+            data_obj.copy.assert_not_called()
+    
+    def test_duplicate_data_shares_samples(self):
+        """Test duplicates share a read-only view of the original samples."""
+        mne = pytest.importorskip("mne")
+        import numpy as np
+        
+        info = mne.create_info(["EEG 001", "EEG 002"], 100.0, "eeg")
+        raw = mne.io.RawArray(np.zeros((2, 100)), info, verbose=False)
+        self.data_manager._data_objects["test"] = raw
+        self.data_manager._data_metadata.add("test", "test_raw.fif", "RawArray", True)
+        
+        dup_id = self.data_manager.duplicate_data("test")
+        dup = self.data_manager.get_data(dup_id)
+        
+        assert dup_id == "test_copy"
+        assert np.shares_memory(dup._data, raw._data)
+        assert not dup._data.flags.writeable
+        assert dup.info is not raw.info
+        
+        copy_id = self.data_manager.duplicate_data("test", "full", share_data=False)
+        assert not np.shares_memory(self.data_manager.get_data(copy_id)._data, raw._data)
+        
+        # Data added without a file keeps having no file
+        self.data_manager.add_data(raw.copy(), "unsaved")
+        unsaved_copy = self.data_manager.duplicate_data("unsaved")
+        assert self.data_manager.get_data_info(unsaved_copy)["file_path"] == ""
+    
+    def test_duplicate_data_keeps_file_and_memory_accounting(self, tmp_path):
+        """Test duplicates do not replace the file's entry or double-count samples."""
+        mne = pytest.importorskip("mne")
+        import numpy as np
+        
+        core = _DataManagerCore()
+        path = tmp_path / "a_raw.fif"
+        path.write_bytes(b"")
+        raw = mne.io.RawArray(np.zeros((2, 100)), mne.create_info(2, 100.0, "eeg"),
+                              verbose=False)
+        with patch.object(core, "_load_data_by_extension", return_value=raw):
+            data_id = core.load_data(path, preload=True)
+            dup_id = core.duplicate_data(data_id)
+            assert core._total_nbytes == raw._data.nbytes
+            
+            assert core.find_source_file(raw) == path.absolute()
+            assert core.find_source_file(core.get_data(dup_id)) is None
+            reloaded = core.get_data(core.load_data(path, preload=True))
+            assert reloaded._data.flags.writeable
+            assert not np.shares_memory(reloaded._data, raw._data)
+        
+        core.remove_data(data_id)
+        assert core._total_nbytes == 2 * raw._data.nbytes
+        core.remove_data(dup_id)
+        assert core._total_nbytes == raw._data.nbytes
+    
+    def test_ensure_preloaded(self):
+        """Test lazily loaded data is preloaded on demand."""
+        data_obj = Mock(preload=False, info={'nchan': 2, 'sfreq': 100.0})
+        data_obj._data.nbytes = 100
+        self.data_manager._data_objects["test"] = data_obj
+        self.data_manager._data_metadata.add("test", "test.fif", "Raw", False)
+        
+        assert self.data_manager.ensure_preloaded("test") is data_obj
+        data_obj.load_data.assert_called_once()
+        assert self.data_manager.get_data_info("test")['preload'] is True
+        assert self.data_manager._total_nbytes == 100
+    
+    def test_load_failure_reported_once(self, tmp_path):
+        """Test a failed read is reported by the loader, not the reader."""
+        core = _DataManagerCore()
+        path = tmp_path / "data.xyz"
+        path.write_bytes(b"")
+        
+        with patch.object(core, "_report_error") as report:
+            with pytest.raises(RuntimeError):
+                core._load_data_by_extension(path, False)
+            report.assert_not_called()
+            
+            with pytest.raises(RuntimeError):
+                core.load_data(path)
+            report.assert_called_once()
+    
+    def test_core_load_missing_file_raises(self, tmp_path):
+        """Test the Qt-free core raises instead of swallowing errors."""
+        core = _DataManagerCore()
+        
+        with pytest.raises(ValueError):
+            core.load_data(tmp_path / "missing.fif")
 
 
 class TestEventSystem:
@@ -86,7 +390,7 @@ class TestEventSystem:
     def test_initialization(self):
         """Test EventSystem initialization."""
         assert self.event_system._subscribers == {}
-        assert self.event_system._event_history == []
+        assert len(self.event_system._event_history) == 0
         assert self.event_system._max_history == 1000
     
     def test_subscribe_unsubscribe(self):
@@ -164,6 +468,56 @@ class TestEventSystem:
         # Limit results
         limited_events = self.event_system.get_event_history(limit=2)
         assert len(limited_events) == 2
+        assert [e.source for e in limited_events] == ["source2", "source1"]
+        
+        # Combined filters
+        combined = self.event_system.get_event_history(
+            event_type=EventType.DATA_LOADED, source="source1", limit=1
+        )
+        assert len(combined) == 1
+        assert combined[0] is all_events[-1]
+    
+    def test_get_event_history_zero_limit(self):
+        """Test a zero limit returns no events, with or without filters."""
+        self.event_system.publish_simple(EventType.DATA_LOADED, "source1")
+        
+        assert self.event_system.get_event_history(limit=0) == []
+        assert self.event_system.get_event_history(
+            event_type=EventType.DATA_LOADED, limit=0
+        ) == []
+    
+    def test_get_event_history_skips_evicted_events(self):
+        """Test filtered history only returns events still in the history."""
+        self.event_system._event_history = deque(maxlen=2)
+        self.event_system.publish_simple(EventType.DATA_LOADED, "source1")
+        self.event_system.publish_simple(EventType.DATA_CHANGED, "source1")
+        self.event_system.publish_simple(EventType.DATA_CHANGED, "source1")
+        
+        assert self.event_system.get_event_history(event_type=EventType.DATA_LOADED) == []
+        assert len(self.event_system.get_event_history(source="source1")) == 2
+    
+    def test_history_indexes_are_pruned(self):
+        """Test indexes of events that left the history are dropped."""
+        self.event_system._event_history = deque(maxlen=2)
+        self.event_system.publish_simple(EventType.DATA_LOADED, "old")
+        for _ in range(3):
+            self.event_system.publish_simple(EventType.DATA_CHANGED, "new")
+        
+        assert "old" not in self.event_system._history_by_source
+        assert EventType.DATA_LOADED not in self.event_system._history_by_type
+        assert len(self.event_system.get_event_history(source="new")) == 2
+    
+    def test_publish_batch(self):
+        """Test publishing a batch of events."""
+        self.event_system._event_history = deque(maxlen=2)
+        received = []
+        self.event_system.subscribe(EventType.ANALYSIS_PROGRESS, received.append)
+        
+        events = [Event(EventType.ANALYSIS_PROGRESS, "test", {"step": i}) for i in range(3)]
+        self.event_system.publish_batch(events)
+        
+        assert received == events
+        assert list(self.event_system._event_history) == events[-2:]
     
     def test_clear_history(self):
         """Test clearing event history."""
@@ -206,6 +560,306 @@ class TestEventSystem:
         
         assert callback not in self.event_system.get_subscribers(EventType.DATA_LOADED)
         assert callback not in self.event_system.get_subscribers(EventType.DATA_CHANGED)
+    
+    def test_publish_after_subscription_change(self):
+        """Test publishing sees subscribers added or removed since the last event."""
+        first = Mock()
+        second = Mock()
+        
+        self.event_system.subscribe(EventType.DATA_LOADED, first)
+        self.event_system.publish_simple(EventType.DATA_LOADED, "test")
+        
+        self.event_system.subscribe(EventType.DATA_LOADED, second)
+        self.event_system.unsubscribe(EventType.DATA_LOADED, first)
+        self.event_system.publish_simple(EventType.DATA_LOADED, "test")
+        
+        assert first.call_count == 1
+        assert second.call_count == 1
+    
+    def test_bound_method_subscriber_is_weak(self):
+        """Test bound-method subscribers do not keep their object alive."""
+        class Listener:
+            def __init__(self):
+                self.events = []
+            
+            def on_event(self, event):
+                self.events.append(event)
+        
+        listener = Listener()
+        self.event_system.subscribe(EventType.DATA_LOADED, listener.on_event)
+        self.event_system.publish_simple(EventType.DATA_LOADED, "test")
+        assert len(listener.events) == 1
+        
+        # A fresh bound method of the same object unsubscribes it
+        self.event_system.unsubscribe(EventType.DATA_LOADED, listener.on_event)
+        assert self.event_system.get_subscription_count(EventType.DATA_LOADED) == 0
+        
+        self.event_system.subscribe(EventType.DATA_LOADED, listener.on_event)
+        del listener
+        assert self.event_system.get_subscription_count(EventType.DATA_LOADED) == 0
+        self.event_system.publish_simple(EventType.DATA_LOADED, "test")
+    
+    def test_bound_method_of_slots_object_subscribes(self):
+        """Test methods of objects without weak reference support still subscribe."""
+        class Listener:
+            __slots__ = ("events",)
+            
+            def __init__(self):
+                self.events = []
+            
+            def on_event(self, event):
+                self.events.append(event)
+        
+        listener = Listener()
+        self.event_system.subscribe(EventType.DATA_LOADED, listener.on_event)
+        self.event_system.publish_simple(EventType.DATA_LOADED, "test")
+        assert len(listener.events) == 1
+        
+        self.event_system.unsubscribe(EventType.DATA_LOADED, listener.on_event)
+        assert self.event_system.get_subscription_count(EventType.DATA_LOADED) == 0
+
+
+_step_calls = []
+
+
+def _double_step(value, factor=2):
+    """Pipeline step recording its calls."""
+    _step_calls.append(value)
+    return {"doubled": value * factor}
+
+
+def _scale_step(value, factor):
+    """Pipeline step scaling its input."""
+    _step_calls.append(value)
+    return {"out": value * factor}
+
+
+def _inspect_step(value):
+    """Pipeline step that only reads its input."""
+    _step_calls.append(value)
+
+
+class TestPipelineManager:
+    """Test cases for PipelineManager."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.pipeline_manager = PipelineManager()
+        self.pipeline_manager.create_pipeline("test")
+    
+    def _add(self, name, dependencies=()):
+        step = PipelineStep(name, Mock(return_value={}), dependencies=list(dependencies))
+        self.pipeline_manager.add_step("test", step)
+        return step
+    
+    def test_resolve_dependencies(self):
+        """Test steps run after their dependencies, even when edited later."""
+        self._add("filter", ["load"])
+        self._add("load")
+        assert self.pipeline_manager._resolve_dependencies("test") == ["load", "filter"]
+        
+        step = self._add("ica")
+        assert self.pipeline_manager._resolve_dependencies("test") == ["load", "filter", "ica"]
+        
+        step.dependencies.append("filter")
+        self.pipeline_manager.get_pipeline_steps("test")[0].dependencies.append("ica")
+        with pytest.raises(ValueError):
+            self.pipeline_manager._resolve_dependencies("test")
+    
+    def test_execute_pipeline(self):
+        """Test executing a pipeline passes results between steps."""
+        self._add("load").function.return_value = {"raw": "data"}
+        filter_step = self._add("filter", ["load"])
+        
+        assert self.pipeline_manager.execute_pipeline("test", {"subject": 1})
+        filter_step.function.assert_called_once_with(subject=1, raw="data")
+    
+    def test_execute_pipeline_parallel(self):
+        """Test parallel execution runs steps after their dependencies."""
+        self._add("psd").function.return_value = {"psd": 1}
+        self._add("ica").function.return_value = {"ica": 2}
+        report = self._add("report", ["psd", "ica"])
+        failing = self._add("export", ["report"])
+        failing.function.side_effect = RuntimeError("disk full")
+        
+        assert not self.pipeline_manager.execute_pipeline("test", {}, parallel=True)
+        report.function.assert_called_once_with(psd=1, ica=2)
+        assert failing.error == "disk full"
+    
+    def test_parallel_runs_critical_path_first(self):
+        """Test ready steps with more dependents are started first."""
+        self.pipeline_manager.max_workers = 1
+        calls = []
+        for name, deps in [("log", []), ("load", []), ("filter", ["load"])]:
+            step = self._add(name, deps)
+            step.function.side_effect = lambda name=name, **kwargs: calls.append(name)
+        
+        assert self.pipeline_manager.execute_pipeline("test", {}, parallel=True)
+        assert calls[0] == "load"
+    
+    def test_step_signals_precede_pipeline_signal(self):
+        """Test queued step signals are all emitted before completion."""
+        self._add("load")
+        self._add("filter", ["load"])
+        emitted = []
+        self.pipeline_manager.step_completed.connect(lambda name, result: emitted.append(name))
+        self.pipeline_manager.pipeline_completed.connect(emitted.append)
+        
+        assert self.pipeline_manager.execute_pipeline("test", {}, parallel=True)
+        assert emitted == ["load", "filter", "test"]
+    
+    def test_serial_step_signals_emitted_as_steps_run(self):
+        """Test serial runs report each step before the next one starts."""
+        emitted = []
+        self.pipeline_manager.step_started.connect(emitted.append)
+        self.pipeline_manager.step_completed.connect(lambda name, result: emitted.append(name))
+        for name in ("load", "filter"):
+            step = PipelineStep(name, Mock(side_effect=lambda: emitted.append("run") or {}))
+            self.pipeline_manager.add_step("test", step)
+        
+        assert self.pipeline_manager.execute_pipeline("test", {})
+        assert emitted == ["load", "run", "load", "filter", "run", "filter"]
+    
+    def test_step_receives_only_named_arguments(self):
+        """Test steps are not passed pipeline data they do not accept."""
+        self.pipeline_manager.add_step(
+            "test", PipelineStep("double", _double_step, parameters={"factor": 3})
+        )
+        del _step_calls[:]
+        
+        assert self.pipeline_manager.execute_pipeline("test", {"value": 2, "raw": object()})
+        assert self.pipeline_manager.get_pipeline_result("test")["doubled"] == 6
+    
+    def test_step_result_cache(self, tmp_path):
+        """Test cached step results are reused for identical inputs."""
+        manager = PipelineManager(cache_dir=tmp_path)
+        manager.create_pipeline("test")
+        manager.add_step("test", PipelineStep("double", _double_step))
+        hits = []
+        manager.step_cache_hit.connect(hits.append)
+        del _step_calls[:]
+        
+        assert manager.execute_pipeline("test", {"value": 3})
+        assert manager.execute_pipeline("test", {"value": 3})
+        assert manager.get_pipeline_result("test")["doubled"] == 6
+        assert _step_calls == [3]
+        assert hits == ["double"]
+        
+        assert manager.execute_pipeline("test", {"value": 4})
+        assert _step_calls == [3, 4]
+    
+    def test_step_result_cache_partials(self, tmp_path):
+        """Test partials with different bound arguments do not share results."""
+        import functools
+        
+        manager = PipelineManager(cache_dir=tmp_path)
+        for name, factor in (("a", 2), ("b", 100)):
+            manager.create_pipeline(name)
+            manager.add_step(name, PipelineStep(
+                "scale", functools.partial(_scale_step, factor=factor)
+            ))
+        del _step_calls[:]
+        
+        assert manager.execute_pipeline("a", {"value": 5})
+        assert manager.execute_pipeline("b", {"value": 5})
+        assert manager.get_pipeline_result("a")["out"] == 10
+        assert manager.get_pipeline_result("b")["out"] == 500
+        assert _step_calls == [5, 5]
+        
+        step = PipelineStep("abs", functools.partial(abs))
+        assert (manager._result_cache_key(step, {})
+                != manager._result_cache_key(PipelineStep("abs", functools.partial(round)), {}))
+    
+    def test_result_cache_size_is_tracked(self, tmp_path):
+        """Test the cache directory is only scanned to measure it or prune it."""
+        manager = PipelineManager(cache_dir=tmp_path)
+        manager._store_cached_result("a", b"x" * 100)
+        
+        with patch.object(manager, "_scan_result_cache",
+                          wraps=manager._scan_result_cache) as scan:
+            manager._store_cached_result("b", b"x" * 100)
+            manager._store_cached_result("b", b"x" * 200)
+            scan.assert_not_called()
+            assert manager._cache_bytes == sum(
+                path.stat().st_size for path in tmp_path.glob("*.pkl")
+            )
+            
+            os.utime(tmp_path / "a.pkl", (0, 0))
+            manager.cache_max_bytes = manager._cache_bytes - 1
+            manager._store_cached_result("c", b"x")
+            scan.assert_called_once()
+        
+        assert not (tmp_path / "a.pkl").exists()
+        assert manager._cache_bytes <= manager.cache_max_bytes
+    
+    def test_cache_key_hashes_source_file(self, tmp_path):
+        """Test data unchanged since loading is fingerprinted by its file."""
+        core = _DataManagerCore()
+        path = tmp_path / "a_raw.fif"
+        path.write_bytes(b"samples")
+        data_obj = Mock(spec=["copy", "info", "get_data"], info={})
+        data_obj.get_data.return_value = b"samples"
+        with patch.object(core, "_load_data_by_extension", return_value=data_obj):
+            core.load_data(path)
+        manager = PipelineManager(cache_dir=tmp_path / "cache", data_manager=core)
+        step = PipelineStep("double", _double_step)
+        
+        assert core.find_source_file(data_obj) == path.absolute()
+        key = manager._result_cache_key(step, {"value": data_obj})
+        data_obj.get_data.assert_not_called()
+        
+        path.write_bytes(b"changed samples")
+        assert core.find_source_file(data_obj) is None
+        assert manager._result_cache_key(step, {"value": data_obj}) != key
+        data_obj.get_data.assert_called_once()
+    
+    def test_cache_key_sees_in_place_changes(self, tmp_path):
+        """Test changing samples in place misses the cache despite the file."""
+        mne = pytest.importorskip("mne")
+        import numpy as np
+        
+        core = _DataManagerCore()
+        path = tmp_path / "a_raw.fif"
+        path.write_bytes(b"samples")
+        raw = mne.io.RawArray(np.zeros((2, 100)), mne.create_info(2, 100.0, "eeg"),
+                              verbose=False)
+        with patch.object(core, "_load_data_by_extension", return_value=raw):
+            core.load_data(path)
+        manager = PipelineManager(cache_dir=tmp_path / "cache", data_manager=core)
+        step = PipelineStep("double", _double_step)
+        
+        key = manager._result_cache_key(step, {"value": raw})
+        raw._data[0, 0] = 1.0
+        assert manager._result_cache_key(step, {"value": raw}) != key
+    
+    def test_received_data_not_fingerprinted_by_file(self, tmp_path):
+        """Test data passed to an earlier step is fingerprinted by its samples."""
+        core = _DataManagerCore()
+        path = tmp_path / "a_raw.fif"
+        path.write_bytes(b"samples")
+        data_obj = Mock(spec=["copy", "info", "get_data"], info={})
+        data_obj.get_data.return_value = b"samples"
+        with patch.object(core, "_load_data_by_extension", return_value=data_obj):
+            core.load_data(path)
+        manager = PipelineManager(cache_dir=tmp_path / "cache", data_manager=core)
+        manager.create_pipeline("test")
+        manager.add_step("test", PipelineStep("first", _inspect_step))
+        manager.add_step("test", PipelineStep("second", _inspect_step))
+        
+        assert manager.execute_pipeline("test", {"value": data_obj})
+        # Only the second step, which may see changes made by the first
+        data_obj.get_data.assert_called_once()
+    
+    def test_execution_order_persists(self, tmp_path):
+        """Test execution orders are reused by a new manager with the same cache."""
+        for _ in range(2):
+            manager = PipelineManager(cache_dir=tmp_path)
+            manager.create_pipeline("test")
+            manager.add_step("test", PipelineStep("filter", Mock(), dependencies=["load"]))
+            manager.add_step("test", PipelineStep("load", Mock()))
+            assert manager._resolve_dependencies("test") == ["load", "filter"]
+        
+        assert len(list(tmp_path.glob("plan-*.pkl"))) == 1
 
 
 class TestSessionManager:
@@ -262,6 +916,144 @@ class TestSessionManager:
             
             # Verify the data manager methods were called
             self.data_manager.get_data_list.assert_called_once()
+    
+    def test_export_session_summary(self, tmp_path):
+        """Test the summary is valid JSON, including NumPy values."""
+        import numpy as np
+        
+        self.session_manager._session_metadata = {
+            'data_objects': ['raw'],
+            'ui_state': {'sfreq': np.float64(250.0), 'n_channels': np.int64(3)},
+        }
+        output_path = tmp_path / "summary.json"
+        
+        self.session_manager.export_session_summary(output_path)
+        
+        summary = json.loads(output_path.read_text())
+        assert summary['session_info']['data_objects'] == ['raw']
+        assert float(summary['session_info']['ui_state']['sfreq']) == 250.0
+    
+    def test_hdf5_session_roundtrip(self, tmp_path):
+        """Test data objects survive an HDF5 session save and load."""
+        mne = pytest.importorskip("mne")
+        import numpy as np
+        
+        info = mne.create_info(["EEG 001", "EEG 002"], 100.0, "eeg")
+        raw = mne.io.RawArray(np.random.RandomState(0).randn(2, 300), info, verbose=False)
+        raw.set_annotations(mne.Annotations([0.5], [0.2], ["blink"]))
+        events = np.array([[0, 0, 1], [100, 0, 2]])
+        epochs = mne.Epochs(raw, events, tmin=0, tmax=0.5, baseline=None,
+                            preload=True, verbose=False)
+        
+        data_manager = DataManager()
+        data_manager.add_data(raw, "raw")
+        data_manager.add_data(epochs, "epochs")
+        session_path = tmp_path / "session.h5"
+        self.session_manager.save_session(session_path, data_manager, ui_state={"tab": 1})
+        
+        # Unchanged data objects are kept as they are
+        assert self.session_manager.load_session(session_path, data_manager) == {"tab": 1}
+        assert data_manager.get_data("raw") is raw
+        
+        restored = DataManager()
+        self.session_manager.load_session(session_path, restored)
+        assert restored.get_data_list() == ["raw", "epochs"]
+        restored_raw = restored.get_data("raw")
+        np.testing.assert_array_equal(restored_raw.get_data(), raw.get_data())
+        assert list(restored_raw.annotations.description) == ["blink"]
+        restored_epochs = restored.get_data("epochs")
+        np.testing.assert_array_equal(restored_epochs.events, epochs.events)
+        np.testing.assert_array_equal(restored_epochs.get_data(), epochs.get_data())
+    
+    def test_hdf5_session_stores_evoked_without_pickle(self, tmp_path):
+        """Test an evoked object and dated annotations are stored as FIF and JSON."""
+        mne = pytest.importorskip("mne")
+        h5py = pytest.importorskip("h5py")
+        import numpy as np
+        from datetime import datetime, timezone
+        
+        info = mne.create_info(["EEG 001", "EEG 002"], 100.0, "eeg")
+        info.set_meas_date(datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc))
+        raw = mne.io.RawArray(np.random.RandomState(0).randn(2, 300), info,
+                              first_samp=10, verbose=False)
+        raw.set_annotations(mne.Annotations([1.0], [0.5], ["blink"],
+                                            orig_time=info["meas_date"]))
+        evoked = mne.EvokedArray(np.ones((2, 50)), info, tmin=-0.1, nave=7,
+                                 comment="mean", baseline=(None, 0.0), verbose=False)
+        data_manager = DataManager()
+        data_manager.add_data(raw, "raw")
+        data_manager.add_data(evoked, "evoked")
+        session_path = tmp_path / "session.h5"
+        self.session_manager.save_session(session_path, data_manager)
+        
+        with h5py.File(session_path, "r") as f:
+            extra = json.loads(f["data_objects/evoked/extra"][()])
+        assert extra["nave"] == 7
+        
+        restored = DataManager()
+        self.session_manager.load_session(session_path, restored)
+        restored_raw = restored.get_data("raw")
+        assert restored_raw.first_samp == 10
+        assert restored_raw.info["meas_date"] == info["meas_date"]
+        assert restored_raw.annotations.orig_time == raw.annotations.orig_time
+        np.testing.assert_allclose(restored_raw.annotations.onset, raw.annotations.onset)
+        restored_evoked = restored.get_data("evoked")
+        assert (restored_evoked.nave, restored_evoked.comment) == (7, "mean")
+        assert restored_evoked.baseline == evoked.baseline
+        np.testing.assert_allclose(restored_evoked.times, evoked.times)
+    
+    def test_hdf5_session_reuses_sample_digests(self, tmp_path):
+        """Test reloading a session only hashes data that may have changed."""
+        mne = pytest.importorskip("mne")
+        import numpy as np
+        from quicklab.core import session_manager as session_module
+        
+        info = mne.create_info(["EEG 001", "EEG 002"], 100.0, "eeg")
+        raw = mne.io.RawArray(np.random.RandomState(0).randn(2, 300), info, verbose=False)
+        data_manager = DataManager()
+        data_manager.add_data(raw, "raw")
+        session_path = tmp_path / "session.h5"
+        self.session_manager.save_session(session_path, data_manager)
+        
+        with patch.object(session_module, "_data_digest",
+                          wraps=session_module._data_digest) as digest:
+            self.session_manager.load_session(session_path, data_manager)
+            assert digest.call_count == 0
+            assert data_manager.get_data("raw") is raw
+            
+            raw.apply_function(lambda x: x * 0)
+            self.session_manager.load_session(session_path, data_manager)
+            assert digest.call_count == 1
+            assert data_manager.get_data("raw").get_data().any()
+            
+            data_manager.update_data("raw", raw.copy().crop(tmax=1.0))
+            self.session_manager.load_session(session_path, data_manager)
+            assert digest.call_count == 1
+    
+    @pytest.mark.parametrize("precision, rtol", [("fp16", 1e-3), ("bf16", 1e-2)])
+    def test_hdf5_session_reduced_precision(self, tmp_path, precision, rtol):
+        """Test samples saved at reduced precision load back approximately."""
+        mne = pytest.importorskip("mne")
+        import numpy as np
+        
+        info = mne.create_info(["EEG 001", "EEG 002", "EEG 003"], 100.0, "eeg")
+        samples = np.random.RandomState(0).randn(3, 300) * 1e-5
+        samples[2] = 0.0
+        data_manager = DataManager()
+        data_manager.add_data(mne.io.RawArray(samples, info, verbose=False), "raw")
+        session_path = tmp_path / "session.h5"
+        self.session_manager.save_session(session_path, data_manager,
+                                          save_precision=precision)
+        
+        restored = DataManager()
+        self.session_manager.load_session(session_path, restored)
+        restored_samples = restored.get_data("raw").get_data()
+        assert restored_samples.dtype == samples.dtype
+        np.testing.assert_allclose(restored_samples, samples, rtol=rtol, atol=1e-9)
+        
+        with pytest.raises(ValueError):
+            self.session_manager.save_session(session_path, data_manager,
+                                              save_precision="int8")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,72 @@
+"""Tests for QuickLab UI widgets."""
+
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication, QLabel, QMainWindow, QWidget
+
+from quicklab.ui.widgets.dock_manager import DockManager
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """Provide a QApplication for widget tests."""
+    return QApplication.instance() or QApplication([])
+
+
+class TestDockManager:
+    """Test cases for DockManager."""
+    
+    @pytest.fixture(autouse=True)
+    def setup_manager(self, qapp):
+        """Set up a main window with two docks."""
+        self.main_window = QMainWindow()
+        self.main_window.setCentralWidget(QWidget())
+        self.dock_manager = DockManager(self.main_window)
+        for dock_id in ("a", "b"):
+            self.dock_manager.add_dock(dock_id, QLabel, dock_id.upper())
+        self.main_window.show()
+        qapp.processEvents()
+        yield
+        self.main_window.close()
+    
+    def test_dock_state_roundtrip(self, qapp):
+        """Test a saved dock state is restored."""
+        self.dock_manager.set_dock_visible("b", False)
+        state = self.dock_manager.save_dock_state()
+        
+        self.dock_manager.set_dock_visible("b", True)
+        self.dock_manager.restore_dock_state(state)
+        qapp.processEvents()
+        
+        assert set(state) == {"blob"}
+        assert not self.dock_manager.is_dock_visible("b")
+    
+    def test_restore_legacy_dock_state(self, qapp):
+        """Test a state saved in the previous hex format is restored."""
+        self.dock_manager.set_dock_visible("b", False)
+        state = {
+            "_window_state": self.main_window.saveState().data().hex(),
+            "a": {"visible": True, "floating": False, "geometry": None},
+            "b": {"visible": False, "floating": False, "geometry": None},
+        }
+        self.dock_manager.set_dock_visible("b", True)
+        
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(self.dock_manager, "reset_dock_layout",
+                       lambda: pytest.fail("layout was reset"))
+            self.dock_manager.restore_dock_state(state)
+        qapp.processEvents()
+        
+        assert not self.dock_manager.is_dock_visible("b")
+    
+    def test_restore_corrupt_dock_state_resets_layout(self, qapp):
+        """Test a corrupt state falls back to the default layout."""
+        self.dock_manager.set_dock_visible("b", False)
+        self.dock_manager.restore_dock_state({"blob": "not base64!"})
+        qapp.processEvents()
+        
+        assert self.dock_manager.is_dock_visible("b")